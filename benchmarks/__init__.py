@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the DANY pipeline.
+
+    python -m benchmarks.run_benchmarks run --suite default --output benchmarks/baselines/local.json
+    python -m benchmarks.run_benchmarks compare benchmarks/baselines/local.json current.json
+"""
@@ -0,0 +1,279 @@
+# run_benchmarks.py
+"""
+Benchmark runner for run_dany_pipeline.
+
+`run` times every pipeline stage (median over repeats) plus a separate
+memory-tracked pass for per-stage peak allocations. It writes the result
+as a JSON baseline. `compare` checks a new result against a baseline and
+exits non-zero when a stage got slower or heavier than the threshold
+allows.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from benchmarks.datasets import TARGET_COL, DatasetSpec, make_dataset
+
+# Relative slowdown that counts as a regression
+DEFAULT_THRESHOLD = 0.20
+
+# Differences below these floors are treated as noise
+MIN_DELTA_SEC = 0.05
+MIN_DELTA_BYTES = 4 * 1024 * 1024
+
+
+@dataclass
+class Scenario:
+    name: str
+    dataset: DatasetSpec = field(default_factory=DatasetSpec)
+
+
+SUITES = {
+    "smoke": [
+        Scenario("small", DatasetSpec(rows=2_000)),
+    ],
+    "default": [
+        Scenario("baseline_10k", DatasetSpec(rows=10_000)),
+        Scenario("wide_10k", DatasetSpec(rows=10_000, numeric_cols=60, categorical_cols=12)),
+        Scenario("high_cardinality_20k", DatasetSpec(rows=20_000, cardinality=5_000)),
+        Scenario("imbalanced_50k", DatasetSpec(rows=50_000, positive_rate=0.02)),
+        Scenario("missing_heavy_20k", DatasetSpec(rows=20_000, missing_rate=0.30)),
+        Scenario("regression_50k", DatasetSpec(rows=50_000, task_type="regression")),
+        Scenario("tall_150k", DatasetSpec(rows=150_000)),
+    ],
+}
+
+
+# =========================================================
+# Run
+# =========================================================
+
+def run_scenario(scenario: Scenario, repeats: int = 3, track_memory: bool = True) -> dict:
+    from dany_core.runner import run_dany_pipeline
+    from dany_core.targets.target_spec import TargetSpec
+
+    df = make_dataset(scenario.dataset)
+    target_spec = TargetSpec(
+        name=TARGET_COL,
+        task_type=scenario.dataset.task_type,
+        description="Synthetic benchmark target",
+        allowed_null_ratio=0.05,
+    )
+
+    runs = [run_dany_pipeline(df, target_spec) for _ in range(repeats)]
+
+    # Timings of a failed or cut-short run are not comparable: fail the scenario
+    failed = [r for r in runs if r.get("status") != "completed"]
+    if failed:
+        return {
+            "params": scenario.dataset.to_dict(),
+            "status": "failed",
+            "repeats": repeats,
+            "error": f"{len(failed)}/{repeats} runs did not complete: "
+                     f"{failed[0].get('status')} ({failed[0].get('error') or failed[0].get('reason')})",
+        }
+
+    stage_times = {}
+    for r in runs:
+        for stage, seconds in r.get("timing", {}).get("stages", {}).items():
+            stage_times.setdefault(stage, []).append(seconds)
+
+    result = {
+        "params": scenario.dataset.to_dict(),
+        "status": "completed",
+        "repeats": repeats,
+        "stages": {stage: round(statistics.median(t), 4) for stage, t in stage_times.items()},
+        "total_time_sec": round(statistics.median(
+            r.get("timing", {}).get("total_time_sec", 0.0) for r in runs
+        ), 4),
+        # Stages overlap, so end-to-end latency is below the stage sum
+        "elapsed_sec": round(statistics.median(
+            r.get("timing", {}).get("elapsed_sec", 0.0) for r in runs
+        ), 4),
+    }
+    result["rows_per_sec"] = (
+        round(len(df) / result["elapsed_sec"], 2) if result["elapsed_sec"] > 0 else None
+    )
+
+    # tracemalloc slows allocation-heavy code, so memory gets its own pass
+    if track_memory:
+        timing = run_dany_pipeline(df, target_spec, track_memory=True).get("timing", {})
+        result["peak_bytes"] = {
+            stage: m["peak_bytes"] for stage, m in timing.get("memory", {}).items()
+        }
+        result["max_rss_bytes"] = max(
+            (d.get("max_rss_bytes") or 0 for d in timing.get("details", {}).values()),
+            default=None,
+        )
+
+    return result
+
+
+def run_suite(suite: str = "default", repeats: int = 3, track_memory: bool = True) -> dict:
+    scenarios = {}
+    for scenario in SUITES[suite]:
+        print(f"[benchmark] {scenario.name} ...", file=sys.stderr)
+        scenarios[scenario.name] = run_scenario(scenario, repeats, track_memory)
+
+    return {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment_info(),
+        "scenarios": scenarios,
+    }
+
+
+def environment_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+# =========================================================
+# Compare
+# =========================================================
+
+def compare_results(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta_sec: float = MIN_DELTA_SEC,
+    min_delta_bytes: int = MIN_DELTA_BYTES,
+) -> list[dict]:
+    """
+    One row per (scenario, metric) present in both results. A row is a
+    regression when the current value exceeds the baseline by more than
+    `threshold` (relative) and by more than the absolute noise floor.
+    A scenario that failed in `current` is one "status" regression row.
+    """
+    rows = []
+
+    for name, base in baseline.get("scenarios", {}).items():
+        cur = current.get("scenarios", {}).get(name)
+        if cur is None:
+            continue
+
+        if cur.get("status", "completed") != "completed":
+            rows.append({
+                "scenario": name,
+                "metric": "status",
+                "baseline": base.get("status", "completed"),
+                "current": cur.get("status"),
+                "ratio": None,
+                "regression": True,
+            })
+            continue
+
+        metrics = [
+            (metric, base.get(metric), cur.get(metric), min_delta_sec)
+            for metric in ("total_time_sec", "elapsed_sec")
+        ]
+        metrics += [
+            (f"stages.{stage}", seconds, cur.get("stages", {}).get(stage), min_delta_sec)
+            for stage, seconds in base.get("stages", {}).items()
+        ]
+        metrics += [
+            (f"peak_bytes.{stage}", peak, cur.get("peak_bytes", {}).get(stage), min_delta_bytes)
+            for stage, peak in base.get("peak_bytes", {}).items()
+        ]
+
+        for metric, before, after, floor in metrics:
+            if before is None or after is None:
+                continue
+
+            ratio = after / before if before else None
+            rows.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "ratio": round(ratio, 3) if ratio is not None else None,
+                "regression": after - before > floor and after > before * (1 + threshold),
+            })
+
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = [f"{'scenario':<24} {'metric':<32} {'baseline':>14} {'current':>14} {'ratio':>7}"]
+    for r in rows:
+        flag = "  REGRESSION" if r["regression"] else ""
+        ratio = f"{r['ratio']:.2f}" if r["ratio"] is not None else "-"
+        lines.append(
+            f"{r['scenario']:<24} {r['metric']:<32} {r['baseline']:>14} {r['current']:>14} {ratio:>7}{flag}"
+        )
+    return "\n".join(lines)
+
+
+# =========================================================
+# CLI
+# =========================================================
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _save(result: dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the DANY pipeline")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run a suite and write a JSON result")
+    run_p.add_argument("--suite", choices=sorted(SUITES), default="default")
+    run_p.add_argument("--repeats", type=int, default=3)
+    run_p.add_argument("--no-memory", action="store_true", help="skip the memory-tracked pass")
+    run_p.add_argument("--output", default="benchmarks/results/latest.json")
+    run_p.add_argument("--baseline", help="compare against this baseline after running")
+    run_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    cmp_p = sub.add_parser("compare", help="compare a result against a baseline")
+    cmp_p.add_argument("baseline")
+    cmp_p.add_argument("current")
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run_suite(args.suite, args.repeats, track_memory=not args.no_memory)
+        _save(current, args.output)
+        print(f"Wrote {args.output}")
+        failed = [name for name, r in current["scenarios"].items() if r["status"] != "completed"]
+        for name in failed:
+            print(f"Scenario {name} failed: {current['scenarios'][name]['error']}", file=sys.stderr)
+        if not args.baseline:
+            return 1 if failed else 0
+        baseline = _load(args.baseline)
+    else:
+        baseline, current = _load(args.baseline), _load(args.current)
+
+    rows = compare_results(baseline, current, threshold=args.threshold)
+    print(format_comparison(rows))
+
+    regressions = [r for r in rows if r["regression"]]
+    print(f"\n{len(regressions)} regression(s) over {len(rows)} metrics (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@
 
 
 import streamlit as st
-import pandas as pd
+from dany_core.ingestion import read_table
 from dany_core.runner import run_dany
 
 st.title("Dany – Day 1 Demo")
@@ -13,7 +13,7 @@ st.title("Dany – Day 1 Demo")
 uploaded_file = st.file_uploader("Upload CSV", type=["csv"])
 
 if uploaded_file is not None:
-    df = pd.read_csv(uploaded_file)
+    df = read_table(uploaded_file)
 
     # 2️⃣ Select target column
     target_col = st.selectbox("Select target column", df.columns)
@@ -0,0 +1,251 @@
+# batch.py
+"""
+Batch runner for many (dataset, TargetSpec) jobs.
+
+Jobs on the same dataset form a group that runs in one worker process:
+the dataset is loaded once, and its runs share an in-memory stage
+cache. Target-independent stages (cleaning, data report, feature
+profiles) are therefore computed once per dataset. Only those stages
+are kept, so the group's memory does not grow with its targets.
+
+Groups are spread over a process pool. A group is admitted only while
+the estimated memory of the running groups stays within the budget
+(default: a share of the memory available at start). A group that does
+not fit waits, and smaller ones may go first.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+import pandas as pd
+
+from dany_core.cache import MemoryStageCache, StageCache
+from dany_core.dtypes import memory_usage_bytes
+from dany_core.ingestion import read_table
+from dany_core.modeling import _resolve_core_budget
+
+# Peak working memory of a run, as a multiple of its dataset's size
+# (compacted copy, cleaned frame, preprocessing matrices, model fits)
+MEMORY_MULTIPLIER = 8
+
+# In-memory size of a dataset file, as a multiple of its size on disk
+FILE_EXPANSION = 2
+
+# Share of the memory available at start that the batch plans for
+MEMORY_BUDGET_FRACTION = 0.7
+
+# Stages a group's in-memory cache keeps: those that do not depend on
+# the target (per-target results would pile up for the whole group)
+SHARED_STAGES = ("cleaning", "data_report", "feature_profiles")
+
+
+@dataclass
+class BatchJob:
+    dataset: Any  # DataFrame or CSV / Parquet / Feather path
+    target_spec: Any
+    job_id: str | None = None
+
+
+def run_batch(
+    jobs,
+    n_workers: int | None = -1,
+    memory_budget_bytes: int | None = None,
+    cache_dir: str | None = None,
+) -> dict:
+    """
+    Run every job and return {job_id: run_dany_pipeline results}, in job
+    order. `jobs` holds BatchJob objects or (dataset, target_spec) pairs.
+
+    n_workers follows the sklearn convention (-1 = all cores); the
+    cores are split evenly between concurrent groups. With `cache_dir`
+    the groups use that StageCache instead, so results also carry over
+    to later batches. Each result gains a "batch" entry describing its
+    group.
+    """
+    jobs = _normalize_jobs(jobs)
+    groups = _group_jobs(jobs)
+
+    cpu_count = os.cpu_count() or 1
+    # No more workers than groups
+    workers = max(1, min(_resolve_core_budget(n_workers), len(groups)))
+    if memory_budget_bytes is None:
+        available = _available_memory_bytes()
+        memory_budget_bytes = int(available * MEMORY_BUDGET_FRACTION) if available else None
+
+    results = {}
+
+    if workers == 1:
+        for group in groups:
+            results.update(_run_group(group["dataset"], group["targets"], cache_dir))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(max(1, cpu_count // workers),),
+        ) as executor:
+            results = _schedule(executor, groups, workers, memory_budget_bytes, cache_dir)
+
+    for group in groups:
+        for job_id, _ in group["targets"]:
+            results[job_id]["batch"] = {
+                "dataset": group["label"],
+                "jobs_on_dataset": len(group["targets"]),
+                "memory_estimate_bytes": group["memory_estimate"],
+            }
+
+    return {job.job_id: results[job.job_id] for job in jobs}
+
+
+def _schedule(executor, groups, workers, budget, cache_dir) -> dict:
+    pending = list(groups)
+    running = {}  # future -> (group, memory estimate)
+    results = {}
+
+    while pending or running:
+        in_use = sum(estimate for _, estimate in running.values())
+
+        # First fit in job order; with nothing running, the next group is
+        # admitted whatever its size so oversized groups still run.
+        for group in list(pending):
+            if len(running) >= workers:
+                break
+            fits = budget is None or in_use + group["memory_estimate"] <= budget
+            if fits or not running:
+                pending.remove(group)
+                try:
+                    future = executor.submit(_run_group, group["dataset"], group["targets"], cache_dir)
+                except Exception as e:  # the pool broke earlier
+                    results.update(_error_results(group["targets"], f"Batch worker failed: {e!r}"))
+                    continue
+                running[future] = (group, group["memory_estimate"])
+                in_use += group["memory_estimate"]
+
+        if not running:
+            continue
+        done, _ = wait(running, return_when=FIRST_COMPLETED)
+        for future in done:
+            group, _ = running.pop(future)
+            try:
+                results.update(future.result())
+            except Exception as e:
+                # e.g. a crashed worker or results that fail to pickle:
+                # only this group's jobs fail
+                results.update(_error_results(group["targets"], f"Batch worker failed: {e!r}"))
+
+    return results
+
+
+# =========================================================
+# Workers (module level so they can be pickled)
+# =========================================================
+
+def _init_worker(cores: int) -> None:
+    # Concurrent groups split the machine instead of each using every core
+    from dany_core import runner
+
+    runner.MODELING_N_JOBS = cores
+    runner.EDA_N_JOBS = cores
+
+
+def _run_group(dataset, targets, cache_dir) -> dict:
+    """
+    Load `dataset` once and run each (job_id, target_spec) on it with a
+    shared stage cache.
+    """
+    from dany_core.runner import run_dany_pipeline
+
+    cache = StageCache(cache_dir) if cache_dir else MemoryStageCache(stages=SHARED_STAGES)
+    out = {}
+
+    try:
+        df = read_table(dataset) if isinstance(dataset, (str, os.PathLike)) else dataset
+    except Exception as e:
+        return _error_results(targets, f"Failed to load dataset: {e}")
+
+    for job_id, target_spec in targets:
+        out[job_id] = run_dany_pipeline(df, target_spec, cache=cache)
+
+    return out
+
+
+# =========================================================
+# Helpers
+# =========================================================
+
+def _error_results(targets, message: str) -> dict:
+    return {job_id: {"status": "error", "error": message} for job_id, _ in targets}
+
+
+def _normalize_jobs(jobs) -> list:
+    normalized = []
+    seen = {}
+    labels = {}
+
+    for job in jobs:
+        if not isinstance(job, BatchJob):
+            job = BatchJob(*job)
+
+        key = _dataset_key(job.dataset)
+        label = labels.setdefault(key, _dataset_label(job.dataset, len(labels)))
+        job_id = job.job_id or f"{label}:{job.target_spec.name}"
+        if job_id in seen:
+            seen[job_id] += 1
+            job_id = f"{job_id}#{seen[job_id]}"
+        else:
+            seen[job_id] = 0
+
+        normalized.append(BatchJob(job.dataset, job.target_spec, job_id))
+
+    return normalized
+
+
+def _group_jobs(jobs: list) -> list:
+    groups = {}
+
+    for job in jobs:
+        key = _dataset_key(job.dataset)
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = {
+                "dataset": job.dataset,
+                "label": _dataset_label(job.dataset, len(groups)),
+                "targets": [],
+                "memory_estimate": _memory_estimate(job.dataset),
+            }
+        group["targets"].append((job.job_id, job.target_spec))
+
+    return list(groups.values())
+
+
+def _dataset_key(dataset) -> tuple:
+    # Paths group by name, frames by identity (fingerprinting every frame
+    # would cost a full pass over it)
+    if isinstance(dataset, (str, os.PathLike)):
+        return ("path", os.path.abspath(os.fspath(dataset)))
+    return ("frame", id(dataset))
+
+
+def _dataset_label(dataset, index: int) -> str:
+    if isinstance(dataset, (str, os.PathLike)):
+        return os.path.basename(os.fspath(dataset))
+    return f"frame{index}"
+
+
+def _memory_estimate(dataset) -> int:
+    if isinstance(dataset, pd.DataFrame):
+        size = memory_usage_bytes(dataset)
+    else:
+        try:
+            size = os.path.getsize(dataset) * FILE_EXPANSION
+        except OSError:
+            size = 0
+    return int(size * MEMORY_MULTIPLIER)
+
+
+def _available_memory_bytes() -> int | None:
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):  # not POSIX / not reported
+        return None
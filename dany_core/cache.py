@@ -0,0 +1,208 @@
+# cache.py
+"""
+Content-addressed on-disk cache for pipeline stage outputs.
+
+Entries are keyed by a dataframe fingerprint, the stage parameters and
+the source of the code that produced them, so a cached result is reused
+only when all three are unchanged. Old entries are evicted LRU-first
+once the cache grows past its size budget.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+from collections import OrderedDict
+from functools import lru_cache
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = ".dany_cache"
+DEFAULT_MAX_BYTES = 1 * 1024 ** 3  # 1 GiB
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Fast content hash of a dataframe (values, index, column names and
+    dtypes).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode())
+    digest.update(f"{len(df)}|{df.index.dtype}".encode())
+
+    if len(df):
+        # Stage outputs can carry the index, so it is part of the content
+        row_hashes = pd.util.hash_pandas_object(df, index=True)
+        digest.update(row_hashes.to_numpy().tobytes())
+
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _module_digest(module_name: str) -> str:
+    module = sys.modules.get(module_name)
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        return "unknown"
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+def code_version(*objects) -> str:
+    """
+    Version tag derived from the source of the modules defining `objects`.
+    Editing any of those modules invalidates the related cache entries.
+    """
+    modules = sorted({obj.__module__ for obj in objects})
+    return "-".join(_module_digest(name) for name in modules)
+
+
+class StageCache:
+    """
+    Pickle-based stage cache stored under `root`, bounded by `max_bytes`.
+    Only point it at a directory you trust: entries are unpickled on read.
+    """
+
+    def __init__(self, root: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def make_key(stage: str, fingerprint: str, params: dict | None = None, version: str = "") -> str:
+        payload = json.dumps(
+            {
+                "stage": stage,
+                "fingerprint": fingerprint,
+                "params": params or {},
+                "version": version,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return f"{stage}-{hashlib.sha256(payload.encode()).hexdigest()[:32]}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.pkl")
+
+    def get(self, key: str):
+        """
+        Returns (hit, value). A hit refreshes the entry's LRU timestamp.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+
+        os.utime(path)
+        return True, value
+
+    def put(self, key: str, value) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def get_or_compute(self, key: str, compute):
+        """
+        Returns (value, hit).
+        """
+        hit, value = self.get(key)
+        if hit:
+            return value, True
+
+        value = compute()
+        self.put(key, value)
+        return value, False
+
+    def evict(self) -> None:
+        """
+        Drop least recently used entries until the cache fits max_bytes.
+        """
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(".pkl"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.root, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.root, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self.root):
+            if name.endswith(".pkl"):
+                os.remove(os.path.join(self.root, name))
+
+    def subcache(self, name: str, max_bytes: int) -> "StageCache":
+        """
+        Separate cache under `root/name` with its own size budget, for
+        intermediate values that should not evict stage outputs.
+        """
+        return StageCache(os.path.join(self.root, name), max_bytes)
+
+
+class MemoryStageCache(StageCache):
+    """
+    StageCache kept in process memory, for runs that share work within
+    one process (e.g. many targets on one table). Values are neither
+    pickled nor copied, so callers must treat them as read-only. The
+    least recently used entries go once there are more than `max_entries`.
+    With `stages`, only entries of those stages are stored.
+    """
+
+    def __init__(self, max_entries: int = 256, stages: tuple | None = None):
+        self.max_entries = max_entries
+        self.stages = stages
+        self.entries = OrderedDict()
+        self.subcaches: dict = {}
+
+    def get(self, key: str):
+        if key not in self.entries:
+            return False, None
+        self.entries.move_to_end(key)
+        return True, self.entries[key]
+
+    def put(self, key: str, value) -> None:
+        # Keys start with the stage name (see make_key)
+        if self.stages is not None and key.split("-", 1)[0] not in self.stages:
+            return
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        self.evict()
+
+    def evict(self) -> None:
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.subcaches.clear()
+
+    def subcache(self, name: str, max_bytes: int) -> "MemoryStageCache":
+        # Bounded by entries, not bytes; the stage filter carries over
+        if name not in self.subcaches:
+            self.subcaches[name] = MemoryStageCache(self.max_entries, self.stages)
+        return self.subcaches[name]
@@ -0,0 +1,232 @@
+# dag.py
+"""
+Stage DAG executor for the pipeline.
+
+A Stage declares the named values it reads (inputs) and produces
+(outputs), plus stages it must merely follow (after). StageGraph checks
+the graph once (one producer per value, known inputs, no cycles) and runs
+it on a thread pool. A stage starts as soon as its inputs exist, so a run
+takes as long as its critical path instead of the sum of its stages.
+
+Stages are timed as top-level StageTimer spans in their worker thread,
+and can emit intermediate events (e.g. each scored model) while running.
+Long stages can watch a cancel event to stop early.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[..., Any]
+    # Values passed to func as keyword arguments
+    inputs: tuple = ()
+    # Values produced: func returns one value, or a tuple for several
+    outputs: tuple = ()
+    # Stages that must finish first without passing a value
+    after: tuple = ()
+    # Input whose len() is recorded as the span's rows
+    rows: str | None = None
+    # func also takes `emit`, a callback for intermediate events
+    emits: bool = False
+    # func also takes `cancel`, a threading.Event set when the run stops
+    cancellable: bool = False
+    # Wrap the stage in a timer span
+    timed: bool = True
+
+
+class StageGraph:
+    """
+    Validated set of stages; `iter_run` / `run` execute it.
+    """
+
+    def __init__(self, stages: list[Stage]):
+        self.stages = {}
+        self.producers = {}
+
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage '{stage.name}'")
+            self.stages[stage.name] = stage
+
+            for output in stage.outputs:
+                if output in self.producers:
+                    raise ValueError(
+                        f"'{output}' is produced by both '{self.producers[output]}' and '{stage.name}'"
+                    )
+                self.producers[output] = stage.name
+
+        for stage in stages:
+            unknown = [name for name in stage.after if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' runs after unknown stages {unknown}")
+
+        self.order = self._topological_order()
+
+    @property
+    def external_inputs(self) -> set:
+        """
+        Inputs no stage produces; they must be passed to run().
+        """
+        return {
+            name for stage in self.stages.values() for name in stage.inputs
+            if name not in self.producers
+        }
+
+    def dependencies(self, name: str) -> set:
+        stage = self.stages[name]
+        return {
+            self.producers[value] for value in stage.inputs if value in self.producers
+        } | set(stage.after)
+
+    def _topological_order(self) -> list:
+        order = []
+        state = {}  # name -> "visiting" / "done"
+
+        def visit(name, path):
+            if state.get(name) == "done":
+                return
+            if state.get(name) == "visiting":
+                raise ValueError(f"Stage graph has a cycle: {' -> '.join(path + [name])}")
+
+            state[name] = "visiting"
+            for dep in sorted(self.dependencies(name)):
+                visit(dep, path + [name])
+            state[name] = "done"
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [])
+        return order
+
+    # -----------------------------
+    # Execution
+    # -----------------------------
+    def iter_run(
+        self,
+        values: dict,
+        timer=None,
+        max_workers: int | None = None,
+        cancel: threading.Event | None = None,
+    ) -> Iterator[dict]:
+        """
+        Run the graph, yielding {"stage", "outputs"} as each stage
+        finishes and {"stage", "event"} for what stages emit. `values`
+        holds the external inputs and receives every output.
+
+        Dependents are scheduled only after the consumer resumes, so
+        closing the generator on a finished stage's event keeps its
+        dependents from starting. A failing stage stops the run and its
+        error is raised here. On either early exit, stages not yet
+        started are dropped, `cancel` is set for the cancellable ones
+        still running, and the exit waits for them: nothing keeps
+        running (or recording spans) after the generator is done.
+        Setting `cancel` from outside stops the cancellable stages too.
+        """
+        missing = self.external_inputs - set(values)
+        if missing:
+            raise ValueError(f"Missing graph inputs: {sorted(missing)}")
+
+        cancel = cancel or threading.Event()
+        events = queue.Queue()
+        completed = set()
+        started = set()
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.stages) or 1,
+            thread_name_prefix="dany-stage",
+        )
+
+        def submit_ready():
+            for name in self.order:
+                if name not in started and self.dependencies(name) <= completed:
+                    started.add(name)
+                    stage = self.stages[name]
+                    kwargs = {value: values[value] for value in stage.inputs}
+                    if stage.cancellable:
+                        kwargs["cancel"] = cancel
+                    executor.submit(_execute, stage, kwargs, timer, events)
+
+        try:
+            submit_ready()
+            while len(completed) < len(started):
+                kind, name, payload = events.get()
+
+                if kind == "event":
+                    yield {"stage": name, "event": payload}
+                    continue
+                if kind == "error":
+                    raise payload
+
+                values.update(payload)
+                completed.add(name)
+                yield {"stage": name, "outputs": payload}
+                submit_ready()
+        finally:
+            # Nothing is running any more unless the run stopped early
+            if len(completed) < len(started):
+                cancel.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def run(
+        self,
+        values: dict,
+        timer=None,
+        max_workers: int | None = None,
+        cancel: threading.Event | None = None,
+    ) -> dict:
+        for _ in self.iter_run(values, timer, max_workers, cancel):
+            pass
+        return values
+
+    def critical_path(self, durations: dict) -> dict:
+        """
+        Longest chain of dependent stages given per-stage seconds
+        (e.g. StageTimer.summary()["stages"]); stages without a duration
+        count as zero.
+        """
+        finish = {}
+        previous = {}
+        for name in self.order:
+            deps = self.dependencies(name)
+            before = max(deps, key=lambda d: finish[d], default=None)
+            previous[name] = before
+            finish[name] = (finish[before] if before else 0.0) + durations.get(name, 0.0)
+
+        if not finish:
+            return {"stages": [], "seconds": 0.0}
+
+        # On ties, prefer the stage furthest downstream
+        name = max(reversed(self.order), key=finish.get)
+        seconds = finish[name]
+        path = []
+        while name is not None:
+            path.append(name)
+            name = previous[name]
+
+        return {"stages": path[::-1], "seconds": round(seconds, 4)}
+
+
+def _execute(stage: Stage, kwargs: dict, timer, events: queue.Queue) -> None:
+    try:
+        if stage.emits:
+            kwargs["emit"] = lambda event: events.put(("event", stage.name, event))
+
+        if timer is not None and stage.timed:
+            rows = len(kwargs[stage.rows]) if stage.rows else None
+            with timer.span(stage.name, rows=rows):
+                result = stage.func(**kwargs)
+        else:
+            result = stage.func(**kwargs)
+
+        if len(stage.outputs) == 1:
+            result = (result,)
+        outputs = dict(zip(stage.outputs, result)) if stage.outputs else {}
+        events.put(("done", stage.name, outputs))
+
+    except BaseException as e:
+        events.put(("error", stage.name, e))
@@ -0,0 +1,78 @@
+# dtypes.py
+"""
+Dtype helpers shared by the EDA, modeling and report stages.
+
+Columns are classified by kind rather than exact dtype, so compact
+representations (int8/16/32, float32, nullable integers, `category`,
+pandas and Arrow strings) are handled the same as int64/float64/object.
+"""
+
+import numpy as np
+import pandas as pd
+
+CATEGORICAL_KINDS = ["object", "category", "string"]
+
+
+def numeric_columns(df: pd.DataFrame, include_bool: bool = False) -> list:
+    include = ["number", "bool"] if include_bool else ["number"]
+    return df.select_dtypes(include=include).columns.tolist()
+
+
+def categorical_columns(df: pd.DataFrame) -> list:
+    return df.select_dtypes(include=CATEGORICAL_KINDS).columns.tolist()
+
+
+def is_categorical_kind(dtype) -> bool:
+    return (
+        pd.api.types.is_object_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+        or pd.api.types.is_string_dtype(dtype)
+    )
+
+
+def as_object_array(X) -> np.ndarray:
+    """
+    Object ndarray with missing values as np.nan. Used in front of
+    OneHotEncoder, which rejects pd.NA from string / Arrow columns.
+    """
+    if isinstance(X, pd.DataFrame):
+        values = X.astype(object)
+        return values.where(values.notna(), np.nan).to_numpy()
+    return np.asarray(X, dtype=object)
+
+
+def as_hash_tokens(X) -> list:
+    """
+    One list of "column=value" strings per row, as FeatureHasher expects
+    them. Missing values hash to their own token per column.
+    """
+    if isinstance(X, pd.DataFrame):
+        names, values = list(X.columns), as_object_array(X)
+    else:
+        values = np.asarray(X, dtype=object)
+        names = list(range(values.shape[1]))
+
+    tokens = np.empty(values.shape, dtype=object)
+    for j, name in enumerate(names):
+        tokens[:, j] = [f"{name}={value}" for value in values[:, j]]
+    return tokens.tolist()
+
+
+def memory_usage_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=False, deep=True).sum())
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> dict:
+    before_bytes = memory_usage_bytes(before)
+    after_bytes = memory_usage_bytes(after)
+
+    return {
+        "before_bytes": before_bytes,
+        "after_bytes": after_bytes,
+        "reduction_ratio": round(before_bytes / after_bytes, 2) if after_bytes else None,
+        "dtypes_changed": {
+            str(col): f"{before[col].dtype} -> {after[col].dtype}"
+            for col in before.columns
+            if col in after.columns and before[col].dtype != after[col].dtype
+        },
+    }
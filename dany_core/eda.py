@@ -8,51 +8,193 @@ import pandas as pd
 import numpy as np
 from scipy.stats import skew
 
+from dany_core.dtypes import categorical_columns, is_categorical_kind, numeric_columns
+from dany_core.sketches import FrequentItemsSketch, HyperLogLog, MomentSketch
+
+# Rows converted to float64 at a time; bounds the temporary copies made
+# while profiling wide frames.
+BLOCK_ROWS = 65_536
+
+
+class NumericalProfileState:
+    """
+    Mergeable profile state for numerical columns.
+    One vectorized pass per block of rows for all columns at once; partial
+    states from chunks or worker processes can be combined with `merge`.
+    """
+
+    def __init__(self, hll_precision: int = 14):
+        self.hll_precision = hll_precision
+        self.moments = MomentSketch()
+        self.distinct: dict = {}
+
+    def update(self, df: pd.DataFrame, exclude=()) -> "NumericalProfileState":
+        num_cols = [col for col in numeric_columns(df) if col not in exclude]
+        if not num_cols:
+            return self
+
+        positions = [df.columns.get_loc(col) for col in num_cols]
+
+        for start in range(0, len(df), BLOCK_ROWS):
+            # Only the current block of rows is converted to float64.
+            block = df.iloc[start:start + BLOCK_ROWS, positions]
+            self._update_block(block.to_numpy(dtype=np.float64, na_value=np.nan), num_cols)
+
+        return self
+
+    def update_values(self, values: np.ndarray, columns) -> "NumericalProfileState":
+        """
+        Same as `update` for a 2-D float64 array (rows x columns, NaN =
+        missing), e.g. a view on shared memory.
+        """
+        columns = list(columns)
+        for start in range(0, len(values), BLOCK_ROWS):
+            self._update_block(values[start:start + BLOCK_ROWS], columns)
+        return self
+
+    def _update_block(self, values: np.ndarray, columns: list) -> None:
+        self.moments.update(values, columns)
+
+        for i, col in enumerate(columns):
+            column = values[:, i]
+            sketch = self.distinct.setdefault(col, HyperLogLog(self.hll_precision))
+            sketch.update(column[~np.isnan(column)])
+
+    def merge(self, other: "NumericalProfileState") -> "NumericalProfileState":
+        self.moments.merge(other.moments)
+        for col, sketch in other.distinct.items():
+            if col in self.distinct:
+                self.distinct[col].merge(sketch)
+            else:
+                self.distinct[col] = HyperLogLog(sketch.precision).merge(sketch)
+        return self
+
+    def to_profiles(self, exclude=()) -> dict:
+        m = self.moments
+        std = m.std(ddof=1)
+        skewness = m.skewness()
+
+        profiles = {}
+        for i, col in enumerate(m.columns):
+            count = int(m.count[i])
+            if col in exclude or count == 0:
+                continue
+
+            constant = m.min[i] == m.max[i]
+            n_unique = int(round(self.distinct[col].estimate()))
+
+            profiles[col] = {
+                "count": count,
+                "mean": float(m.min[i]) if constant else float(m.mean[i]),
+                "std": 0.0 if constant and count > 1 else float(std[i]),
+                "min": float(m.min[i]),
+                "max": float(m.max[i]),
+                "skewness": float("nan") if constant else float(skewness[i]),
+                "n_unique": 1 if constant else min(max(n_unique, 1), count),
+            }
+
+        return profiles
+
+
 def profile_numerical_columns(df: pd.DataFrame, target_col: str | None = None) -> dict:
     """
     Generate basic statistics for numerical columns.
+    n_unique is a HyperLogLog estimate (exact for low cardinalities).
     """
-    profiles = {}
-    num_cols = df.select_dtypes(include=[np.number]).columns
-
-    for col in num_cols:
-        if col == target_col:
-            continue
-
-        series = df[col].dropna()
-        if series.empty:
-            continue
-
-        profiles[col] = {
-            "count": int(series.count()),
-            "mean": float(series.mean()),
-            "std": float(series.std(ddof=1)),
-            "min": float(series.min()),
-            "max": float(series.max()),
-            "skewness": float(skew(series)),
-            "n_unique": int(series.nunique()),
-        }
+    exclude = () if target_col is None else (target_col,)
+    return NumericalProfileState().update(df, exclude=exclude).to_profiles()
 
-    return profiles
-
-def profile_categorical_columns(df: pd.DataFrame) -> dict:
+class CategoricalProfileState:
     """
-    Generate basic statistics for categorical columns.
+    Mergeable profile state for categorical columns.
+
+    Top values come from a Misra-Gries sketch (top_ratio is exact up to
+    `error_bound`) and cardinality from HyperLogLog once the sketch
+    overflows. Columns with a pandas `category` dtype are counted from
+    their integer codes, without hashing the values.
     """
-    profiles = {}
-    cat_cols = df.select_dtypes(include=["object", "category"]).columns
 
-    for col in cat_cols:
-        series = df[col]
-        value_counts = series.value_counts(dropna=False)
-        total = len(series)
+    def __init__(self, error_bound: float = 0.001, hll_precision: int = 14):
+        self.error_bound = error_bound
+        self.hll_precision = hll_precision
+        self.frequent: dict = {}
+        self.distinct: dict = {}
 
-        profiles[col] = {
-            "n_unique": int(series.nunique(dropna=False)),
-            "top_ratio": float(value_counts.iloc[0] / total) if total > 0 else 0.0,
-        }
+    def _sketches(self, col):
+        if col not in self.frequent:
+            self.frequent[col] = FrequentItemsSketch(self.error_bound)
+            self.distinct[col] = HyperLogLog(self.hll_precision)
+        return self.frequent[col], self.distinct[col]
+
+    def _fold(self, col, counts: pd.Series, nulls: int) -> None:
+        # Both sketches only see the distinct values of the block.
+        frequent, distinct = self._sketches(col)
+        frequent.update_counts(counts, nulls=nulls)
+        distinct.update(counts.index[counts.to_numpy() > 0].to_numpy(dtype=object))
+
+    def update(self, df: pd.DataFrame, exclude=()) -> "CategoricalProfileState":
+        cat_cols = [col for col in categorical_columns(df) if col not in exclude]
+
+        for col in cat_cols:
+            series = df[col]
+
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                self.update_codes(col, series.cat.codes.to_numpy(), series.cat.categories)
+                continue
+
+            for start in range(0, len(series), BLOCK_ROWS):
+                block = series.iloc[start:start + BLOCK_ROWS]
+                counts = block.value_counts(dropna=True, sort=False)
+                self._fold(col, counts, len(block) - int(counts.sum()))
+
+        return self
+
+    def update_codes(self, col, codes: np.ndarray, categories) -> "CategoricalProfileState":
+        """
+        Fold one column given as category codes (-1 = missing).
+        """
+        counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+        self._fold(col, pd.Series(counts, index=categories), int(np.count_nonzero(codes < 0)))
+        return self
 
-    return profiles
+    def merge(self, other: "CategoricalProfileState") -> "CategoricalProfileState":
+        for col in other.frequent:
+            frequent, distinct = self._sketches(col)
+            frequent.merge(other.frequent[col])
+            distinct.merge(other.distinct[col])
+        return self
+
+    def to_profiles(self, exclude=()) -> dict:
+        profiles = {}
+
+        for col, frequent in self.frequent.items():
+            if col in exclude:
+                continue
+
+            if frequent.is_exact:
+                n_unique = len(frequent.counts)
+            else:
+                n_unique = max(
+                    int(round(self.distinct[col].estimate())),
+                    len(frequent.counts),
+                )
+
+            total = frequent.total
+            profiles[col] = {
+                "n_unique": n_unique + (1 if frequent.null_count else 0),
+                "top_ratio": float(frequent.top_count() / total) if total > 0 else 0.0,
+            }
+
+        return profiles
+
+
+def profile_categorical_columns(df: pd.DataFrame, error_bound: float = 0.001) -> dict:
+    """
+    Generate basic statistics for categorical columns.
+    Exact for columns with fewer than 1 / error_bound distinct values,
+    sketch-based (bounded memory) above that.
+    """
+    return CategoricalProfileState(error_bound).update(df).to_profiles()
 
 def profile_target(df: pd.DataFrame, target_col: str) -> dict:
     """
@@ -60,9 +202,10 @@ def profile_target(df: pd.DataFrame, target_col: str) -> dict:
     """
     series = df[target_col].dropna()
 
-    # Classification detection: object or small number of unique values
-    if series.dtype == "object" or series.nunique() <= 20:
+    # Classification detection: string-like or small number of unique values
+    if is_categorical_kind(series.dtype) or series.nunique() <= 20:
         counts = series.value_counts(normalize=True)
+        counts = counts[counts > 0]  # unused categories of a category dtype
 
         return {
             "task_type": "classification",
@@ -0,0 +1,362 @@
+# incremental.py
+"""
+Incremental profiling for append-only tables.
+
+IncrementalProfile persists the mergeable state behind the data report
+and the EDA profiles: row and missing counts, duplicate row hashes,
+moment sketches, HyperLogLog and frequent-item sketches, and target
+counts. Each run profiles only the new partition, folds it into the
+state and emits a delta report against the history (mean drift,
+missing-rate and class-ratio changes, new categories, new and resolved
+insights). Runtime scales with the partition, not with the table.
+"""
+
+import os
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from dany_core.dtypes import is_categorical_kind
+from dany_core.eda import CategoricalProfileState, NumericalProfileState
+from dany_core.insights import generate_insights
+from dany_core.report import DataReportAccumulator
+from dany_core.sketches import MomentSketch
+
+STATE_VERSION = 2
+
+# Standardized mean difference (partition vs history) reported as drift
+MEAN_DRIFT_THRESHOLD = 0.2
+
+# Absolute change in a missing rate / class ratio reported as drift
+RATE_DRIFT_THRESHOLD = 0.05
+
+# Same rule as profile_target: up to this many classes -> classification
+MAX_CLASSES = 20
+
+# New categories listed per column in the delta
+MAX_LISTED_CATEGORIES = 20
+
+
+class TargetState:
+    """
+    Mergeable state for profile_target: exact class counts while the
+    target has few distinct values, moments for regression.
+    """
+
+    def __init__(self):
+        self.counts = pd.Series(dtype=np.int64)
+        self.moments = MomentSketch()
+        self.categorical = False
+
+    def update(self, series: pd.Series) -> "TargetState":
+        series = series.dropna()
+        self.categorical |= is_categorical_kind(series.dtype)
+
+        # Counts are kept until the target is clearly not a class label
+        if self.categorical or len(self.counts) <= MAX_CLASSES:
+            counts = series.value_counts(sort=False)
+            self._add_counts(counts[counts > 0])
+
+        if not self.categorical:
+            values = series.to_numpy(dtype=np.float64).reshape(-1, 1)
+            self.moments.update(values, ["target"])
+
+        return self
+
+    def merge(self, other: "TargetState") -> "TargetState":
+        self.categorical |= other.categorical
+        self._add_counts(other.counts)
+        self.moments.merge(other.moments)
+        return self
+
+    def _add_counts(self, counts: pd.Series) -> None:
+        self.counts = self.counts.add(counts, fill_value=0).astype(np.int64)
+        if not self.categorical and len(self.counts) > MAX_CLASSES:
+            # Regression target: only "more than MAX_CLASSES" matters
+            self.counts = self.counts.iloc[:MAX_CLASSES + 1]
+
+    def to_profile(self) -> dict | None:
+        if self.counts.empty:
+            return None
+
+        if self.categorical or len(self.counts) <= MAX_CLASSES:
+            ratios = self.counts / self.counts.sum()
+            return {
+                "task_type": "classification",
+                "class_distribution": ratios.to_dict(),
+                "min_class_ratio": float(ratios.min()),
+            }
+
+        return {
+            "task_type": "regression",
+            "mean": float(self.moments.mean[0]),
+            "std": float(self.moments.std(ddof=1)[0]),
+            "skewness": float(self.moments.skewness()[0]),
+        }
+
+
+class IncrementalProfile:
+    """
+    Persisted profile state of a growing table. `update` folds in one
+    partition and returns its delta report; `report` gives the profiles
+    and insights of the full history.
+    """
+
+    def __init__(self, target_col: str | None = None, error_bound: float = 0.001):
+        self.version = STATE_VERSION
+        self.target_col = target_col
+        self.error_bound = error_bound
+        self.partitions: list = []
+        self.data_report = DataReportAccumulator()
+        self.numerical = NumericalProfileState()
+        self.categorical = CategoricalProfileState(error_bound)
+        self.target = TargetState()
+        self.insights: list = []
+
+    # -----------------------------
+    # Update
+    # -----------------------------
+    def update(self, partition: pd.DataFrame, partition_id=None, clean=None) -> dict:
+        """
+        Fold a new partition into the state. `clean` is an optional
+        cleaning function returning (cleaned_df, report), e.g.
+        run_cleaning. Returns the delta report for this partition.
+        """
+        if partition_id is not None and any(p["id"] == partition_id for p in self.partitions):
+            raise ValueError(f"Partition '{partition_id}' was already profiled")
+
+        before = self.report()
+        duplicates_before = before["data_report"]["duplicate_rows"]
+        initial = before["data_report"]["rows"] == 0
+
+        # The raw data report tracks what was loaded; profiles follow cleaning.
+        raw = partition
+
+        cleaning_report = None
+        if clean is not None:
+            partition, cleaning_report = clean(partition)
+
+        exclude = (self.target_col,) if self.target_col else ()
+        numerical = NumericalProfileState().update(partition, exclude=exclude)
+        categorical = CategoricalProfileState(self.error_bound).update(partition, exclude=exclude)
+        target = TargetState()
+        if self.target_col is not None:
+            target.update(partition[self.target_col])
+
+        delta = {
+            "partition_id": partition_id,
+            "rows_added": len(partition),
+            "history_rows": before["data_report"]["rows"],
+            "duplicate_rows_added": 0,
+            "cleaning": cleaning_report,
+            "initial": initial,
+            "numerical": {} if initial else _numerical_delta(
+                before["profiles"]["numerical"], numerical.to_profiles(),
+                before["data_report"], raw,
+            ),
+            "categorical": {} if initial else _categorical_delta(self.categorical, categorical),
+            "target": _target_delta(before["profiles"]["target"], target.to_profile()),
+        }
+
+        # State changes only once every step above has succeeded.
+        self.data_report.update(raw)
+        delta["duplicate_rows_added"] = self.data_report.to_report()["duplicate_rows"] - duplicates_before
+        self.numerical.merge(numerical)
+        self.categorical.merge(categorical)
+        self.target.merge(target)
+        self.partitions.append({
+            "id": partition_id,
+            "rows": len(partition),
+            "added_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+        after = self.report()
+        delta["insights"] = _insights_delta(self.insights, after["insights"])
+        self.insights = after["insights"]
+
+        return delta
+
+    def report(self) -> dict:
+        """
+        Data report, profiles and insights of every partition so far.
+        """
+        profiles = {
+            "numerical": self.numerical.to_profiles(),
+            "categorical": self.categorical.to_profiles(),
+            "target": self.target.to_profile(),
+        }
+
+        insights = []
+        if profiles["numerical"] or profiles["categorical"]:
+            insights = generate_insights(
+                profiles["numerical"],
+                profiles["categorical"],
+                profiles["target"] or {"task_type": None},
+            )
+
+        return {
+            "data_report": self.data_report.to_report(),
+            "profiles": profiles,
+            "insights": insights,
+            "partitions": len(self.partitions),
+        }
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def save(self, path: str) -> str:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        joblib.dump(self, tmp_path)
+        os.replace(tmp_path, path)  # a crash never leaves a half-written state
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "IncrementalProfile":
+        state = joblib.load(path)
+        if getattr(state, "version", None) != STATE_VERSION:
+            raise ValueError(f"Unsupported profile state version in {path}")
+        return state
+
+
+def run_incremental(
+    state_path: str,
+    partition: pd.DataFrame,
+    target_col: str | None = None,
+    partition_id=None,
+    clean=None,
+) -> dict:
+    """
+    Load (or start) the state at `state_path`, fold in `partition`, save
+    it and return {"delta": ..., "report": ...}. A saved state keeps its
+    target; passing a different `target_col` raises ValueError.
+    """
+    if os.path.exists(state_path):
+        state = IncrementalProfile.load(state_path)
+        if target_col is not None and target_col != state.target_col:
+            raise ValueError(
+                f"Profile state in {state_path} tracks target '{state.target_col}', not '{target_col}'"
+            )
+    else:
+        state = IncrementalProfile(target_col=target_col)
+
+    delta = state.update(partition, partition_id=partition_id, clean=clean)
+    state.save(state_path)
+
+    return {"delta": delta, "report": state.report()}
+
+
+# =========================================================
+# Delta helpers
+# =========================================================
+
+def _numerical_delta(history: dict, current: dict, history_report: dict, partition) -> dict:
+    delta = {}
+    history_rows = history_report["rows"]
+
+    for col, profile in current.items():
+        past = history.get(col)
+        if past is None:
+            delta[col] = {"new_column": True}
+            continue
+
+        std = past["std"]
+        shift = (profile["mean"] - past["mean"]) / std if std else None
+
+        missing_before = (
+            history_report["missing_values"].get(col, 0) / history_rows if history_rows else 0.0
+        )
+        missing_now = float(partition[col].isna().mean()) if len(partition) else 0.0
+
+        delta[col] = {
+            "history_mean": past["mean"],
+            "partition_mean": profile["mean"],
+            "standardized_shift": shift,
+            "history_std": std,
+            "partition_std": profile["std"],
+            "missing_rate_change": missing_now - missing_before,
+            "drift": bool(
+                (shift is not None and abs(shift) > MEAN_DRIFT_THRESHOLD)
+                or abs(missing_now - missing_before) > RATE_DRIFT_THRESHOLD
+            ),
+        }
+
+    return delta
+
+
+def _categorical_delta(history: CategoricalProfileState, current: CategoricalProfileState) -> dict:
+    delta = {}
+    history_profiles = history.to_profiles()
+
+    for col, profile in current.to_profiles().items():
+        past_sketch = history.frequent.get(col)
+        if past_sketch is None:
+            delta[col] = {"new_column": True}
+            continue
+
+        seen = past_sketch.counts.index
+        partition_values = current.frequent[col].counts.index
+        new_values = partition_values[~partition_values.isin(seen)]
+
+        delta[col] = {
+            "new_categories": new_values[:MAX_LISTED_CATEGORIES].tolist(),
+            "n_new_categories": int(len(new_values)),
+            # Beyond the sketch capacity rare history values are not tracked
+            "new_categories_exact": past_sketch.is_exact,
+            "history_top_ratio": history_profiles[col]["top_ratio"],
+            "partition_top_ratio": profile["top_ratio"],
+            "drift": bool(
+                len(new_values) > 0
+                or abs(profile["top_ratio"] - history_profiles[col]["top_ratio"]) > RATE_DRIFT_THRESHOLD
+            ),
+        }
+
+    return delta
+
+
+def _target_delta(history: dict | None, current: dict | None) -> dict | None:
+    if history is None or current is None:
+        return None
+
+    if history["task_type"] != current["task_type"]:
+        return {"task_type_changed": [history["task_type"], current["task_type"]], "drift": True}
+
+    if current["task_type"] == "regression":
+        shift = (current["mean"] - history["mean"]) / history["std"] if history["std"] else None
+        return {
+            "history_mean": history["mean"],
+            "partition_mean": current["mean"],
+            "standardized_shift": shift,
+            "drift": bool(shift is not None and abs(shift) > MEAN_DRIFT_THRESHOLD),
+        }
+
+    past = history["class_distribution"]
+    now = current["class_distribution"]
+    changes = {
+        label: now.get(label, 0.0) - past.get(label, 0.0)
+        for label in set(past) | set(now)
+    }
+
+    return {
+        "class_ratio_change": changes,
+        "new_classes": [label for label in now if label not in past],
+        "drift": bool(
+            any(abs(c) > RATE_DRIFT_THRESHOLD for c in changes.values())
+            or any(label not in past for label in now)
+        ),
+    }
+
+
+def _insights_delta(previous: list, current: list) -> dict:
+    def key(insight):
+        return insight["message"], tuple(insight["columns"])
+
+    previous_keys = {key(i) for i in previous}
+    current_keys = {key(i) for i in current}
+
+    return {
+        "new": [i for i in current if key(i) not in previous_keys],
+        "resolved": [i for i in previous if key(i) not in current_keys],
+    }
@@ -0,0 +1,149 @@
+# ingestion.py
+"""
+Columnar ingestion for DANY.
+
+Single entry point for loading tabular data: multithreaded CSV parsing
+(pyarrow engine when installed), Parquet/Feather input, column
+projection and optional compact dtypes (downcast numerics,
+low-cardinality strings as `category`). CSV inputs can optionally be
+cached as Feather so repeated runs skip the parse.
+
+Frames headed for cleaning are loaded as parsed; the pipeline compacts
+the cleaned frame itself (runner.COMPACT_DTYPES).
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Strings with (distinct / rows) at or below this ratio become `category`
+CATEGORY_MAX_RATIO = 0.5
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+FEATHER_SUFFIXES = (".feather", ".arrow", ".ipc")
+
+
+def read_table(
+    source,
+    columns: list | None = None,
+    target: str | None = None,
+    features: list | None = None,
+    optimize: bool = False,
+    category_max_ratio: float = CATEGORY_MAX_RATIO,
+    cache_dir: str | None = None,
+) -> pd.DataFrame:
+    """
+    Load a CSV / Parquet / Feather file (path or file-like object).
+
+    Only `columns` are loaded; alternatively pass `target` and `features`
+    and just those columns are read. With `optimize`, dtypes are made
+    compact via optimize_dtypes.
+    """
+    if columns is None and features is not None:
+        columns = list(features) + ([target] if target and target not in features else [])
+
+    fmt = _detect_format(source)
+
+    cache_path = None
+    if cache_dir is not None and fmt == "csv" and isinstance(source, (str, os.PathLike)):
+        cache_path = _cache_path(cache_dir, os.fspath(source))
+
+    if cache_path is not None and os.path.exists(cache_path):
+        df = pd.read_feather(cache_path, columns=columns)
+    elif fmt == "parquet":
+        df = pd.read_parquet(source, columns=columns)
+    elif fmt == "feather":
+        df = pd.read_feather(source, columns=columns)
+    else:
+        df = _read_csv(source, columns)
+
+    if cache_path is not None and not os.path.exists(cache_path) and columns is None:
+        os.makedirs(cache_dir, exist_ok=True)
+        df.to_feather(cache_path)
+
+    if optimize:
+        df = optimize_dtypes(df, category_max_ratio=category_max_ratio)
+
+    return df
+
+
+def optimize_dtypes(df: pd.DataFrame, category_max_ratio: float = CATEGORY_MAX_RATIO) -> pd.DataFrame:
+    """
+    Return a frame with compact dtypes. All conversions are lossless:
+    integers are downcast to the smallest type holding their range,
+    floats become float32 only if every value round-trips exactly, and
+    repetitive strings become `category`.
+    """
+    converted = {}
+    n_rows = len(df)
+
+    for col in df.columns:
+        series = df[col]
+        dtype = series.dtype
+
+        if pd.api.types.is_bool_dtype(dtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(dtype):
+            converted[col] = pd.to_numeric(series, downcast="integer")
+
+        elif pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+            values = series.to_numpy()
+            as_f32 = values.astype(np.float32)
+            lossless = np.array_equal(as_f32.astype(values.dtype), values, equal_nan=True)
+            if lossless:
+                converted[col] = series.astype(np.float32)
+
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if n_rows and series.nunique(dropna=True) <= category_max_ratio * n_rows:
+                converted[col] = series.astype("category")
+
+    if not converted:
+        return df
+
+    out = df.copy(deep=False)
+    for col, series in converted.items():
+        out[col] = series
+    return out
+
+
+# =========================================================
+# Helpers
+# =========================================================
+
+def _detect_format(source) -> str:
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    name = os.fspath(name).lower() if name else ""
+
+    if name.endswith(PARQUET_SUFFIXES):
+        return "parquet"
+    if name.endswith(FEATHER_SUFFIXES):
+        return "feather"
+    return "csv"
+
+
+def _read_csv(source, columns):
+    if HAS_PYARROW:
+        # Multithreaded parser; falls back for inputs it cannot handle.
+        try:
+            return pd.read_csv(source, usecols=columns, engine="pyarrow")
+        except (ValueError, TypeError):
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+    return pd.read_csv(source, usecols=columns)
+
+
+def _cache_path(cache_dir: str, path: str) -> str:
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.feather")
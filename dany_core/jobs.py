@@ -0,0 +1,283 @@
+# jobs.py
+"""
+Background execution of DANY pipeline runs.
+
+JobQueue runs run_dany_pipeline on a local thread pool and hands back a
+job ID right away. Callers poll `status` (stage progress from the
+runner's stage events) and `partial` (stage results so far, from
+iter_dany_pipeline), and fetch the output with `result`. Submitting
+the same data and target while a run is still queued or running returns
+the existing job instead of starting a second one.
+
+Cancellation is cooperative: a queued job is dropped, a running one
+stops at its next stage boundary, and modeling at its next finished fit.
+A job is reported cancelled only once none of its stages is running, so
+its worker is free for the next job.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from dany_core.cache import StageCache, frame_fingerprint
+
+# Job states after which nothing changes any more
+FINISHED_STATES = ("completed", "failed", "error", "cancelled")
+
+# Finished jobs (and their results) kept for polling: at most this many,
+# each for at most this long after it finished
+MAX_FINISHED_JOBS = 20
+FINISHED_JOB_TTL_SEC = 3600
+
+
+class PipelineCancelled(Exception):
+    """
+    Raised from a progress callback to stop a pipeline run.
+    """
+
+
+class Job:
+    """
+    One submitted pipeline run and its progress.
+    """
+
+    def __init__(self, job_id: str, key: str, stages: tuple = ()):
+        self.id = job_id
+        self.key = key
+        # Top-level stages the run goes through (runner.pipeline_stages)
+        self.stages = stages
+        self.state = "queued"
+        self.stage = None
+        self.completed_stages: list = []
+        self.events: list = []
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.partial: dict = {}
+        self.results = None
+        self.error = None
+        self.cancel_event = threading.Event()
+        self.done_event = threading.Event()
+        self.future = None
+
+    def on_event(self, event: dict) -> None:
+        # Progress callback passed to run_dany_pipeline
+        if self.cancel_event.is_set():
+            raise PipelineCancelled(self.id)
+
+        if event["depth"] != 0:
+            return
+
+        self.events.append({**event, "time": time.time()})
+        if event["event"] == "start":
+            self.stage = event["stage"]
+        else:
+            self.completed_stages.append(event["stage"])
+
+    def add_stage_result(self, event: dict) -> None:
+        # One iter_dany_pipeline event; candidates accumulate under "models"
+        if event["stage"] == "model":
+            self.partial.setdefault("models", []).append(event["result"])
+        elif event["stage"] != "pipeline":
+            self.partial[event["stage"]] = event["result"]
+
+    def to_status(self) -> dict:
+        done = len(set(self.completed_stages) & set(self.stages))
+        return {
+            "job_id": self.id,
+            "state": self.state,
+            "stage": self.stage,
+            "completed_stages": list(self.completed_stages),
+            "progress": 1.0 if self.state == "completed" else done / max(1, len(self.stages)),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """
+    Local worker pool for pipeline runs. `run_kwargs` (e.g. cache=...)
+    are passed to every run_dany_pipeline call.
+
+    Finished jobs are evicted, oldest first, beyond `max_finished` or
+    `finished_ttl_sec` after they finished; their IDs then raise KeyError.
+
+    Workers are threads: the heavy stages already fan out to their own
+    process pools, and threads let progress and cancellation share the
+    job objects directly.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_finished: int = MAX_FINISHED_JOBS,
+        finished_ttl_sec: float | None = FINISHED_JOB_TTL_SEC,
+        **run_kwargs,
+    ):
+        self.run_kwargs = run_kwargs
+        self.max_finished = max_finished
+        self.finished_ttl_sec = finished_ttl_sec
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dany-job")
+        self._jobs: dict = {}
+        self._in_flight: dict = {}  # dedup key -> job id
+        self._lock = threading.Lock()
+
+    # -----------------------------
+    # Submission
+    # -----------------------------
+    def submit(self, dataframe, target_spec, **kwargs) -> str:
+        """
+        Queue a run and return its job ID (an in-flight job's ID when the
+        same data, target and options are already queued or running).
+        """
+        key = _job_key(dataframe, target_spec, kwargs)
+
+        with self._lock:
+            self._evict()
+            existing = self._in_flight.get(key)
+            if existing is not None:
+                return existing
+
+            job = Job(uuid.uuid4().hex, key)
+            self._jobs[job.id] = job
+            self._in_flight[key] = job.id
+            job.future = self._executor.submit(self._execute, job, dataframe, target_spec, kwargs)
+
+        return job.id
+
+    def _execute(self, job: Job, dataframe, target_spec, kwargs) -> None:
+        from dany_core.runner import iter_dany_pipeline, pipeline_stages
+
+        try:
+            if job.cancel_event.is_set():
+                job.state = "cancelled"
+                return
+
+            job.stages = pipeline_stages()
+            job.state = "running"
+            job.started_at = time.time()
+            for event in iter_dany_pipeline(
+                dataframe,
+                target_spec,
+                progress=job.on_event,
+                cancel=job.cancel_event,
+                **{**self.run_kwargs, **kwargs},
+            ):
+                job.add_stage_result(event)
+
+            job.results = event["result"]
+            job.state = job.results.get("status", "completed")
+            job.error = job.results.get("error") or job.results.get("reason")
+
+        except Exception as e:
+            job.state = "error"
+            job.error = str(e)
+
+        finally:
+            job.finished_at = time.time()
+            with self._lock:
+                if self._in_flight.get(job.key) == job.id:
+                    del self._in_flight[job.key]
+                self._evict()
+            job.done_event.set()
+
+    # -----------------------------
+    # Polling
+    # -----------------------------
+    def status(self, job_id: str) -> dict:
+        return self._get(job_id).to_status()
+
+    def events(self, job_id: str, since: int = 0) -> list:
+        """
+        Top-level stage events of a job, from index `since` on.
+        """
+        return list(self._get(job_id).events[since:])
+
+    def partial(self, job_id: str) -> dict:
+        """
+        Stage results available so far: target_validation, cleaning,
+        profiles, models (list), modeling, ...
+        """
+        return dict(self._get(job_id).partial)
+
+    def result(self, job_id: str, timeout: float | None = None) -> dict | None:
+        """
+        Pipeline results of a finished job. Waits up to `timeout` seconds
+        (None = until done); returns None if the job has not finished.
+        """
+        job = self._get(job_id)
+        if not job.done_event.wait(timeout):
+            return None
+        return job.results
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Request cancellation. Returns False if the job already finished.
+        Deduplicated submitters share the job, so it stops for all of them.
+        """
+        job = self._get(job_id)
+        if job.state in FINISHED_STATES:
+            return False
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            # Never started: finish it here, the worker will not run it
+            job.state = "cancelled"
+            job.finished_at = time.time()
+            with self._lock:
+                if self._in_flight.get(job.key) == job.id:
+                    del self._in_flight[job.key]
+            job.done_event.set()
+        return True
+
+    def jobs(self) -> list:
+        with self._lock:
+            self._evict()
+            return [job.to_status() for job in self._jobs.values()]
+
+    def shutdown(self, wait: bool = True, cancel: bool = False) -> None:
+        if cancel:
+            for job_id in list(self._jobs):
+                self.cancel(job_id)
+        self._executor.shutdown(wait=wait)
+
+    def _evict(self) -> None:
+        # Caller holds the lock
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished_at is not None),
+            key=lambda job: job.finished_at,
+        )
+        excess = len(finished) - self.max_finished
+        now = time.time()
+
+        for i, job in enumerate(finished):
+            expired = (
+                self.finished_ttl_sec is not None
+                and now - job.finished_at > self.finished_ttl_sec
+            )
+            if i < excess or expired:
+                del self._jobs[job.id]
+
+    def _get(self, job_id: str) -> Job:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(f"Unknown job '{job_id}'")
+        return job
+
+
+def _job_key(dataframe, target_spec, kwargs: dict) -> str:
+    if isinstance(dataframe, pd.DataFrame):
+        fingerprint = frame_fingerprint(dataframe)
+    elif isinstance(dataframe, str):
+        fingerprint = f"path:{dataframe}"
+    else:
+        # Iterables of chunks cannot be fingerprinted without consuming them
+        fingerprint = f"object:{id(dataframe)}"
+
+    spec = dict(getattr(target_spec, "__dict__", {})) or {"spec": repr(target_spec)}
+    return StageCache.make_key("job", fingerprint, {"target": spec, "options": kwargs})
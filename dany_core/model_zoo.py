@@ -0,0 +1,215 @@
+# model_zoo.py
+"""
+Candidate models for train_and_evaluate.
+
+A ModelSpec names an estimator factory, the preprocessing it trains on
+and a fit-cost model: single-core seconds = cost_fixed + cost per
+(row x feature), with features counted after that preprocessing. The
+coefficients were measured on one laptop core; they only need to rank
+candidates and keep a run roughly inside its time budget.
+
+Preprocessing kinds (built by modeling._build_preprocessor):
+  "onehot"   scaled numerics + one-hot categoricals (sparse)
+  "ordinal"  raw numerics + ordinal-coded categoricals, for estimators
+             with native categorical support
+  "hashed"   scaled numerics + hashed "column=value" tokens; the width
+             does not grow with category cardinality
+
+register_model() adds or replaces a candidate.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import pandas as pd
+
+from sklearn.ensemble import (
+    HistGradientBoostingClassifier,
+    HistGradientBoostingRegressor,
+    RandomForestClassifier,
+    RandomForestRegressor,
+)
+from sklearn.linear_model import (
+    LinearRegression,
+    LogisticRegression,
+    SGDClassifier,
+    SGDRegressor,
+)
+
+from dany_core.dtypes import categorical_columns, numeric_columns
+
+PREPROCESSING_KINDS = ("onehot", "ordinal", "hashed")
+
+# SGD models join the default candidates from this many rows; below it
+# the exact solvers are fast and converge better
+SGD_MIN_ROWS = 100_000
+
+
+@dataclass
+class ModelSpec:
+    name: str
+    # factory(task_type, layout) -> unfitted estimator (see feature_layout)
+    factory: Callable[[str, dict], Any]
+    # Task type -> single-core fit seconds per (row x feature); the
+    # spec handles the task types listed here
+    cost_per_cell: dict = field(default_factory=dict)
+    cost_fixed: float = 0.01
+    preprocessing: str = "onehot"
+    # Offered by default only from this many training rows
+    min_rows: int | None = None
+    # Parallelises internally (n_jobs, or OpenMP threads): spare cores go
+    # to these models, and every fit is capped at its share
+    parallel: bool = False
+
+    def estimate_fit_sec(self, task_type: str, n_rows: int, layout: dict) -> float:
+        n_features = layout["n_features"][self.preprocessing]
+        return self.cost_fixed + self.cost_per_cell[task_type] * n_rows * n_features
+
+
+MODEL_ZOO: dict = {}
+
+
+def register_model(spec: ModelSpec) -> ModelSpec:
+    if spec.preprocessing not in PREPROCESSING_KINDS:
+        raise ValueError(
+            f"Unknown preprocessing '{spec.preprocessing}' (expected one of {PREPROCESSING_KINDS})"
+        )
+    MODEL_ZOO[spec.name] = spec
+    return spec
+
+
+def feature_layout(X: pd.DataFrame) -> dict:
+    """
+    Shape of the preprocessed features: model inputs per preprocessing
+    kind, and which "ordinal" columns are categorical (numerics first).
+    """
+    n_numeric = len(numeric_columns(X, include_bool=True))
+    cardinalities = [int(X[col].nunique()) for col in categorical_columns(X)]
+
+    return {
+        "n_numeric": n_numeric,
+        "n_categorical": len(cardinalities),
+        "categorical_mask": [False] * n_numeric + [True] * len(cardinalities),
+        "n_features": {
+            "onehot": n_numeric + sum(cardinalities),
+            "ordinal": n_numeric + len(cardinalities),
+            # Hashed rows are sparse: cost follows the non-zeros per row
+            "hashed": n_numeric + len(cardinalities),
+        },
+    }
+
+
+def select_models(
+    task_type: str,
+    n_rows: int,
+    layout: dict,
+    time_budget_sec: float | None = None,
+    names: list | None = None,
+    n_fits: int = 1,
+):
+    """
+    Candidates for a task as ({name: estimated seconds per fit}, skipped),
+    in registration order. `names` picks candidates explicitly (ignoring
+    min_rows).
+
+    With a time budget, candidates are taken cheapest first while the
+    summed estimate of all their fits (`n_fits` each, e.g. CV folds)
+    stays within it; the cheapest one is always kept. Fits run
+    concurrently when cores allow, so this errs on the safe side.
+    """
+    if names is not None:
+        unknown = [name for name in names if name not in MODEL_ZOO]
+        if unknown:
+            raise ValueError(f"Unknown models {unknown} (registered: {sorted(MODEL_ZOO)})")
+        specs = [MODEL_ZOO[name] for name in names if task_type in MODEL_ZOO[name].cost_per_cell]
+    else:
+        specs = [
+            spec for spec in MODEL_ZOO.values()
+            if task_type in spec.cost_per_cell and (spec.min_rows is None or n_rows >= spec.min_rows)
+        ]
+
+    estimates = {spec.name: spec.estimate_fit_sec(task_type, n_rows, layout) for spec in specs}
+    selected = set(estimates)
+    skipped = []
+
+    if time_budget_sec is not None:
+        selected = set()
+        spent = 0.0
+        for name in sorted(estimates, key=estimates.get):
+            cost = estimates[name] * n_fits
+            if selected and spent + cost > time_budget_sec:
+                skipped.append({
+                    "model_name": name,
+                    "estimated_fit_sec": round(estimates[name], 4),
+                    "reason": f"Estimated {cost:.1f}s exceeds the remaining time budget "
+                              f"({max(0.0, time_budget_sec - spent):.1f}s)",
+                })
+                continue
+            selected.add(name)
+            spent += cost
+
+    return {name: est for name, est in estimates.items() if name in selected}, skipped
+
+
+# =========================================================
+# Default zoo
+# =========================================================
+
+register_model(ModelSpec(
+    name="logistic_regression",
+    factory=lambda task_type, layout: LogisticRegression(max_iter=1000),
+    cost_per_cell={"classification": 3e-8},
+))
+
+register_model(ModelSpec(
+    name="linear_regression",
+    factory=lambda task_type, layout: LinearRegression(),
+    cost_per_cell={"regression": 1e-8},
+))
+
+register_model(ModelSpec(
+    name="random_forest",
+    factory=lambda task_type, layout: (
+        RandomForestClassifier(random_state=42)
+        if task_type == "classification"
+        else RandomForestRegressor(random_state=42)
+    ),
+    cost_per_cell={"classification": 2e-5, "regression": 2e-4},
+    parallel=True,
+))
+
+register_model(ModelSpec(
+    name="hist_gradient_boosting",
+    factory=lambda task_type, layout: (
+        HistGradientBoostingClassifier
+        if task_type == "classification"
+        else HistGradientBoostingRegressor
+    )(categorical_features=layout["categorical_mask"], random_state=42),
+    cost_per_cell={"classification": 2e-6, "regression": 2e-6},
+    cost_fixed=0.1,
+    preprocessing="ordinal",
+    parallel=True,
+))
+
+register_model(ModelSpec(
+    name="sgd_linear",
+    factory=lambda task_type, layout: (
+        SGDClassifier(loss="log_loss", random_state=42)
+        if task_type == "classification"
+        else SGDRegressor(random_state=42)
+    ),
+    cost_per_cell={"classification": 1e-7, "regression": 3e-8},
+    min_rows=SGD_MIN_ROWS,
+))
+
+register_model(ModelSpec(
+    name="hashed_linear",
+    factory=lambda task_type, layout: (
+        SGDClassifier(loss="log_loss", random_state=42)
+        if task_type == "classification"
+        else SGDRegressor(random_state=42)
+    ),
+    cost_per_cell={"classification": 5e-7, "regression": 5e-7},
+    preprocessing="hashed",
+    min_rows=SGD_MIN_ROWS,
+))
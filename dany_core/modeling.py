@@ -1,14 +1,17 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 import pandas as pd
 
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler, OneHotEncoder
+from sklearn.base import clone
+from sklearn.model_selection import RepeatedKFold, RepeatedStratifiedKFold, train_test_split
+from sklearn.preprocessing import FunctionTransformer, OneHotEncoder, OrdinalEncoder, StandardScaler
+from sklearn.feature_extraction import FeatureHasher
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 
-from sklearn.linear_model import LogisticRegression, LinearRegression
-from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
-
 from sklearn.metrics import (
     accuracy_score,
     precision_score,
@@ -19,67 +22,139 @@ from sklearn.metrics import (
     r2_score,
 )
 
+from threadpoolctl import threadpool_limits
+
+from dany_core.cache import StageCache, code_version, frame_fingerprint
+from dany_core.dtypes import (
+    as_hash_tokens,
+    as_object_array,
+    categorical_columns,
+    is_categorical_kind,
+    numeric_columns,
+)
+from dany_core.jobs import PipelineCancelled
+from dany_core.model_zoo import MODEL_ZOO, feature_layout, select_models
+from dany_core.scoring import predict_batch
+
+RANDOM_STATE = 42
+
+# Successive halving: keep the best 1/ETA candidates per rung
+HALVING_ETA = 3
+HALVING_MIN_ROWS = 500
+HALVING_MIN_TREES = 10
+
+# Cross-validation (evaluation="cv"): folds per repeat, repeats
+CV_FOLDS = 5
+CV_REPEATS = 1
+
+# Fold matrices are cached apart from the stage outputs (subdirectory
+# of the stage cache, own size budget)
+FOLD_CACHE_DIR = "cv_folds"
+FOLD_CACHE_MAX_BYTES = 256 * 1024 ** 2  # 256 MiB
+
+# "hashed" preprocessing: output columns for the categorical tokens
+HASH_FEATURES = 2**18
+
+# "ordinal" preprocessing: categories kept per column (rarer ones are
+# merged); HistGradientBoosting accepts at most max_bins (255)
+ORDINAL_MAX_CATEGORIES = 255
+
 # ======================================================
 # PUBLIC API
 # ======================================================
 
-def train_and_evaluate(df: pd.DataFrame, target_col: str):
+def train_and_evaluate(
+    df: pd.DataFrame,
+    target_col: str,
+    n_jobs: int | None = None,
+    shared_preprocessing: bool = True,
+    selection: str = "full",
+    evaluation: str = "holdout",
+    cv_folds: int = CV_FOLDS,
+    cv_repeats: int = CV_REPEATS,
+    cache: StageCache | None = None,
+    on_result=None,
+    time_budget_sec: float | None = None,
+    models: list | None = None,
+    cancel=None,
+):
     """
     Trains baseline models and returns structured, inspectable results.
     Day 5: also persists the best trained pipeline for predictions.
-    """
 
-    X = df.drop(columns=[target_col])
-    y = df[target_col]
-
-    task_type = _detect_task_type(y)
-    preprocessor = _build_preprocessor(X)
+    n_jobs is the core budget (sklearn convention: None = 1, -1 = all
+    cores). It is split between fitting candidates concurrently in a
+    process pool and the estimators' own n_jobs.
 
-    X_train, X_test, y_train, y_test = _split_data(
-        X, y, task_type
-    )
+    With shared_preprocessing the ColumnTransformer is fitted once and
+    every model is trained on the cached (possibly sparse) matrices; the
+    returned pipelines still chain preprocessing and model.
 
-    models = _get_models(task_type)
+    selection="halving" runs successive halving over row subsamples (and
+    tree counts): losing candidates are dropped early and only the winner
+    is trained on the full training split. Each result records the budget
+    it consumed.
 
-    all_results = []
+    evaluation="cv" replaces the 80/20 holdout with repeated (stratified)
+    k-fold cross-validation: metrics are fold means, with mean/std under
+    each result's "cv", and the winner is refitted on all rows. Fold
+    preprocessing is shared by all models and, with a `cache`, reused
+    whenever the same folds come back.
 
-    for model_name, model in models.items():
-        pipeline = Pipeline(
-            steps=[
-                ("preprocess", preprocessor),
-                ("model", model),
-            ]
-        )
+    `on_result(result)` is called with each candidate's result as soon as
+    it is scored (before the best model is chosen).
 
-        warnings = []
-        metrics = {}
+    Candidates come from the model zoo (dany_core.model_zoo), or only
+    the names in `models`. With `time_budget_sec` the candidates whose
+    estimated fit time does not fit are skipped and listed under
+    "skipped_models"; each result carries its "estimated_fit_sec".
+    Candidates on the same preprocessing kind share its fitted matrices.
 
-        try:
-            pipeline.fit(X_train, y_train)
-            y_pred = pipeline.predict(X_test)
+    Setting `cancel` (a threading.Event) stops training at the next
+    finished fit: queued fits are dropped and PipelineCancelled is raised.
+    """
 
-            metrics = _compute_metrics(
-                task_type, y_test, y_pred
-            )
+    # Column selection shares buffers under copy-on-write; the split is
+    # kept as row positions and rows are only gathered where needed.
+    X = df[[col for col in df.columns if col != target_col]]
+    y = df[target_col]
 
-            trained_pipeline = pipeline
+    task_type = _detect_task_type(y)
+    budget = _resolve_core_budget(n_jobs)
+
+    if evaluation == "cv":
+        if selection != "full":
+            raise ValueError("Cross-validation supports selection='full' only")
+        fit_rows, n_fits = len(y) * (cv_folds - 1) // cv_folds, cv_folds * cv_repeats
+    elif evaluation == "holdout":
+        fit_rows, n_fits = int(len(y) * 0.8), 1
+    else:
+        raise ValueError(f"Unknown evaluation mode: {evaluation}")
+
+    candidates, estimates, skipped = _get_models(
+        task_type, X, fit_rows, n_fits, time_budget_sec, models
+    )
+    kinds = {name: MODEL_ZOO[name].preprocessing for name in candidates}
+    preprocessors = {kind: _build_preprocessor(X, kind) for kind in dict.fromkeys(kinds.values())}
 
-        except ValueError as e:
-            warnings.append(str(e))
-            trained_pipeline = None
-
-        all_results.append(
-            {
-                "model_name": model_name,
-                "metrics": metrics,
-                "warnings": warnings,
-                "is_best": False,
-                "pipeline": trained_pipeline,  # 👈 persisted
-            }
+    if evaluation == "cv":
+        all_results = _cross_validate(
+            X, y, preprocessors, kinds, candidates, task_type, budget, cv_folds, cv_repeats,
+            cache, on_result, cancel,
         )
+    else:
+        all_results = _holdout(
+            X, y, preprocessors, kinds, candidates, task_type, budget, shared_preprocessing,
+            selection, on_result, cancel,
+        )
+
+    for r in all_results:
+        r["estimated_fit_sec"] = round(estimates[r["model_name"]], 4)
 
+    # Candidates eliminated by halving only have partial-budget metrics.
     best_model = _select_best_model(
-        all_results, task_type
+        [r for r in all_results if r.get("pipeline") is not None],
+        task_type,
     )
 
     best_pipeline = None
@@ -93,6 +168,7 @@ def train_and_evaluate(df: pd.DataFrame, target_col: str):
         "all_models_results": all_results,
         "best_model_summary": best_model,
         "best_pipeline": best_pipeline,  # 👈 REQUIRED FOR DAY 5
+        "skipped_models": skipped,
     }
 
 
@@ -104,6 +180,9 @@ def generate_predictions(modeling_results, df):
     """
     Generate predictions using the best trained pipeline.
     Called ONLY if modeling succeeded.
+
+    For large inputs use dany_core.scoring.predict_batches, which keeps
+    results as NumPy arrays and bounds memory by batch size.
     """
 
     pipeline = modeling_results.get("best_pipeline")
@@ -112,26 +191,13 @@ def generate_predictions(modeling_results, df):
     if pipeline is None:
         return None
 
-    X = df.copy()
-
-    if task_type == "classification":
-        preds = pipeline.predict(X)
-
-        if hasattr(pipeline, "predict_proba"):
-            probs = pipeline.predict_proba(X)
-        else:
-            probs = None
+    # One predict_proba pass gives both labels and probabilities.
+    scored = predict_batch(pipeline, df, task_type)
+    probs = scored["probabilities"]
 
-        return {
-            "predictions": preds.tolist(),
-            "probabilities": probs.tolist() if probs is not None else None,
-        }
-
-    # Regression
-    preds = pipeline.predict(X)
     return {
-        "predictions": preds.tolist(),
-        "probabilities": None,
+        "predictions": scored["predictions"].tolist(),
+        "probabilities": probs.tolist() if probs is not None else None,
     }
 
 
@@ -151,7 +217,7 @@ def compute_prediction_confidence(prediction_output, task_type):
             return None
 
         # Confidence = max class probability
-        return [max(p) for p in probs]
+        return np.asarray(probs, dtype=np.float64).max(axis=1).tolist()
 
     # Regression confidence intentionally undefined for now
     return None
@@ -161,20 +227,298 @@ def compute_prediction_confidence(prediction_output, task_type):
 # HELPERS
 # ======================================================
 
+def _holdout(
+    X, y, preprocessors, kinds, models, task_type, budget, shared_preprocessing, selection,
+    on_result=None, cancel=None,
+):
+    """
+    80/20 train/test evaluation (optionally with successive halving).
+    `kinds` maps each model to its key in `preprocessors`.
+    """
+    train_idx, test_idx = _split_indices(y, task_type)
+    y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+
+    n_workers, model_jobs = _allocate_cores(models, budget)
+    threads = {name: model_jobs.get(name, 1) for name in models}
+    failed = {}  # preprocessing kind -> error
+
+    for model_name, model in models.items():
+        if model_name in model_jobs and "n_jobs" in model.get_params():
+            model.set_params(n_jobs=model_jobs[model_name])
+
+    if shared_preprocessing:
+        # Fit + transform once per preprocessing kind; models only see the
+        # cached matrices and the gathered train/test frames are released
+        # right away.
+        fitted, train_matrices, test_matrices = {}, {}, {}
+        for kind, preprocessor in preprocessors.items():
+            try:
+                fitted[kind], train_matrices[kind], test_matrices[kind] = _holdout_matrices(
+                    X, y_train, preprocessor, train_idx, test_idx
+                )
+            except ValueError as e:
+                # Fails the candidates on this kind only, as a model fit would
+                failed[kind] = str(e)
+        candidates = {name: model for name, model in models.items() if kinds[name] not in failed}
+        X_train = {name: train_matrices[kinds[name]] for name in candidates}
+        X_test = {name: test_matrices[kinds[name]] for name in candidates}
+    else:
+        train_rows, test_rows = X.iloc[train_idx], X.iloc[test_idx]
+        X_train = dict.fromkeys(models, train_rows)
+        X_test = dict.fromkeys(models, test_rows)
+        candidates = {
+            model_name: Pipeline(
+                steps=[
+                    ("preprocess", clone(preprocessors[kinds[model_name]])),
+                    ("model", model),
+                ]
+            )
+            for model_name, model in models.items()
+        }
+
+    fit_args = (X_train, y_train, X_test, y_test, task_type)
+
+    if selection == "halving":
+        all_results = _successive_halving(
+            candidates, *fit_args, n_workers=n_workers, on_result=on_result, cancel=cancel,
+            threads=threads,
+        )
+    elif selection == "full":
+        all_results = _run_candidates(
+            candidates, *fit_args, n_workers=n_workers, on_result=on_result, cancel=cancel,
+            threads=threads,
+        )
+    else:
+        raise ValueError(f"Unknown model selection mode: {selection}")
+
+    if shared_preprocessing:
+        for r in all_results:
+            if r["pipeline"] is not None:
+                r["pipeline"] = Pipeline(
+                    steps=[
+                        ("preprocess", fitted[kinds[r["model_name"]]]),
+                        ("model", r["pipeline"]),
+                    ]
+                )
+
+    for name in models:
+        if kinds[name] in failed:
+            all_results.append(_failed_result(name, failed[kinds[name]]))
+            if on_result is not None:
+                on_result(all_results[-1])
+
+    order = list(models)
+    return sorted(all_results, key=lambda r: order.index(r["model_name"]))
+
+
+def _cross_validate(
+    X, y, preprocessors, kinds, models, task_type, budget, n_splits, n_repeats,
+    cache=None, on_result=None, cancel=None,
+):
+    """
+    Repeated (stratified) k-fold CV. Every (model, fold) fit is a task in
+    one process pool; each fold's preprocessing is fitted once per kind,
+    before its tasks are submitted. Only the best model by mean score is
+    refitted, on all rows.
+    """
+    folds = _cv_folds(y, task_type, n_splits, n_repeats)
+    if cache is not None:
+        # Fold matrices get their own budget so they never evict stage outputs
+        cache = cache.subcache(FOLD_CACHE_DIR, FOLD_CACHE_MAX_BYTES)
+    fingerprint = f"{frame_fingerprint(X)}:{frame_fingerprint(y.to_frame())}"
+    version = code_version(_build_preprocessor)
+
+    n_tasks = len(models) * len(folds)
+    n_workers = max(1, min(budget, n_tasks))
+    spare = max(0, budget - n_workers)
+    threads = dict.fromkeys(models, 1)
+    for name in _parallel_models(models):
+        threads[name] = 1 + spare
+        if "n_jobs" in models[name].get_params():
+            models[name].set_params(n_jobs=1 + spare)
+
+    fold_results = {name: [] for name in models}
+    cache_hits = dict.fromkeys(preprocessors, 0)
+    failed = {}  # preprocessing kind -> first error
+
+    def fold_tasks():
+        for i, (train_idx, test_idx) in enumerate(folds):
+            matrices = {}
+            for kind, preprocessor in preprocessors.items():
+                key = StageCache.make_key(
+                    "cv_preprocess",
+                    fingerprint,
+                    {
+                        "fold": i, "n_splits": n_splits, "n_repeats": n_repeats,
+                        "random_state": RANDOM_STATE, "preprocessing": kind,
+                    },
+                    version,
+                )
+                try:
+                    matrices[kind], hit = _fold_matrices(
+                        X, y, preprocessor, train_idx, test_idx, cache, key
+                    )
+                except ValueError as e:
+                    # Fails the candidates on this kind only
+                    failed.setdefault(kind, str(e))
+                    continue
+                cache_hits[kind] += hit
+            for name, model in models.items():
+                if kinds[name] not in matrices:
+                    continue
+                X_train, X_test = matrices[kinds[name]]
+                yield name, (
+                    name, clone(model), X_train, y.iloc[train_idx], X_test, y.iloc[test_idx], task_type
+                )
+
+    if n_workers == 1:
+        for name, args in fold_tasks():
+            _stop_if_cancelled(cancel)
+            fold_results[name].append(_fit_candidate(*args, keep_model=False, n_threads=threads[name]))
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                (name, executor.submit(_fit_candidate, *args, keep_model=False, n_threads=threads[name]))
+                for name, args in fold_tasks()
+            ]
+            for name, future in futures:
+                fold_results[name].append(future.result())
+                _stop_if_cancelled(cancel, executor)
+
+    all_results = []
+    for name, runs in fold_results.items():
+        scored = [r["metrics"] for r in runs if r["metrics"]]
+        mean = {m: float(np.mean([f[m] for f in scored])) for m in (scored[0] if scored else {})}
+        std = {
+            m: float(np.std([f[m] for f in scored], ddof=1)) if len(scored) > 1 else 0.0
+            for m in mean
+        }
+        all_results.append({
+            "model_name": name,
+            # A model failing on any fold is not comparable to the others
+            "metrics": mean if len(scored) == len(folds) else {},
+            "warnings": sorted(
+                {w for r in runs for w in r["warnings"]}
+                | ({failed[kinds[name]]} if kinds[name] in failed else set())
+            ),
+            "is_best": False,
+            "pipeline": None,
+            "cv": {
+                "n_splits": n_splits,
+                "n_repeats": n_repeats,
+                "folds_scored": len(scored),
+                "mean": mean,
+                "std": std,
+                "per_fold": scored,
+                "preprocessing_cache_hits": cache_hits[kinds[name]],
+            },
+            "timing": {
+                "wall_time_sec": round(sum(r["timing"]["wall_time_sec"] for r in runs), 4),
+                "cpu_time_sec": round(sum(r["timing"]["cpu_time_sec"] for r in runs), 4),
+            },
+        })
+        if on_result is not None:
+            on_result(all_results[-1])
+
+    best = _select_best_model(all_results, task_type)
+    for r in all_results:
+        if r["model_name"] != best["model_name"]:
+            continue
+
+        model = clone(models[r["model_name"]])
+        if r["model_name"] in _parallel_models(models) and "n_jobs" in model.get_params():
+            model.set_params(n_jobs=budget)
+
+        pipeline = Pipeline(
+            steps=[
+                ("preprocess", clone(preprocessors[kinds[r["model_name"]]])),
+                ("model", model),
+            ]
+        )
+        wall_start = time.perf_counter()
+        try:
+            with threadpool_limits(limits=budget):
+                pipeline.fit(X, y)
+            r["pipeline"] = pipeline
+        except ValueError as e:
+            r["warnings"].append(str(e))
+            r["metrics"] = {}
+        r["timing"]["refit_time_sec"] = round(time.perf_counter() - wall_start, 4)
+
+    return all_results
+
+
+def _holdout_matrices(X, y_train, preprocessor, train_idx, test_idx):
+    """
+    (fitted preprocessor, X_train, X_test).
+    """
+    X_train = preprocessor.fit_transform(X.iloc[train_idx], y_train)
+    return preprocessor, X_train, preprocessor.transform(X.iloc[test_idx])
+
+
+def _cv_folds(y, task_type, n_splits, n_repeats):
+    # Stratify when every class can appear in every fold
+    stratified = task_type == "classification" and y.value_counts().min() >= n_splits
+    splitter_cls = RepeatedStratifiedKFold if stratified else RepeatedKFold
+    splitter = splitter_cls(n_splits=n_splits, n_repeats=n_repeats, random_state=RANDOM_STATE)
+    return list(splitter.split(np.zeros(len(y)), y))
+
+
+def _fold_matrices(X, y, preprocessor, train_idx, test_idx, cache, key):
+    """
+    Preprocessor fitted on the fold's training rows, as (X_train, X_test)
+    matrices; read from / written to `cache` when one is given.
+    """
+    def compute():
+        fold_preprocessor = clone(preprocessor)
+        X_train = fold_preprocessor.fit_transform(X.iloc[train_idx], y.iloc[train_idx])
+        return X_train, fold_preprocessor.transform(X.iloc[test_idx])
+
+    if cache is None:
+        return compute(), False
+    return cache.get_or_compute(key, compute)
+
+
 def _detect_task_type(y: pd.Series) -> str:
-    if y.dtype == "object" or y.nunique() <= 2:
+    if is_categorical_kind(y.dtype) or y.nunique() <= 2:
         return "classification"
     return "regression"
 
 
-def _build_preprocessor(X: pd.DataFrame):
-    num_cols = X.select_dtypes(
-        include=["int64", "float64"]
-    ).columns.tolist()
-
-    cat_cols = X.select_dtypes(
-        include=["object"]
-    ).columns.tolist()
+def _build_preprocessor(X: pd.DataFrame, kind: str = "onehot"):
+    """
+    ColumnTransformer for one preprocessing kind (see model_zoo):
+    "onehot", "ordinal" (numerics first, then one code per categorical)
+    or "hashed".
+    """
+    # Kinds, not exact dtypes: compact numerics (int8..float32, nullable,
+    # bool) and category / pandas / Arrow strings are all picked up.
+    num_cols = numeric_columns(X, include_bool=True)
+    cat_cols = categorical_columns(X)
+
+    if kind == "onehot":
+        num_step = StandardScaler()
+        cat_step = ("onehot", OneHotEncoder(handle_unknown="ignore"))
+    elif kind == "ordinal":
+        # Trees need no scaling; unseen and missing categories become NaN,
+        # which HistGradientBoosting routes as missing
+        num_step = "passthrough"
+        cat_step = ("ordinal", OrdinalEncoder(
+            handle_unknown="use_encoded_value",
+            unknown_value=np.nan,
+            encoded_missing_value=np.nan,
+            max_categories=ORDINAL_MAX_CATEGORIES,
+        ))
+    elif kind == "hashed":
+        num_step = StandardScaler()
+        cat_step = ("hash", Pipeline(
+            steps=[
+                ("tokens", FunctionTransformer(as_hash_tokens)),
+                ("hasher", FeatureHasher(n_features=HASH_FEATURES, input_type="string")),
+            ]
+        ))
+    else:
+        raise ValueError(f"Unknown preprocessing kind: {kind}")
 
     transformers = []
 
@@ -182,7 +526,7 @@ def _build_preprocessor(X: pd.DataFrame):
         transformers.append(
             (
                 "num",
-                StandardScaler(),
+                num_step,
                 num_cols,
             )
         )
@@ -191,7 +535,14 @@ def _build_preprocessor(X: pd.DataFrame):
         transformers.append(
             (
                 "cat",
-                OneHotEncoder(handle_unknown="ignore"),
+                Pipeline(
+                    steps=[
+                        ("to_object", FunctionTransformer(
+                            as_object_array, feature_names_out="one-to-one"
+                        )),
+                        cat_step,
+                    ]
+                ),
                 cat_cols,
             )
         )
@@ -199,7 +550,45 @@ def _build_preprocessor(X: pd.DataFrame):
     return ColumnTransformer(transformers=transformers)
 
 
-def _split_data(X, y, task_type):
+def _resolve_core_budget(n_jobs):
+    cpu_count = os.cpu_count() or 1
+
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, cpu_count + 1 + n_jobs)
+    return min(n_jobs, cpu_count)
+
+
+def _allocate_cores(models, budget):
+    """
+    Split the core budget between concurrent fits and intra-model
+    parallelism. Every candidate gets one worker; cores left over go to
+    the models that parallelise internally (spec.parallel: n_jobs, or
+    OpenMP threads for HistGradientBoosting). Each fit runs under a
+    thread limit of its share, so no fit takes every core.
+    """
+    n_workers = max(1, min(len(models), budget))
+
+    parallel_models = _parallel_models(models)
+
+    model_jobs = {}
+    spare = budget - n_workers
+    if not parallel_models:
+        return n_workers, model_jobs
+
+    for i, name in enumerate(parallel_models):
+        share = spare // len(parallel_models) + (1 if i < spare % len(parallel_models) else 0)
+        model_jobs[name] = 1 + share
+
+    return n_workers, model_jobs
+
+
+def _split_indices(y, task_type):
+    """
+    Row positions of the 80/20 train/test split (same split as
+    train_test_split on the frame itself, without materializing it).
+    """
     stratify = None
 
     if task_type == "classification":
@@ -208,24 +597,285 @@ def _split_data(X, y, task_type):
             stratify = y
 
     return train_test_split(
-        X,
-        y,
+        np.arange(len(y)),
         test_size=0.2,
         random_state=42,
         stratify=stratify,
     )
 
 
-def _get_models(task_type):
-    if task_type == "classification":
-        return {
-            "logistic_regression": LogisticRegression(max_iter=1000),
-            "random_forest": RandomForestClassifier(random_state=42),
+def _get_models(task_type, X, fit_rows, n_fits=1, time_budget_sec=None, names=None):
+    """
+    Unfitted candidates from the model zoo as (models, estimated seconds
+    per fit, skipped), sized for `fit_rows` training rows.
+    """
+    layout = feature_layout(X)
+    estimates, skipped = select_models(
+        task_type, fit_rows, layout, time_budget_sec, names, n_fits
+    )
+    models = {name: MODEL_ZOO[name].factory(task_type, layout) for name in estimates}
+    return models, estimates, skipped
+
+
+def _parallel_models(models):
+    return [name for name in models if name in MODEL_ZOO and MODEL_ZOO[name].parallel]
+
+
+def _run_candidates(
+    candidates, X_train, y_train, X_test, y_test, task_type, n_workers=1, on_result=None,
+    cancel=None, threads=None,
+):
+    """
+    Fit and score every candidate. X_train / X_test map each candidate
+    name to its (preprocessed) features, `threads` to its thread limit.
+    """
+    if not candidates:
+        return []
+
+    report = on_result or (lambda r: None)
+
+    threads = threads or {}
+
+    def fit_args(name):
+        return X_train[name], y_train, X_test[name], y_test, task_type
+
+    if n_workers == 1 or len(candidates) == 1:
+        results = []
+        for name, estimator in candidates.items():
+            _stop_if_cancelled(cancel)
+            results.append(_fit_candidate(name, estimator, *fit_args(name), n_threads=threads.get(name)))
+            report(results[-1])
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(candidates))) as executor:
+        futures = [
+            executor.submit(_fit_candidate, name, estimator, *fit_args(name), n_threads=threads.get(name))
+            for name, estimator in candidates.items()
+        ]
+        # Reported in completion order, returned in candidate order
+        for future in as_completed(futures):
+            _stop_if_cancelled(cancel, executor)
+            report(future.result())
+        return [f.result() for f in futures]
+
+
+def _successive_halving(
+    candidates, X_train, y_train, X_test, y_test, task_type,
+    n_workers=1, eta=HALVING_ETA, min_rows=HALVING_MIN_ROWS, on_result=None, cancel=None,
+    threads=None,
+):
+    """
+    Successive halving: every rung fits the surviving candidates on a
+    subsample (rows and, for ensembles, trees scaled by the same factor)
+    and keeps the best 1/eta. The last survivor is fitted on all rows.
+    `on_result` sees eliminated candidates as they drop out and the
+    survivor once fully trained.
+    """
+    n_rows = len(y_train)
+    n_rungs = int(np.ceil(np.log(len(candidates)) / np.log(eta))) if len(candidates) > 1 else 0
+
+    survivors = dict(candidates)
+    budgets = {name: [] for name in candidates}
+    eliminated = {}
+
+    for rung in range(n_rungs):
+        fraction = float(eta) ** (rung - n_rungs)
+        rung_rows = max(min_rows, int(n_rows * fraction))
+        # Stop once one candidate is left, or none (every fit failed)
+        if rung_rows >= n_rows or len(survivors) <= 1:
+            break
+
+        rows = _subsample_rows(y_train, rung_rows, task_type)
+        rung_candidates = {
+            name: _scale_ensemble(clone(estimator), fraction)
+            for name, estimator in survivors.items()
+        }
+
+        rung_results = _run_candidates(
+            rung_candidates,
+            _take_rows_each({name: X_train[name] for name in survivors}, rows),
+            _take_rows(y_train, rows),
+            X_test, y_test, task_type,
+            n_workers=n_workers,
+            cancel=cancel,
+            threads=threads,
+        )
+
+        for r in rung_results:
+            budgets[r["model_name"]].append(
+                _budget_entry(rung, len(rows), rung_candidates[r["model_name"]], r)
+            )
+
+        ranked = sorted(
+            [r for r in rung_results if r["metrics"]],
+            key=_rank_key(task_type),
+        )
+        keep = {r["model_name"] for r in ranked[:max(1, int(np.ceil(len(survivors) / eta)))]}
+
+        for r in rung_results:
+            if r["model_name"] not in keep:
+                eliminated[r["model_name"]] = {**r, "pipeline": None, "eliminated_at_rung": rung}
+                if on_result is not None:
+                    on_result(eliminated[r["model_name"]])
+
+        survivors = {name: est for name, est in survivors.items() if name in keep}
+
+    final_results = _run_candidates(
+        survivors, X_train, y_train, X_test, y_test, task_type,
+        n_workers=n_workers, on_result=on_result, cancel=cancel, threads=threads,
+    )
+    for r in final_results:
+        budgets[r["model_name"]].append(
+            _budget_entry(len(budgets[r["model_name"]]), n_rows, survivors[r["model_name"]], r)
+        )
+        r["eliminated_at_rung"] = None
+
+    by_name = {r["model_name"]: r for r in final_results}
+    by_name.update(eliminated)
+
+    all_results = []
+    for name in candidates:
+        r = by_name[name]
+        r["budget"] = {
+            "rungs": budgets[name],
+            "rows_fitted": sum(b["rows"] for b in budgets[name]),
+            "wall_time_sec": round(sum(b["wall_time_sec"] for b in budgets[name]), 4),
+            "eliminated_at_rung": r.pop("eliminated_at_rung"),
         }
+        all_results.append(r)
 
+    return all_results
+
+
+def _stop_if_cancelled(cancel, executor=None):
+    if cancel is None or not cancel.is_set():
+        return
+    if executor is not None:
+        # Drop the queued fits; the with-block then waits for running ones
+        executor.shutdown(wait=False, cancel_futures=True)
+    raise PipelineCancelled("Modeling was cancelled")
+
+
+def _budget_entry(rung, rows, estimator, result):
+    params = estimator.get_params()
+    n_estimators = next(
+        (v for k, v in params.items() if k.endswith("n_estimators")), None
+    )
     return {
-        "linear_regression": LinearRegression(),
-        "random_forest": RandomForestRegressor(random_state=42),
+        "rung": rung,
+        "rows": rows,
+        "n_estimators": n_estimators,
+        "wall_time_sec": result["timing"]["wall_time_sec"],
+    }
+
+
+def _scale_ensemble(estimator, fraction):
+    params = estimator.get_params()
+    for key, value in params.items():
+        if key.endswith("n_estimators") and isinstance(value, int):
+            estimator.set_params(**{key: max(HALVING_MIN_TREES, int(value * fraction))})
+    return estimator
+
+
+def _subsample_rows(y, n, task_type):
+    positions = np.arange(len(y))
+    stratify = None
+
+    if task_type == "classification":
+        class_counts = pd.Series(y).value_counts()
+        if (class_counts >= 2).all() and n >= len(class_counts):
+            stratify = y
+
+    rows, _ = train_test_split(
+        positions,
+        train_size=n,
+        random_state=RANDOM_STATE,
+        stratify=stratify,
+    )
+    return np.sort(rows)
+
+
+def _take_rows(data, rows):
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return data.iloc[rows]
+    return data[rows]
+
+
+def _take_rows_each(matrices, rows):
+    # Candidates on the same preprocessing share one subsample
+    taken = {}
+    for data in matrices.values():
+        if id(data) not in taken:
+            taken[id(data)] = _take_rows(data, rows)
+    return {name: taken[id(data)] for name, data in matrices.items()}
+
+
+def _failed_result(model_name, message):
+    # Same shape as a _fit_candidate failure
+    return {
+        "model_name": model_name,
+        "metrics": {},
+        "warnings": [message],
+        "is_best": False,
+        "pipeline": None,
+        "timing": {"wall_time_sec": 0.0, "cpu_time_sec": 0.0},
+    }
+
+
+def _fit_candidate(
+    model_name, pipeline, X_train, y_train, X_test, y_test, task_type, keep_model=True,
+    n_threads=None,
+):
+    """
+    Fit and score one candidate (a full pipeline, or a bare model when
+    preprocessing is shared). Module-level so it can run in a worker
+    process; reports wall and CPU time of the fit + predict, with the
+    epoch start time so the caller can place it on a trace. With
+    keep_model=False the fitted model is not returned (CV folds).
+    `n_threads` caps the OpenMP / BLAS threads of the fit and predict.
+    """
+
+    warnings = []
+    metrics = {}
+
+    started_at = time.time()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    fit_time = predict_time = None
+
+    try:
+        with threadpool_limits(limits=n_threads):
+            pipeline.fit(X_train, y_train)
+            fit_time = time.perf_counter() - wall_start
+
+            y_pred = pipeline.predict(X_test)
+            predict_time = time.perf_counter() - wall_start - fit_time
+
+        metrics = _compute_metrics(
+            task_type, y_test, y_pred
+        )
+
+        trained_pipeline = pipeline
+
+    except ValueError as e:
+        warnings.append(str(e))
+        trained_pipeline = None
+
+    return {
+        "model_name": model_name,
+        "metrics": metrics,
+        "warnings": warnings,
+        "is_best": False,
+        "pipeline": trained_pipeline if keep_model else None,  # 👈 persisted
+        "timing": {
+            "wall_time_sec": round(time.perf_counter() - wall_start, 4),
+            "cpu_time_sec": round(time.process_time() - cpu_start, 4),
+            "fit_time_sec": round(fit_time, 4) if fit_time is not None else None,
+            "predict_time_sec": round(predict_time, 4) if predict_time is not None else None,
+            "started_at": started_at,
+            "train_rows": X_train.shape[0],
+            "test_rows": X_test.shape[0],
+        },
     }
 
 
@@ -247,6 +897,16 @@ def _compute_metrics(task_type, y_true, y_pred):
     }
 
 
+def _rank_key(task_type):
+    key = "f1" if task_type == "classification" else "rmse"
+
+    return lambda x: (
+        -x["metrics"][key]
+        if task_type == "classification"
+        else x["metrics"][key]
+    )
+
+
 def _select_best_model(results, task_type):
     valid_results = [
         r for r in results if r["metrics"]
@@ -259,16 +919,7 @@ def _select_best_model(results, task_type):
             "reason": "No model could be trained on the provided data",
         }
 
-    key = "f1" if task_type == "classification" else "rmse"
-
-    sorted_results = sorted(
-        valid_results,
-        key=lambda x: (
-            -x["metrics"][key]
-            if task_type == "classification"
-            else x["metrics"][key]
-        ),
-    )
+    sorted_results = sorted(valid_results, key=_rank_key(task_type))
 
     return {
         "model_name": sorted_results[0]["model_name"],
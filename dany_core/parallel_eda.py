@@ -0,0 +1,219 @@
+# parallel_eda.py
+"""
+Column-sharded EDA executor.
+
+The columns of a frame are split into shards and profiled in a process
+(or thread) pool. Numeric columns and the codes of `category` columns
+are copied once, column-major, into shared memory. Each worker attaches
+to its slice of columns instead of receiving a pickled frame. Other
+string columns are sent with their shard.
+
+Shards hold disjoint columns, so their profiles are combined by union
+and match profile_numerical_columns / profile_categorical_columns.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from dany_core.dtypes import categorical_columns, numeric_columns
+from dany_core.eda import (
+    CategoricalProfileState,
+    NumericalProfileState,
+    profile_categorical_columns,
+    profile_numerical_columns,
+    profile_target,
+)
+from dany_core.modeling import _resolve_core_budget
+
+# Below this many cells the pool costs more than it saves
+PARALLEL_MIN_CELLS = 1_000_000
+
+# Shards per worker; more shards even out columns of uneven cost
+SHARDS_PER_WORKER = 2
+
+
+def profile_columns(
+    df: pd.DataFrame,
+    target_col: str | None = None,
+    n_jobs: int | None = -1,
+    backend: str = "process",
+    error_bound: float = 0.001,
+) -> dict:
+    """
+    Numerical and categorical profiles of `df` (plus the target profile
+    when `target_col` is given), computed in parallel column shards.
+
+    `backend` is "process" (shared memory) or "thread". Small frames and
+    n_jobs=1 run serially.
+    """
+    if backend not in ("process", "thread"):
+        raise ValueError(f"Unknown backend: {backend}")
+
+    workers = _resolve_core_budget(n_jobs)
+
+    if workers > 1 and df.size >= PARALLEL_MIN_CELLS:
+        return _profile_sharded(df, target_col, workers, backend, error_bound)
+
+    profiles = {
+        "numerical": profile_numerical_columns(df, target_col),
+        "categorical": profile_categorical_columns(df, error_bound),
+    }
+    if target_col is not None:
+        profiles["target"] = profile_target(df, target_col)
+
+    return profiles
+
+
+def _profile_sharded(df, target_col, workers, backend, error_bound) -> dict:
+    num_cols = [col for col in numeric_columns(df) if col != target_col]
+    cat_cols = categorical_columns(df)
+    coded_cols = [col for col in cat_cols if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    object_cols = [col for col in cat_cols if col not in set(coded_cols)]
+
+    n_shards = workers * SHARDS_PER_WORKER
+    shared = backend == "process"
+    pool_cls = ProcessPoolExecutor if shared else ThreadPoolExecutor
+
+    numeric = _ColumnBlock(df, num_cols, np.float64, shared)
+    codes = _ColumnBlock(df, coded_cols, np.int32, shared)
+
+    try:
+        with pool_cls(max_workers=workers) as pool:
+            numeric_futures = [
+                pool.submit(_profile_numeric_shard, numeric.ref, start, stop, num_cols[start:stop])
+                for start, stop in _shard_bounds(len(num_cols), n_shards)
+            ]
+            coded_futures = [
+                pool.submit(
+                    _profile_coded_shard, codes.ref, start, stop, coded_cols[start:stop],
+                    [df[col].cat.categories for col in coded_cols[start:stop]], error_bound,
+                )
+                for start, stop in _shard_bounds(len(coded_cols), n_shards)
+            ]
+            object_futures = [
+                pool.submit(_profile_object_shard, df[object_cols[start:stop]], error_bound)
+                for start, stop in _shard_bounds(len(object_cols), n_shards)
+            ]
+
+            # The parent profiles the target while the shards run
+            target = profile_target(df, target_col) if target_col is not None else None
+
+            numerical = _union([f.result() for f in numeric_futures], num_cols)
+            categorical = _union(
+                [f.result() for f in coded_futures + object_futures], cat_cols
+            )
+    finally:
+        numeric.close()
+        codes.close()
+
+    profiles = {"numerical": numerical, "categorical": categorical}
+    if target is not None:
+        profiles["target"] = target
+    return profiles
+
+
+# =========================================================
+# Workers (module level so they can be pickled)
+# =========================================================
+
+def _profile_numeric_shard(ref, start, stop, columns) -> dict:
+    shm, values = _attach(ref)
+    try:
+        return NumericalProfileState().update_values(values[:, start:stop], columns).to_profiles()
+    finally:
+        del values
+        if shm is not None:
+            shm.close()
+
+
+def _profile_coded_shard(ref, start, stop, columns, categories, error_bound) -> dict:
+    shm, codes = _attach(ref)
+    try:
+        state = CategoricalProfileState(error_bound)
+        for j, col in enumerate(columns):
+            state.update_codes(col, codes[:, start + j], categories[j])
+        return state.to_profiles()
+    finally:
+        del codes
+        if shm is not None:
+            shm.close()
+
+
+def _profile_object_shard(frame: pd.DataFrame, error_bound) -> dict:
+    return CategoricalProfileState(error_bound).update(frame).to_profiles()
+
+
+# =========================================================
+# Shared column blocks
+# =========================================================
+
+class _ColumnBlock:
+    """
+    Columns of `df` as one column-major array: in shared memory for the
+    process backend, in regular memory for threads. `ref` is what a
+    worker needs to attach to it.
+    """
+
+    def __init__(self, df: pd.DataFrame, columns: list, dtype, shared: bool):
+        shape = (len(df), len(columns))
+        dtype = np.dtype(dtype)
+        self.shm = None
+
+        if shared:
+            nbytes = max(1, shape[0] * shape[1] * dtype.itemsize)
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, order="F")
+            self.ref = (self.shm.name, shape, dtype.str)
+        else:
+            array = np.empty(shape, dtype=dtype, order="F")
+            self.ref = array
+
+        # Filled one column at a time, so no second full-size copy exists.
+        for j, col in enumerate(columns):
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                array[:, j] = series.cat.codes.to_numpy()
+            else:
+                array[:, j] = series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        del array
+
+    def close(self) -> None:
+        self.ref = None
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+def _attach(ref):
+    if isinstance(ref, np.ndarray):
+        return None, ref
+
+    name, shape, dtype = ref
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13
+        shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, order="F")
+
+
+# =========================================================
+# Helpers
+# =========================================================
+
+def _shard_bounds(n_columns: int, n_shards: int) -> list:
+    if n_columns == 0:
+        return []
+    edges = np.linspace(0, n_columns, min(n_shards, n_columns) + 1).astype(int)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def _union(shard_profiles: list, column_order: list) -> dict:
+    merged = {}
+    for profiles in shard_profiles:
+        merged.update(profiles)
+    return {col: merged[col] for col in column_order if col in merged}
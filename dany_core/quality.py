@@ -0,0 +1,275 @@
+# quality.py
+"""
+Vectorized data-quality scanning for DANY.
+
+Rows are reduced to 64-bit hashes one column at a time, and all
+columns' missing counts come from a single isna() reduction. Exact
+duplicates are counted against HashSet, a set of sorted uint64 runs
+that costs 8 bytes per distinct row. An optional MinHash/LSH mode
+flags near-duplicate rows. Everything works chunk by chunk, so
+out-of-core inputs get the same report as in-memory frames.
+"""
+
+import numpy as np
+import pandas as pd
+
+from dany_core.dtypes import is_categorical_kind, memory_usage_bytes
+
+# Hash of a missing cell, whatever the column dtype
+NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+# Rows hashed per step in the MinHash mode (bounds the token matrix)
+MINHASH_BLOCK_ROWS = 32_768
+
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+
+
+# =========================================================
+# Row hashing
+# =========================================================
+
+def splitmix64(x: np.ndarray) -> np.ndarray:
+    """
+    Vectorized SplitMix64 finalizer (uint64 -> well-mixed uint64).
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        x = x + np.uint64(0x9E3779B97F4A7C15)
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def column_hashes(series: pd.Series) -> np.ndarray:
+    """
+    One uint64 per cell. Values hash alike whatever their dtype
+    (int8 / int64 / float / nullable, object / string / category), so
+    chunks with different inferred dtypes still agree.
+    """
+    dtype = series.dtype
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        category_hashes = column_hashes(pd.Series(series.cat.categories))
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, category_hashes[codes], NULL_HASH)
+
+    if is_categorical_kind(dtype):
+        # Only the distinct values are hashed; cells take them by code.
+        codes, uniques = pd.factorize(series)
+        unique_hashes = pd.util.hash_array(np.asarray(uniques, dtype=object), categorize=False)
+        return np.where(codes >= 0, unique_hashes[codes] if len(uniques) else NULL_HASH, NULL_HASH)
+
+    if pd.api.types.is_integer_dtype(dtype) and series.notna().all():
+        values = series.to_numpy(dtype=np.int64)
+        if len(values) and np.abs(values).max() >= _MAX_EXACT_FLOAT_INT:
+            return splitmix64(values.view(np.uint64))
+
+    # Numeric and bool: hashed through their float64 bit pattern
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan) + 0.0  # -0.0 -> 0.0
+    out = splitmix64(values.view(np.uint64))
+    out[np.isnan(values)] = NULL_HASH
+    return out
+
+
+def row_hashes(df: pd.DataFrame) -> np.ndarray:
+    """
+    64-bit hash per row, combining column_hashes in column order.
+    """
+    h = np.full(len(df), np.uint64(len(df.columns)), dtype=np.uint64)
+    for i in range(df.shape[1]):
+        h = splitmix64(h ^ column_hashes(df.iloc[:, i]))
+    return h
+
+
+# =========================================================
+# Compact hash set
+# =========================================================
+
+class HashSet:
+    """
+    Set of uint64 hashes kept as a few sorted arrays ("runs"): 8 bytes
+    per member instead of ~70 for a Python set of ints. Runs are merged
+    when a new one is at least as large as the last, so lookups touch
+    O(log n) runs.
+    """
+
+    def __init__(self):
+        self.runs: list = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self.runs)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            pos = np.searchsorted(run, hashes)
+            pos[pos == len(run)] = 0
+            found |= run[pos] == hashes
+        return found
+
+    def add(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Insert `hashes`; returns a mask of the positions that were not
+        in the set yet (first occurrence within the batch).
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        unique, first = _unique_first(hashes)
+        unseen = ~self.contains(unique)
+
+        new_mask = np.zeros(len(hashes), dtype=bool)
+        new_mask[first[unseen]] = True
+
+        run = unique[unseen]
+        while self.runs and len(self.runs[-1]) <= len(run):
+            run = np.union1d(self.runs.pop(), run)
+        if len(run):
+            self.runs.append(run)
+
+        return new_mask
+
+    def merge(self, other: "HashSet") -> "HashSet":
+        for run in other.runs:
+            self.add(run)
+        return self
+
+
+def _unique_first(hashes: np.ndarray):
+    # np.unique(return_index=True) with an unstable sort: ties are
+    # resolved to the first position with a reduceat instead.
+    if len(hashes) == 0:
+        return hashes, np.zeros(0, dtype=np.intp)
+
+    order = np.argsort(hashes)
+    ordered = hashes[order]
+    starts = np.flatnonzero(np.concatenate([[True], ordered[1:] != ordered[:-1]]))
+    return ordered[starts], np.minimum.reduceat(order, starts)
+
+
+# =========================================================
+# Near duplicates (MinHash + LSH)
+# =========================================================
+
+class MinHashLSH:
+    """
+    Flags rows that probably share most cells with an earlier row.
+
+    A row is the set of its (column, value) cells. `num_perm` MinHash
+    values are split into `bands`. A row is a candidate once one of its
+    band hashes has been seen before, which happens with probability
+    1 - (1 - J ** rows_per_band) ** bands for Jaccard similarity J. The
+    defaults (64 / 8) put the cutoff near J = 0.77. A row differing in
+    1 of 10 cells has J = 0.82.
+    """
+
+    def __init__(self, num_perm: int = 64, bands: int = 8, seed: int = 0):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows_per_band = num_perm // bands
+        self.seeds = splitmix64(np.arange(num_perm, dtype=np.uint64) + np.uint64(seed))
+        self.band_sets = [HashSet() for _ in range(bands)]
+
+    def signatures(self, cell_hashes: np.ndarray) -> np.ndarray:
+        """
+        (rows x num_perm) MinHash signatures of a (rows x columns) matrix
+        of cell hashes.
+        """
+        n_rows, n_cols = cell_hashes.shape
+        # Cell tokens depend on the column, so equal values in different
+        # columns are different set members.
+        salt = splitmix64(np.arange(n_cols, dtype=np.uint64))
+        tokens = splitmix64(cell_hashes ^ salt)
+
+        sig = np.empty((n_rows, self.num_perm), dtype=np.uint64)
+        for j, seed in enumerate(self.seeds):
+            sig[:, j] = splitmix64(tokens ^ seed).min(axis=1)
+        return sig
+
+    def update(self, cell_hashes: np.ndarray) -> np.ndarray:
+        """
+        Fold a block of rows in; returns a mask of rows matching an
+        earlier row in at least one band.
+        """
+        sig = self.signatures(cell_hashes)
+        candidate = np.zeros(len(sig), dtype=bool)
+
+        for b, band_set in enumerate(self.band_sets):
+            band = sig[:, b * self.rows_per_band:(b + 1) * self.rows_per_band]
+            h = np.zeros(len(sig), dtype=np.uint64)
+            for k in range(band.shape[1]):
+                h = splitmix64(h ^ band[:, k])
+            candidate |= ~band_set.add(h)
+
+        return candidate
+
+
+# =========================================================
+# Scanner
+# =========================================================
+
+class DataQualityScanner:
+    """
+    Chunk-wise data-quality report: rows, missing values per column,
+    exact duplicate rows, dtypes and memory. With near_duplicates,
+    also counts rows that closely match an earlier row but are not
+    exact duplicates of one.
+    """
+
+    def __init__(self, near_duplicates: bool = False, num_perm: int = 64, bands: int = 8, seed: int = 0):
+        self.rows = 0
+        self.missing_values: dict = {}
+        self.dtypes: dict = {}
+        self.memory_bytes = 0
+        self.row_hashes = HashSet()
+        self.near_duplicate_rows = 0
+        self.lsh = MinHashLSH(num_perm, bands, seed) if near_duplicates else None
+
+    def update(self, chunk: pd.DataFrame) -> "DataQualityScanner":
+        self.rows += len(chunk)
+        self.memory_bytes += memory_usage_bytes(chunk)
+
+        for col, n_missing in chunk.isna().sum().items():
+            self.missing_values[col] = self.missing_values.get(col, 0) + int(n_missing)
+
+        for col, dtype in chunk.dtypes.items():
+            self.dtypes.setdefault(col, str(dtype))
+
+        if self.lsh is None:
+            self.row_hashes.add(row_hashes(chunk))
+            return self
+
+        for start in range(0, len(chunk), MINHASH_BLOCK_ROWS):
+            block = chunk.iloc[start:start + MINHASH_BLOCK_ROWS]
+            cells = np.column_stack(
+                [column_hashes(block.iloc[:, i]) for i in range(block.shape[1])]
+            ) if block.shape[1] else np.zeros((len(block), 0), dtype=np.uint64)
+
+            h = np.full(len(block), np.uint64(block.shape[1]), dtype=np.uint64)
+            for i in range(cells.shape[1]):
+                h = splitmix64(h ^ cells[:, i])
+
+            first = self.row_hashes.add(h)
+            near = self.lsh.update(cells)
+            self.near_duplicate_rows += int(np.count_nonzero(near & first))
+
+        return self
+
+    def to_report(self) -> dict:
+        report = {
+            "rows": self.rows,
+            "columns": len(self.dtypes),
+            "missing_values": dict(self.missing_values),
+            "duplicate_rows": self.rows - len(self.row_hashes),
+            "dtypes": dict(self.dtypes),
+            "memory_bytes": self.memory_bytes,
+        }
+        if self.lsh is not None:
+            report["near_duplicate_rows"] = self.near_duplicate_rows
+        return report
+
+
+def scan_quality(df: pd.DataFrame, near_duplicates: bool = False) -> dict:
+    return DataQualityScanner(near_duplicates=near_duplicates).update(df).to_report()
@@ -0,0 +1,184 @@
+# registry.py
+"""
+Persisted model artifacts for DANY.
+
+An artifact is a directory holding the best pipeline (joblib, stored
+uncompressed so large arrays such as forest nodes can be memory-mapped)
+and a metadata.json with the input schema, metrics and a fingerprint of
+the training data. Scoring jobs load it instead of retraining.
+"""
+
+import json
+import os
+import platform
+from datetime import datetime, timezone
+
+import joblib
+import numpy as np
+import pandas as pd
+import sklearn
+
+from dany_core.cache import frame_fingerprint
+from dany_core.scoring import predict_batch
+
+PIPELINE_FILE = "pipeline.joblib"
+METADATA_FILE = "metadata.json"
+
+
+def save_model_artifact(
+    modeling_results: dict,
+    artifact_dir: str,
+    training_df: pd.DataFrame | None = None,
+    target_col: str | None = None,
+) -> str:
+    """
+    Persist the best pipeline of a train_and_evaluate result.
+    Returns the artifact directory.
+    """
+    pipeline = modeling_results.get("best_pipeline")
+    if pipeline is None:
+        raise ValueError("Modeling results contain no trained pipeline to save")
+
+    os.makedirs(artifact_dir, exist_ok=True)
+    joblib.dump(pipeline, os.path.join(artifact_dir, PIPELINE_FILE))
+
+    best = modeling_results.get("best_model_summary", {})
+    metadata = {
+        "task_type": modeling_results.get("task_type"),
+        "model_name": best.get("model_name"),
+        "metrics": best.get("metrics", {}),
+        "target_col": target_col,
+        "schema": _input_schema(pipeline, training_df, target_col),
+        "training_fingerprint": (
+            frame_fingerprint(training_df) if training_df is not None else None
+        ),
+        "training_rows": len(training_df) if training_df is not None else None,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "versions": {
+            "python": platform.python_version(),
+            "sklearn": sklearn.__version__,
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+        },
+    }
+
+    with open(os.path.join(artifact_dir, METADATA_FILE), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, default=_json_default)
+
+    return artifact_dir
+
+
+def load_model_artifact(artifact_dir: str, mmap_mode: str | None = "r"):
+    """
+    Load (pipeline, metadata). With mmap_mode="r" large arrays are
+    memory-mapped from disk instead of read into memory.
+    """
+    with open(os.path.join(artifact_dir, METADATA_FILE), encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    pipeline = joblib.load(os.path.join(artifact_dir, PIPELINE_FILE), mmap_mode=mmap_mode)
+    return pipeline, metadata
+
+
+def load_and_predict(artifact_dir: str, df: pd.DataFrame, mmap_mode: str | None = "r") -> dict:
+    """
+    Score `df` with a persisted pipeline, without retraining.
+    Returns NumPy arrays: predictions and (classification) confidence.
+    """
+    pipeline, metadata = load_model_artifact(artifact_dir, mmap_mode=mmap_mode)
+    check_schema(metadata, df)
+
+    scored = predict_batch(pipeline, df, metadata["task_type"], include_probabilities=False)
+    return {
+        "predictions": scored["predictions"],
+        "confidence": scored["confidence"],
+        "model_name": metadata.get("model_name"),
+    }
+
+
+def check_schema(metadata: dict, df: pd.DataFrame) -> None:
+    expected = metadata.get("schema", {}).get("columns") or []
+    missing = [col for col in expected if col not in df.columns]
+
+    if missing:
+        raise ValueError(f"Input is missing columns required by the model: {missing}")
+
+
+class ModelRegistry:
+    """
+    Versioned artifact store: <root>/<name>/v<N>/.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def versions(self, name: str) -> list[int]:
+        model_dir = os.path.join(self.root, name)
+        if not os.path.isdir(model_dir):
+            return []
+
+        return sorted(
+            int(entry[1:])
+            for entry in os.listdir(model_dir)
+            if entry.startswith("v") and entry[1:].isdigit()
+        )
+
+    def path(self, name: str, version: int | None = None) -> str:
+        if version is None:
+            versions = self.versions(name)
+            if not versions:
+                raise FileNotFoundError(f"No registered versions for model '{name}'")
+            version = versions[-1]
+
+        return os.path.join(self.root, name, f"v{version}")
+
+    def register(
+        self,
+        name: str,
+        modeling_results: dict,
+        training_df: pd.DataFrame | None = None,
+        target_col: str | None = None,
+    ) -> str:
+        next_version = (self.versions(name) or [0])[-1] + 1
+        return save_model_artifact(
+            modeling_results,
+            os.path.join(self.root, name, f"v{next_version}"),
+            training_df=training_df,
+            target_col=target_col,
+        )
+
+    def load(self, name: str, version: int | None = None, mmap_mode: str | None = "r"):
+        return load_model_artifact(self.path(name, version), mmap_mode=mmap_mode)
+
+    def load_and_predict(
+        self, name: str, df: pd.DataFrame, version: int | None = None, mmap_mode: str | None = "r"
+    ) -> dict:
+        return load_and_predict(self.path(name, version), df, mmap_mode=mmap_mode)
+
+
+# =========================================================
+# Helpers
+# =========================================================
+
+def _input_schema(pipeline, training_df, target_col) -> dict:
+    columns = getattr(pipeline, "feature_names_in_", None)
+    if columns is None and training_df is not None:
+        columns = [c for c in training_df.columns if c != target_col]
+
+    columns = [str(c) for c in columns] if columns is not None else []
+
+    dtypes = {}
+    if training_df is not None:
+        dtypes = {
+            col: str(training_df[col].dtype)
+            for col in columns
+            if col in training_df.columns
+        }
+
+    return {"columns": columns, "dtypes": dtypes}
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
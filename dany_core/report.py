@@ -1,13 +1,18 @@
 import pandas as pd
 
-def basic_data_report(df: pd.DataFrame):
-    missing_values = {col: int(df[col].isna().sum()) for col in df.columns}
-    dtypes = {col: str(df[col].dtype) for col in df.columns}
-    duplicate_rows = int(df.duplicated().sum())
-    return {
-        "rows": df.shape[0],
-        "columns": df.shape[1],
-        "missing_values": missing_values,
-        "duplicate_rows": duplicate_rows,
-        "dtypes": dtypes
-    }
+from dany_core.quality import DataQualityScanner
+
+
+def basic_data_report(df: pd.DataFrame, near_duplicates: bool = False):
+    """
+    Rows, missing values, duplicate rows, dtypes and memory of `df`.
+    Duplicates are counted from vectorized 64-bit row hashes.
+    """
+    return DataQualityScanner(near_duplicates=near_duplicates).update(df).to_report()
+
+
+class DataReportAccumulator(DataQualityScanner):
+    """
+    Chunk-wise version of basic_data_report.
+    Row hashes live in a compact sorted-array set, 8 bytes per distinct row.
+    """
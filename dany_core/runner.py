@@ -1,8 +1,14 @@
 
+from dany_core.utils.memory import copy_on_write
 from dany_core.utils.timing import StageTimer
 
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterator
+import asyncio
+import functools
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 import pandas as pd
 
 MAX_ROWS = 200_000
@@ -10,6 +16,36 @@ MAX_COLS = 500
 EDA_SAMPLE_THRESHOLD = 20_000
 RANDOM_STATE = 42
 
+# Streaming mode: rows kept in memory for modeling, whatever the input size
+MODELING_SAMPLE_SIZE = 100_000
+
+# Core budget for model training (-1 = all cores)
+MODELING_N_JOBS = -1
+
+# Core budget for column-sharded feature profiling (-1 = all cores)
+EDA_N_JOBS = -1
+
+# Share of the cores profiling gets while it runs alongside modeling
+EDA_CORE_SHARE = 0.25
+
+# "full" trains every candidate on all rows, "halving" drops losers early
+MODEL_SELECTION = "full"
+
+# "holdout" scores on one 80/20 split, "cv" on repeated k-fold CV
+MODEL_EVALUATION = "holdout"
+
+# Estimated single-core seconds of model fitting per run (None = no
+# limit); zoo candidates that do not fit are skipped, cheapest kept
+MODEL_TIME_BUDGET_SEC = None
+
+# Convert the cleaned frame of in-memory runs to compact dtypes
+# (lossless) before EDA and modeling. Cleaning sees the input as loaded.
+COMPACT_DTYPES = True
+
+# "full" profiles every row, "adaptive" grows a target-stratified sample
+# until every statistic's confidence interval is tight
+EDA_SAMPLING = "full"
+
 
 
 
@@ -19,27 +55,162 @@ from dany_core.targets.validators import validate_target
 
 from dany_core.cleaning import run_cleaning
 from dany_core.eda import (
-    profile_numerical_columns,
-    profile_categorical_columns,
+    CategoricalProfileState,
+    NumericalProfileState,
     profile_target,
 )
-from dany_core.modeling import train_and_evaluate  # your modeling.py function
+from dany_core.cache import StageCache, code_version, frame_fingerprint
+from dany_core.dag import Stage, StageGraph
+from dany_core.dtypes import memory_report
+from dany_core.ingestion import optimize_dtypes
+from dany_core.insights import evaluate_trust_risks
+from dany_core.jobs import PipelineCancelled
+from dany_core.model_zoo import MODEL_ZOO, select_models
+from dany_core.modeling import _resolve_core_budget, train_and_evaluate  # your modeling.py function
+from dany_core.parallel_eda import profile_columns
+from dany_core.report import DataReportAccumulator, basic_data_report
+from dany_core.sampling import adaptive_profiles
 from dany_core.reports.html_report import generate_html_report
+from dany_core.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    ReservoirSampler,
+    iter_chunks,
+    merge_cleaning_reports,
+)
 
 
 def run_dany_pipeline(
-    dataframe: pd.DataFrame,
-    target_spec: TargetSpec
+    dataframe,
+    target_spec: TargetSpec,
+    chunksize: int | None = None,
+    cache: StageCache | None = None,
+    track_memory: bool = False,
+    timer: StageTimer | None = None,
+    progress: Callable[[dict], None] | None = None,
+    cancel: threading.Event | None = None,
 ) -> Dict[str, Any]:
+    """
+    Run the full DANY pipeline.
+
+    `dataframe` is normally an in-memory DataFrame. A CSV/Parquet path or an
+    iterable of DataFrame chunks (or an explicit `chunksize`) switches to
+    streaming mode, which lifts MAX_ROWS and works in bounded memory.
+
+    With a `cache`, stage outputs of in-memory runs are reused across calls:
+    cleaning and feature profiles when only the target changes, modeling
+    when nothing changed.
+
+    In-memory runs execute as a stage DAG (see _build_graph): the data
+    report runs alongside validation and cleaning, EDA alongside
+    modeling. results["timing"] adds the elapsed time and the critical
+    path next to the summed stage times.
+
+    Stages share dataframe buffers through pandas copy-on-write. With
+    `track_memory`, results["timing"]["memory"] reports the peak traced
+    allocation of every stage. Pass a `timer` to profile selected spans or
+    to export the run afterwards (StageTimer.to_json / to_chrome_trace).
+
+    `progress` receives the timer's span events (StageTimer.add_listener)
+    as stages start and finish. Raising PipelineCancelled from it stops
+    the run at that stage boundary with status "cancelled". Setting
+    `cancel` (a threading.Event) also stops modeling at its next finished
+    fit; either way the run returns only once no stage is running.
+
+    iter_dany_pipeline runs the same pipeline but yields every stage's
+    results as soon as they are ready.
+    """
+
+    for event in iter_dany_pipeline(
+        dataframe, target_spec, chunksize, cache, track_memory, timer, progress, cancel
+    ):
+        pass
+
+    return event["result"]
+
+
+def iter_dany_pipeline(
+    dataframe,
+    target_spec: TargetSpec,
+    chunksize: int | None = None,
+    cache: StageCache | None = None,
+    track_memory: bool = False,
+    timer: StageTimer | None = None,
+    progress: Callable[[dict], None] | None = None,
+    cancel: threading.Event | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Generator form of run_dany_pipeline (same arguments).
+
+    Yields {"stage", "result", "timing"} events as stages finish:
+    target_validation, data_report, cleaning, profiles, one "model" event
+    per candidate as soon as it is scored, modeling (with "trust_risks")
+    and report_generation. Independent stages run concurrently, so events
+    come in completion order. The last event is always
+    {"stage": "pipeline", "result": <the run_dany_pipeline dict>}.
+
+    Closing the generator (e.g. breaking out of the loop after a failed
+    target validation) skips the remaining stages; it returns once the
+    running ones have stopped (modeling after its current fits).
+    """
+
+    if timer is None:
+        timer = StageTimer(track_memory=track_memory)
+    if progress is not None:
+        timer.add_listener(progress)
+
+    try:
+        yield from _iter_pipeline(dataframe, target_spec, chunksize, cache, timer, cancel)
+    finally:
+        timer.close()
+
+
+async def aiter_dany_pipeline(*args, **kwargs):
+    """
+    Async iterator over the iter_dany_pipeline events. Stages run on one
+    worker thread (the timer's span stacks are per thread), so the event
+    loop stays free.
+    """
+    stages = iter_dany_pipeline(*args, **kwargs)
+    loop = asyncio.get_running_loop()
+    done = object()
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dany-pipeline") as executor:
+        try:
+            while True:
+                event = await loop.run_in_executor(executor, next, stages, done)
+                if event is done:
+                    return
+                yield event
+        finally:
+            await loop.run_in_executor(executor, stages.close)
+
+
+def _iter_pipeline(
+    dataframe,
+    target_spec: TargetSpec,
+    chunksize: int | None,
+    cache: StageCache | None,
+    timer: StageTimer,
+    cancel: threading.Event | None = None,
+) -> Iterator[Dict[str, Any]]:
 
     results: Dict[str, Any] = {
         "status": "started",
         "validation_passed": False,
     }
 
-    timer = StageTimer()
-
     try:
+        if chunksize is not None or not isinstance(dataframe, pd.DataFrame):
+            yield from _iter_streaming_pipeline(
+                dataframe,
+                target_spec,
+                results,
+                timer,
+                chunksize or DEFAULT_CHUNK_SIZE,
+                cancel,
+            )
+            return
+
         # ======================================================
         # DATASET SAFETY CHECK
         # ======================================================
@@ -49,90 +220,534 @@ def run_dany_pipeline(
         if dataframe.shape[1] > MAX_COLS:
             raise ValueError(f"Dataset exceeds maximum column limit ({MAX_COLS})")
 
-        # ======================================================
-        # STEP 0 — TARGET VALIDATION
-        # ======================================================
-        timer.start("target_validation")
-        target_validation = validate_target(dataframe, target_spec)
-        timer.stop("target_validation")
-
-        results["target_validation"] = target_validation
+        graph = _build_graph(target_spec, cache, timer, results)
+        values = {"dataframe": dataframe}
+        if cache is None:
+            values["fingerprint"] = None
+        else:
+            results["cache"] = {"hits": [], "misses": []}
 
-        if not target_validation.get("valid", False):
-            results["status"] = "failed"
-            results["reason"] = "Target validation failed"
-            results["timing"] = timer.summary()
-            return results
+        # Stages run as soon as their inputs are ready; results are stored
+        # (and reported) in completion order.
+        with closing(graph.iter_run(values, timer=timer, cancel=cancel)) as stages:
+            for item in stages:
+                stage = item["stage"]
+                if "event" in item:
+                    yield item["event"]
+                    continue
 
-        results["validation_passed"] = True
+                outputs = item["outputs"]
 
-        # ======================================================
-        # STEP 1 — CLEANING
-        # ======================================================
-        timer.start("cleaning")
-        cleaned_df, cleaning_report = run_cleaning(dataframe)
-        timer.stop("cleaning")
+                if stage == "compact_dtypes":
+                    results["memory"] = outputs["memory"]
 
-        results["cleaning"] = cleaning_report
+                elif stage == "target_validation":
+                    target_validation = outputs["target_validation"]
+                    results["target_validation"] = target_validation
+                    yield _stage_event(timer, "target_validation", target_validation)
 
-        # ======================================================
-        # STEP 2 — EDA (with optional sampling)
-        # ======================================================
-        timer.start("eda")
+                    if not target_validation.get("valid", False):
+                        results["status"] = "failed"
+                        results["reason"] = "Target validation failed"
+                        break
 
-        if len(cleaned_df) > EDA_SAMPLE_THRESHOLD:
-            eda_df = cleaned_df.sample(
-                n=EDA_SAMPLE_THRESHOLD,
-                random_state=RANDOM_STATE
-            )
-        else:
-            eda_df = cleaned_df
+                    results["validation_passed"] = True
 
-        numerical_profiles = profile_numerical_columns(eda_df, target_spec.name)
-        categorical_profiles = profile_categorical_columns(eda_df)
-        target_profile = profile_target(eda_df, target_spec.name)
+                elif stage == "data_report":
+                    results["data_report"] = outputs["data_report"]
+                    yield _stage_event(timer, "data_report", outputs["data_report"])
 
-        timer.stop("eda")
+                elif stage == "cleaning":
+                    results["cleaning"] = outputs["cleaning_report"]
+                    yield _stage_event(timer, "cleaning", outputs["cleaning_report"])
 
-        results["profiles"] = {
-            "numerical": numerical_profiles,
-            "categorical": categorical_profiles,
-            "target": target_profile,
-        }
+                elif stage == "eda":
+                    results["profiles"] = outputs["profiles"]
+                    if outputs["eda_sampling"] is not None:
+                        results["eda_sampling"] = outputs["eda_sampling"]
+                    yield _stage_event(timer, "profiles", outputs["profiles"], span="eda")
 
-        # ======================================================
-        # STEP 3 — MODELING
-        # ======================================================
-        timer.start("modeling")
-        modeling_results = train_and_evaluate(
-            cleaned_df,
-            target_spec.name
-        )
-        timer.stop("modeling")
+                elif stage == "modeling":
+                    results["modeling"] = outputs["modeling"]
+                    yield _modeling_event(timer, outputs["modeling"])
 
-        results["modeling"] = modeling_results
+                elif stage == "report_generation":
+                    results["report_path"] = outputs["report_path"]
+                    yield _stage_event(timer, "report_generation", outputs["report_path"])
 
         # ======================================================
-        # STEP 4 — REPORT GENERATION
+        # DONE
         # ======================================================
-        timer.start("report_generation")
-        report_path = generate_html_report(results)
-        timer.stop("report_generation")
+        if results["validation_passed"]:
+            results["status"] = "completed"
+        results["timing"] = _graph_timing(graph, timer)
 
-        results["report_path"] = report_path
+        yield _pipeline_event(results)
 
-        # ======================================================
-        # DONE
-        # ======================================================
-        results["status"] = "completed"
+    except PipelineCancelled:
+        results["status"] = "cancelled"
         results["timing"] = timer.summary()
-
-        return results
+        yield _pipeline_event(results)
 
     except Exception as e:
         results["status"] = "error"
         results["error"] = str(e)
         results["trace"] = traceback.format_exc()
         results["timing"] = timer.summary()
-        return results
+        yield _pipeline_event(results)
+
+
+def pipeline_stages() -> tuple:
+    """
+    Names of the timed (top-level) stages of an in-memory run, in graph
+    order; JobQueue measures progress against them.
+    """
+    graph = _build_graph(None, None, StageTimer(), {})
+    return tuple(name for name in graph.order if graph.stages[name].timed)
+
+
+def _build_graph(target_spec: TargetSpec, cache: StageCache | None, timer: StageTimer, results: dict) -> StageGraph:
+    """
+    Stage DAG of an in-memory run:
+
+        dataframe -> target_validation
+                  -> data_report
+                  -> cleaning (after validation) -> compact_dtypes
+                                                      -> eda        -> report_generation
+                                                      -> modeling   ->
+    """
+    spec_params = _target_spec_params(target_spec)
+
+    # eda and modeling run side by side, so they split the cores
+    eda_jobs, modeling_jobs = _split_cores(EDA_N_JOBS, MODELING_N_JOBS)
+
+    def compact(uncompacted_df):
+        compact_df = optimize_dtypes(uncompacted_df)
+        return compact_df, memory_report(uncompacted_df, compact_df)
+
+    def validate(dataframe, fingerprint):
+        return _cached_stage(
+            cache, results, "target_validation", fingerprint,
+            spec_params, code_version(validate_target),
+            lambda: validate_target(dataframe, target_spec),
+        )
+
+    def data_report(dataframe, fingerprint):
+        return _cached_stage(
+            cache, results, "data_report", fingerprint,
+            {}, code_version(basic_data_report),
+            lambda: basic_data_report(dataframe),
+        )
+
+    def clean(dataframe, fingerprint):
+        return _cached_stage(
+            cache, results, "cleaning", fingerprint,
+            {}, code_version(run_cleaning),
+            lambda: run_cleaning(dataframe),
+        )
 
+    def eda(cleaned_df, fingerprint):
+        # Profiles are built from single-pass sketches, so by default they
+        # cover the full cleaned dataset instead of a sample. Feature
+        # profiles do not depend on the target, so they are cached
+        # without it and the target column is dropped afterwards.
+        # Adaptive sampling stratifies on the target, so it is keyed on it.
+        if EDA_SAMPLING == "adaptive":
+            feature_profiles = _cached_stage(
+                cache, results, "feature_profiles", fingerprint,
+                {"sampling": "adaptive", "target": target_spec.name},
+                code_version(run_cleaning, optimize_dtypes, adaptive_profiles, NumericalProfileState),
+                lambda: adaptive_profiles(
+                    cleaned_df, target_spec.name, random_state=RANDOM_STATE
+                ),
+            )
+        else:
+            feature_profiles = _cached_stage(
+                cache, results, "feature_profiles", fingerprint,
+                {}, code_version(
+                    run_cleaning, optimize_dtypes, profile_columns, NumericalProfileState, CategoricalProfileState
+                ),
+                lambda: profile_columns(cleaned_df, n_jobs=eda_jobs),
+            )
+
+        profiles = {
+            "numerical": {
+                col: profile
+                for col, profile in feature_profiles["numerical"].items()
+                if col != target_spec.name
+            },
+            "categorical": feature_profiles["categorical"],
+            "target": (
+                feature_profiles.get("target")
+                or profile_target(cleaned_df, target_spec.name)
+            ),
+        }
+        return profiles, feature_profiles.get("sampling")
+
+    def modeling(cleaned_df, fingerprint, emit, cancel):
+        modeling_results = _report_models(
+            lambda on_result: _cached_stage(
+                cache, results, "modeling", fingerprint,
+                {
+                    **spec_params,
+                    "selection": MODEL_SELECTION,
+                    "evaluation": MODEL_EVALUATION,
+                    "time_budget_sec": MODEL_TIME_BUDGET_SEC,
+                    # register_model() changes the candidates
+                    "models": sorted(MODEL_ZOO),
+                },
+                code_version(run_cleaning, optimize_dtypes, train_and_evaluate, select_models),
+                lambda: train_and_evaluate(
+                    cleaned_df,
+                    target_spec.name,
+                    n_jobs=modeling_jobs,
+                    selection=MODEL_SELECTION,
+                    evaluation=MODEL_EVALUATION,
+                    cache=cache,
+                    on_result=on_result,
+                    time_budget_sec=MODEL_TIME_BUDGET_SEC,
+                    cancel=cancel,
+                ),
+            ),
+            emit,
+        )
+        if "modeling" not in results.get("cache", {}).get("hits", []):
+            _record_model_spans(timer, modeling_results)
+        return modeling_results
+
+    if COMPACT_DTYPES:
+        compact_stage = Stage(
+            "compact_dtypes", compact, ("uncompacted_df",), ("cleaned_df", "memory"), rows="uncompacted_df",
+        )
+    else:
+        compact_stage = Stage(
+            "keep_dtypes", lambda uncompacted_df: uncompacted_df, ("uncompacted_df",), ("cleaned_df",),
+            timed=False,
+        )
+
+    stages = []
+    if cache is not None:
+        stages.append(Stage(
+            "fingerprint", lambda dataframe: frame_fingerprint(dataframe), ("dataframe",), ("fingerprint",),
+            timed=False,
+        ))
+
+    stages += [
+        Stage("target_validation", validate, ("dataframe", "fingerprint"), ("target_validation",), rows="dataframe"),
+        Stage("data_report", data_report, ("dataframe", "fingerprint"), ("data_report",), rows="dataframe"),
+        Stage(
+            "cleaning", clean, ("dataframe", "fingerprint"), ("uncompacted_df", "cleaning_report"),
+            after=("target_validation",), rows="dataframe",
+        ),
+        compact_stage,
+        Stage("eda", eda, ("cleaned_df", "fingerprint"), ("profiles", "eda_sampling"), rows="cleaned_df"),
+        Stage(
+            "modeling", modeling, ("cleaned_df", "fingerprint"), ("modeling",),
+            rows="cleaned_df", emits=True, cancellable=True,
+        ),
+        # The report reads `results`, which holds every upstream output
+        # by the time these stages have finished.
+        Stage(
+            "report_generation", lambda: generate_html_report(results), (), ("report_path",),
+            after=("data_report", "cleaning", "eda", "modeling"),
+        ),
+    ]
+    return StageGraph(_on_copy_on_write(stages))
+
+
+def _split_cores(eda_n_jobs, modeling_n_jobs) -> tuple:
+    """
+    Core budgets (eda, modeling) for the two concurrent stages; together
+    they stay within the larger of the two configured budgets.
+    """
+    eda = _resolve_core_budget(eda_n_jobs)
+    modeling = _resolve_core_budget(modeling_n_jobs)
+    total = max(eda, modeling)
+
+    # EDA_CORE_SHARE at least, more if modeling leaves cores unused
+    eda_share = min(eda, max(1, round(total * EDA_CORE_SHARE), total - modeling))
+    return eda_share, max(1, min(modeling, total - eda_share))
+
+
+def _on_copy_on_write(stages: list) -> list:
+    """
+    Run each stage's func under copy_on_write(). The option is only on
+    while stage work runs, not while the caller handles yielded events.
+    """
+    for stage in stages:
+        stage.func = _copy_on_write_func(stage.func)
+    return stages
+
+
+def _copy_on_write_func(func):
+    @functools.wraps(func)
+    def run(**kwargs):
+        with copy_on_write():
+            return func(**kwargs)
+    return run
+
+
+def _graph_timing(graph: StageGraph, timer: StageTimer) -> dict:
+    timing = timer.summary()
+    timing["critical_path"] = graph.critical_path(timing["stages"])
+    return timing
+
+
+def _target_spec_params(target_spec: TargetSpec) -> dict:
+    return dict(getattr(target_spec, "__dict__", {})) or {"spec": repr(target_spec)}
+
+
+def _record_model_spans(timer: StageTimer, modeling_results: dict) -> None:
+    """
+    Nest each candidate's fit / predict (timed inside the worker
+    processes) under the modeling span.
+    """
+    for r in modeling_results.get("all_models_results", []):
+        timing = r.get("timing") or {}
+        started_at = timing.get("started_at")
+        if started_at is None:
+            continue
+
+        name = r["model_name"]
+        fit_time = timing.get("fit_time_sec") or timing["wall_time_sec"]
+        timer.record(
+            f"fit:{name}", fit_time, timing.get("cpu_time_sec"),
+            rows=timing.get("train_rows"), parent="modeling", started_at=started_at,
+        )
+        if timing.get("predict_time_sec") is not None:
+            timer.record(
+                f"predict:{name}", timing["predict_time_sec"],
+                rows=timing.get("test_rows"), parent="modeling",
+                started_at=started_at + fit_time,
+            )
+
+
+def _stage_event(timer: StageTimer, stage: str, result, span: str | None = None) -> dict:
+    return {
+        "stage": stage,
+        "result": result,
+        "timing": timer.summary()["details"].get(span or stage),
+    }
+
+
+def _pipeline_event(results: dict) -> dict:
+    return {"stage": "pipeline", "result": results, "timing": results.get("timing")}
+
+
+def _modeling_event(timer: StageTimer, modeling_results: dict) -> dict:
+    event = _stage_event(timer, "modeling", modeling_results)
+    event["trust_risks"] = evaluate_trust_risks(modeling_results)
+    return event
+
+
+def _report_models(compute, emit):
+    """
+    Run `compute(on_result)` (modeling), emitting a "model" event for
+    every candidate passed to on_result and then for any candidate not
+    reported that way (e.g. on a cache hit). Returns compute's value.
+    """
+    reported = set()
+
+    def on_result(r):
+        reported.add(r["model_name"])
+        emit(_model_event(r))
+
+    modeling_results = compute(on_result)
+
+    for r in modeling_results.get("all_models_results", []):
+        if r["model_name"] not in reported:
+            emit(_model_event(r))
+
+    return modeling_results
+
+
+def _model_event(result: dict) -> dict:
+    # The fitted pipeline stays in the modeling results
+    return {
+        "stage": "model",
+        "result": {k: v for k, v in result.items() if k != "pipeline"},
+        "timing": result.get("timing"),
+    }
+
+
+def _cached_stage(cache, results, stage, fingerprint, params, version, compute):
+    """
+    Run `compute`, or reuse its stored output when a cache is configured.
+    """
+    if cache is None:
+        return compute()
+
+    key = StageCache.make_key(stage, fingerprint, params, version)
+    value, hit = cache.get_or_compute(key, compute)
+    results["cache"]["hits" if hit else "misses"].append(stage)
+    return value
+
+
+def _iter_streaming_pipeline(
+    source,
+    target_spec: TargetSpec,
+    results: Dict[str, Any],
+    timer: StageTimer,
+    chunksize: int,
+    cancel: threading.Event | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Streaming variant of run_dany_pipeline. Stage events are emitted once
+    the single pass over the input is done.
+
+    Target validation, cleaning, the data report and feature profiling run
+    on every chunk. The target profile and modeling work on reservoir
+    samples, so memory is bounded by EDA_SAMPLE_THRESHOLD +
+    MODELING_SAMPLE_SIZE rows (plus fixed-size sketches) regardless of
+    input size.
+    """
+
+    stratify_col = (
+        target_spec.name if target_spec.task_type == "classification" else None
+    )
+
+    data_report = DataReportAccumulator()
+    numerical_state = NumericalProfileState()
+    categorical_state = CategoricalProfileState()
+    eda_sampler = ReservoirSampler(
+        EDA_SAMPLE_THRESHOLD, random_state=RANDOM_STATE
+    )
+    model_sampler = ReservoirSampler(
+        MODELING_SAMPLE_SIZE,
+        stratify_col=stratify_col,
+        random_state=RANDOM_STATE,
+    )
+    cleaning_reports = []
+    target_validation = None
+    n_chunks = 0
+
+    # ======================================================
+    # SINGLE PASS OVER THE INPUT
+    # ======================================================
+    for chunk_idx, chunk in enumerate(iter_chunks(source, chunksize)):
+        n_chunks += 1
+
+        if chunk.shape[1] > MAX_COLS:
+            raise ValueError(f"Dataset exceeds maximum column limit ({MAX_COLS})")
+
+        timer.start("target_validation", rows=len(chunk))
+        with copy_on_write():
+            chunk_validation = validate_target(chunk, target_spec)
+        timer.stop("target_validation")
+
+        if not chunk_validation.get("valid", False):
+            results["target_validation"] = {**chunk_validation, "chunk": chunk_idx}
+            results["status"] = "failed"
+            results["reason"] = f"Target validation failed in chunk {chunk_idx}"
+            results["timing"] = timer.summary()
+            yield _stage_event(timer, "target_validation", results["target_validation"])
+            yield _pipeline_event(results)
+            return
+
+        if target_validation is None:
+            target_validation = chunk_validation
+
+        with copy_on_write():
+            timer.start("data_report", rows=len(chunk))
+            data_report.update(chunk)
+            timer.stop("data_report")
+
+            timer.start("cleaning", rows=len(chunk))
+            cleaned_chunk, cleaning_report = run_cleaning(chunk)
+            timer.stop("cleaning")
+
+            cleaning_reports.append(cleaning_report)
+
+            timer.start("eda", rows=len(chunk))
+            numerical_state.update(cleaned_chunk, exclude=(target_spec.name,))
+            categorical_state.update(cleaned_chunk)
+            timer.stop("eda")
+
+            timer.start("sampling", rows=len(chunk))
+            eda_sampler.update(cleaned_chunk)
+            model_sampler.update(cleaned_chunk)
+            timer.stop("sampling")
+
+    if target_validation is None:
+        raise ValueError("Streaming input contained no data")
+
+    results["target_validation"] = {**target_validation, "chunks_validated": n_chunks}
+    results["validation_passed"] = True
+    results["data_report"] = data_report.to_report()
+    results["cleaning"] = merge_cleaning_reports(cleaning_reports)
+    results["streaming"] = {
+        "chunks": n_chunks,
+        "chunksize": chunksize,
+        "rows": data_report.rows,
+    }
+    yield _stage_event(timer, "target_validation", results["target_validation"])
+    yield _stage_event(timer, "data_report", results["data_report"])
+    yield _stage_event(timer, "cleaning", results["cleaning"])
+
+    # ======================================================
+    # EDA (features: full data, target: uniform reservoir sample)
+    # and MODELING (on a stratified / reservoir sample) run
+    # concurrently; the report follows both.
+    # ======================================================
+    def eda(eda_sample):
+        return {
+            "numerical": numerical_state.to_profiles(),
+            "categorical": categorical_state.to_profiles(),
+            "target": profile_target(eda_sample, target_spec.name),
+        }
+
+    def modeling(model_df, emit, cancel):
+        modeling_results = _report_models(
+            lambda on_result: train_and_evaluate(
+                model_df,
+                target_spec.name,
+                n_jobs=MODELING_N_JOBS,
+                selection=MODEL_SELECTION,
+                evaluation=MODEL_EVALUATION,
+                on_result=on_result,
+                time_budget_sec=MODEL_TIME_BUDGET_SEC,
+                cancel=cancel,
+            ),
+            emit,
+        )
+        _record_model_spans(timer, modeling_results)
+
+        modeling_results["sample"] = {
+            "rows": len(model_df),
+            "source_rows": model_sampler.rows_seen,
+            "strategy": "stratified" if stratify_col else "reservoir",
+        }
+        return modeling_results
+
+    graph = StageGraph(_on_copy_on_write([
+        Stage("eda", eda, ("eda_sample",), ("profiles",)),
+        Stage(
+            "modeling", modeling, ("model_df",), ("modeling",),
+            rows="model_df", emits=True, cancellable=True,
+        ),
+        Stage(
+            "report_generation", lambda: generate_html_report(results), (), ("report_path",),
+            after=("eda", "modeling"),
+        ),
+    ]))
+    values = {"eda_sample": eda_sampler.sample(), "model_df": model_sampler.sample()}
+
+    with closing(graph.iter_run(values, timer=timer, cancel=cancel)) as stages:
+        for item in stages:
+            stage = item["stage"]
+            if "event" in item:
+                yield item["event"]
+            elif stage == "eda":
+                results["profiles"] = item["outputs"]["profiles"]
+                yield _stage_event(timer, "profiles", results["profiles"], span="eda")
+            elif stage == "modeling":
+                results["modeling"] = item["outputs"]["modeling"]
+                yield _modeling_event(timer, results["modeling"])
+            elif stage == "report_generation":
+                results["report_path"] = item["outputs"]["report_path"]
+                yield _stage_event(timer, "report_generation", results["report_path"])
+
+    results["status"] = "completed"
+    results["timing"] = _graph_timing(graph, timer)
+
+    yield _pipeline_event(results)
@@ -0,0 +1,278 @@
+# sampling.py
+"""
+Adaptive sampling for EDA.
+
+Rows are visited in a stratified random order, in which every prefix
+holds each target class in proportion. Feature profiles are built on a
+growing prefix, and growth stops once every statistic's confidence
+interval is tight enough. An interval is tight when it is narrower than
+its tolerance, or when it already settles the matching rule in
+generate_insights (e.g. |skewness| > 2).
+
+Confidence intervals come from a grouped jackknife over mergeable moment
+sketches (mean, std, skewness) and from the Wilson interval (top_ratio),
+with a finite-population correction. A sample covering every row
+therefore has zero-width error bars.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from dany_core.dtypes import is_categorical_kind, numeric_columns
+from dany_core.eda import CategoricalProfileState, NumericalProfileState, profile_target
+from dany_core.sketches import MomentSketch
+
+INITIAL_ROWS = 2_000
+GROWTH_FACTOR = 2.0
+JACKKNIFE_GROUPS = 10
+CONFIDENCE = 0.95
+
+# Tolerances: mean and std relative to the column's std; skewness and
+# top_ratio absolute.
+REL_TOL = 0.05
+SKEW_TOL = 0.1
+RATIO_TOL = 0.01
+
+# Decision thresholds of generate_insights; an interval on the far side
+# of one of these needs no further rows.
+SKEW_INSIGHT_THRESHOLD = 2.0
+TOP_RATIO_INSIGHT_THRESHOLD = 0.95
+
+
+def stratified_order(n_rows: int, strata=None, random_state=None) -> np.ndarray:
+    """
+    Random permutation of range(n_rows) in which every prefix is
+    proportionally stratified (to within one row per stratum).
+    """
+    rng = np.random.default_rng(random_state)
+    if strata is None:
+        return rng.permutation(n_rows)
+
+    codes, _ = pd.factorize(pd.Series(strata), use_na_sentinel=False)
+    sizes = np.bincount(codes)
+
+    # Rank of each row inside its stratum, in random order
+    shuffled = rng.permutation(n_rows)
+    by_stratum = shuffled[np.argsort(codes[shuffled], kind="stable")]
+    rank = np.empty(n_rows, dtype=np.float64)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank[by_stratum] = np.arange(n_rows) - np.repeat(starts, sizes)
+
+    # Spread each stratum evenly over [0, 1)
+    key = (rank + rng.random(n_rows)) / sizes[codes]
+    return np.argsort(key, kind="stable")
+
+
+def adaptive_profiles(
+    df: pd.DataFrame,
+    target_col: str | None = None,
+    initial_rows: int = INITIAL_ROWS,
+    growth_factor: float = GROWTH_FACTOR,
+    confidence: float = CONFIDENCE,
+    rel_tol: float = REL_TOL,
+    skew_tol: float = SKEW_TOL,
+    ratio_tol: float = RATIO_TOL,
+    error_bound: float = 0.001,
+    random_state=None,
+) -> dict:
+    """
+    Numerical and categorical profiles from a progressive sample, plus
+    the exact target profile (one column, so it is read in full).
+
+    Every feature profile gains a "ci" entry. "sampling" reports rows
+    used, rounds and whether all intervals converged. count is scaled to
+    the full data; min, max and n_unique are observed in the sample.
+    """
+    n_total = len(df)
+    feature_df = df.drop(columns=[target_col]) if target_col is not None else df
+
+    strata = None
+    if target_col is not None and _is_classification_target(df[target_col]):
+        strata = df[target_col].to_numpy()
+
+    order = stratified_order(n_total, strata, random_state)
+    num_cols = numeric_columns(feature_df)
+    z = float(norm.ppf(0.5 + confidence / 2))
+
+    numerical_state = NumericalProfileState()
+    categorical_state = CategoricalProfileState(error_bound)
+    groups = [MomentSketch(num_cols) for _ in range(JACKKNIFE_GROUPS)]
+
+    seen = 0
+    rounds = 0
+    target_rows = min(initial_rows, n_total)
+
+    while True:
+        new = order[seen:target_rows]
+        group_of = np.arange(seen, target_rows) % JACKKNIFE_GROUPS
+        sort = np.argsort(new)  # ascending positions read faster
+        chunk = feature_df.iloc[new[sort]]
+
+        categorical_state.update(chunk)
+
+        if num_cols:
+            values = chunk[num_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+            numerical_state.update_values(values, num_cols)
+
+            chunk_groups = group_of[sort]
+            for g, sketch in enumerate(groups):
+                sketch.update(values[chunk_groups == g], num_cols)
+
+        seen = target_rows
+        rounds += 1
+
+        # Finite-population correction: no uncertainty once every row is in
+        fpc = np.sqrt(1.0 - seen / n_total) if n_total else 0.0
+
+        numerical, num_tight = _numerical_with_ci(
+            numerical_state, groups, n_total / max(seen, 1), z * fpc, rel_tol, skew_tol
+        )
+        categorical, cat_tight = _categorical_with_ci(
+            categorical_state, z, fpc, ratio_tol
+        )
+
+        converged = bool(num_tight and cat_tight)
+        if converged or seen >= n_total:
+            break
+        target_rows = min(n_total, max(seen + 1, int(seen * growth_factor)))
+
+    return {
+        "numerical": numerical,
+        "categorical": categorical,
+        "target": profile_target(df, target_col) if target_col is not None else None,
+        "sampling": {
+            "strategy": "stratified" if strata is not None else "uniform",
+            "rows": seen,
+            "source_rows": n_total,
+            "rounds": rounds,
+            "converged": converged,
+            "confidence": confidence,
+        },
+    }
+
+
+# =========================================================
+# Confidence intervals
+# =========================================================
+
+def _numerical_with_ci(state, groups, scale, z, rel_tol, skew_tol):
+    profiles = state.to_profiles()
+    if not profiles:
+        return profiles, True
+
+    columns = groups[0].columns
+    estimate = _moment_stats(_merge(groups, columns))
+    half = {k: z * v for k, v in _jackknife_se(groups, columns).items()}
+
+    std = estimate["std"]
+    skewness = estimate["skewness"]
+    with np.errstate(invalid="ignore"):
+        tight = (
+            (half["mean"] <= rel_tol * std)
+            & (half["std"] <= rel_tol * std)
+            & (
+                (half["skewness"] <= skew_tol)
+                | (
+                    _excludes(skewness, half["skewness"], SKEW_INSIGHT_THRESHOLD)
+                    & _excludes(skewness, half["skewness"], -SKEW_INSIGHT_THRESHOLD)
+                )
+            )
+        )
+
+    all_tight = True
+
+    for i, col in enumerate(columns):
+        profile = profiles.get(col)
+        if profile is None:
+            continue
+
+        profile["count"] = int(round(profile["count"] * scale))
+        profile["ci"] = {
+            stat: _interval(profile[stat], half[stat][i])
+            for stat in ("mean", "std", "skewness")
+        }
+        all_tight &= bool(tight[i]) or profile["std"] == 0.0
+
+    return profiles, all_tight
+
+
+def _categorical_with_ci(state, z, fpc, ratio_tol):
+    profiles = state.to_profiles()
+    all_tight = True
+
+    for col, profile in profiles.items():
+        frequent = state.frequent[col]
+        n = frequent.total
+        if n == 0:
+            profile["ci"] = {"top_ratio": [0.0, 0.0]}
+            continue
+
+        p = profile["top_ratio"]
+        lo, hi = _wilson(p, n, z)
+        lo, hi = p - (p - lo) * fpc, p + (hi - p) * fpc
+
+        profile["ci"] = {"top_ratio": [float(lo), float(hi)]}
+        all_tight &= bool(
+            (hi - lo) / 2 <= ratio_tol
+            or not (lo <= TOP_RATIO_INSIGHT_THRESHOLD <= hi)
+        )
+
+    return profiles, all_tight
+
+
+def _moment_stats(sketch: MomentSketch) -> dict:
+    return {
+        "count": sketch.count.copy(),
+        "mean": sketch.mean.copy(),
+        "std": sketch.std(ddof=1),
+        "skewness": sketch.skewness(),
+    }
+
+
+def _merge(sketches, columns) -> MomentSketch:
+    merged = MomentSketch(columns)
+    for sketch in sketches:
+        merged.merge(sketch)
+    return merged
+
+
+def _jackknife_se(groups, columns) -> dict:
+    # Leave-one-group-out estimates of every statistic
+    k = len(groups)
+    loo = [
+        _moment_stats(_merge(groups[:g] + groups[g + 1:], columns))
+        for g in range(k)
+    ]
+
+    se = {}
+    for stat in ("mean", "std", "skewness"):
+        values = np.vstack([est[stat] for est in loo])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns
+            se[stat] = np.sqrt((k - 1) / k * np.nansum((values - np.nanmean(values, axis=0)) ** 2, axis=0))
+    return se
+
+
+def _wilson(p: float, n: int, z: float):
+    denom = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denom
+    half = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def _excludes(estimate, half, threshold):
+    # True where the interval lies entirely on one side of `threshold`
+    return (estimate - half > threshold) | (estimate + half < threshold)
+
+
+def _interval(value, half):
+    if not np.isfinite(value) or not np.isfinite(half):
+        return [value, value]
+    return [float(value - half), float(value + half)]
+
+
+def _is_classification_target(series: pd.Series) -> bool:
+    return is_categorical_kind(series.dtype) or series.nunique() <= 20
@@ -0,0 +1,105 @@
+# scoring.py
+"""
+Batch and streaming prediction for trained DANY pipelines.
+
+Rows are scored in fixed-size batches and results stay NumPy arrays, so
+memory is bounded by the batch size and no Python lists are built.
+Classification labels and confidences come from a single predict_proba
+call per batch.
+"""
+
+import os
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+from dany_core.streaming import iter_chunks
+
+DEFAULT_BATCH_SIZE = 100_000
+
+
+def predict_batch(pipeline, X: pd.DataFrame, task_type: str, include_probabilities: bool = True) -> dict:
+    """
+    Score one batch. Returns NumPy arrays for predictions, confidence
+    (max class probability, classification only) and probabilities.
+    """
+    if task_type == "classification" and hasattr(pipeline, "predict_proba"):
+        probs = pipeline.predict_proba(X)
+        best = probs.argmax(axis=1)
+
+        return {
+            "predictions": pipeline.classes_[best],
+            "confidence": probs[np.arange(len(best)), best],
+            "probabilities": probs if include_probabilities else None,
+        }
+
+    return {
+        "predictions": pipeline.predict(X),
+        "confidence": None,
+        "probabilities": None,
+    }
+
+
+def predict_batches(
+    pipeline,
+    source,
+    task_type: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    include_probabilities: bool = False,
+) -> Iterator[dict]:
+    """
+    Yield predict_batch results for a dataframe, CSV/Parquet path or an
+    iterable of dataframe chunks.
+    """
+    for batch in iter_chunks(source, batch_size):
+        yield predict_batch(pipeline, batch, task_type, include_probabilities)
+
+
+def write_predictions(
+    pipeline,
+    source,
+    task_type: str,
+    output_path: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    keep_columns: list | None = None,
+) -> int:
+    """
+    Stream predictions (and confidence) straight to a CSV or Parquet file.
+    `keep_columns` are copied from the input, e.g. to carry an ID column.
+    Returns the number of rows written.
+    """
+    is_parquet = output_path.lower().endswith((".parquet", ".pq"))
+    writer = None
+    rows_written = 0
+
+    if not is_parquet and os.path.exists(output_path):
+        os.remove(output_path)
+
+    try:
+        for batch in iter_chunks(source, batch_size):
+            scored = predict_batch(pipeline, batch, task_type, include_probabilities=False)
+
+            columns = {col: batch[col].to_numpy() for col in (keep_columns or [])}
+            columns["prediction"] = scored["predictions"]
+            if scored["confidence"] is not None:
+                columns["confidence"] = scored["confidence"]
+            out = pd.DataFrame(columns)
+
+            if is_parquet:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                table = pa.Table.from_pandas(out, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(output_path, table.schema)
+                writer.write_table(table)
+            else:
+                out.to_csv(output_path, mode="a", header=rows_written == 0, index=False)
+
+            rows_written += len(out)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return rows_written
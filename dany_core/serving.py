@@ -0,0 +1,393 @@
+# serving.py
+"""
+Local low-latency scoring service for a persisted DANY pipeline.
+
+A small asyncio HTTP/1.1 server (standard library only) that loads a
+model artifact once and micro-batches concurrent requests into a single
+predict_proba call. Endpoints:
+
+    POST /predict   JSON {"records": [...]} or an Arrow IPC stream
+    GET  /metrics   latency percentiles and throughput counters
+    GET  /health    liveness check
+
+Run with: python -m dany_core.serving <artifact_dir> [--port 8080]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from dany_core.registry import check_schema, load_model_artifact
+from dany_core.scoring import predict_batch
+
+ARROW_CONTENT_TYPE = "application/vnd.apache.arrow.stream"
+MAX_BODY_BYTES = 64 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class LatencyStats:
+    """
+    Rolling request latencies plus lifetime counters.
+    """
+
+    def __init__(self, window: int = 10_000):
+        self._latencies_ms = deque(maxlen=window)
+        self.started_at = time.perf_counter()
+        self.requests = 0
+        self.rows = 0
+        self.errors = 0
+        self.batches = 0
+
+    def record(self, latency_sec: float, rows: int) -> None:
+        self._latencies_ms.append(latency_sec * 1000.0)
+        self.requests += 1
+        self.rows += rows
+
+    def snapshot(self) -> dict:
+        uptime = time.perf_counter() - self.started_at
+        latencies = np.fromiter(self._latencies_ms, dtype=np.float64)
+
+        if latencies.size:
+            p50, p99 = np.percentile(latencies, [50, 99])
+        else:
+            p50 = p99 = 0.0
+
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "errors": self.errors,
+            "batches": self.batches,
+            "avg_batch_requests": round(self.requests / self.batches, 2) if self.batches else 0.0,
+            "latency_p50_ms": round(float(p50), 3),
+            "latency_p99_ms": round(float(p99), 3),
+            "throughput_rps": round(self.requests / uptime, 2) if uptime > 0 else 0.0,
+            "throughput_rows_per_sec": round(self.rows / uptime, 2) if uptime > 0 else 0.0,
+            "uptime_sec": round(uptime, 3),
+        }
+
+
+class ScoringService:
+    """
+    Loads the pipeline once and scores requests in micro-batches: the
+    first queued request opens a batch, which closes after max_batch_rows
+    rows or max_wait_ms, whichever comes first.
+    """
+
+    def __init__(self, artifact_dir: str, max_batch_rows: int = 4_096, max_wait_ms: float = 2.0):
+        self.pipeline, self.metadata = load_model_artifact(artifact_dir)
+        self.task_type = self.metadata["task_type"]
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_ms = max_wait_ms
+        self.stats = LatencyStats()
+
+        self._queue: asyncio.Queue | None = None
+        self._batcher: asyncio.Task | None = None
+        self._server: asyncio.AbstractServer | None = None
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> int:
+        """
+        Start serving; returns the bound port (pass port=0 for a free one).
+        """
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.create_task(self._batch_loop())
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8080) -> None:
+        await self.start(host, port)
+        await self._server.serve_forever()
+
+    # -----------------------------
+    # Scoring
+    # -----------------------------
+    async def predict(self, frame: pd.DataFrame) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((frame, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            frame, future = await self._queue.get()
+            batch = [(frame, future)]
+            rows = len(frame)
+            deadline = loop.time() + self.max_wait_ms / 1000.0
+
+            while rows < self.max_batch_rows:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    frame, future = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append((frame, future))
+                rows += len(frame)
+
+            try:
+                await self._score(batch)
+            except Exception as e:
+                # Never let one batch end the loop: later requests would hang
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def _score(self, batch) -> None:
+        frames = [frame for frame, _ in batch]
+
+        try:
+            combined = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            scored = await asyncio.get_running_loop().run_in_executor(
+                None, predict_batch, self.pipeline, combined, self.task_type, False
+            )
+        except Exception as e:
+            if len(batch) > 1:
+                # Score requests one by one so only the bad one fails
+                for item in batch:
+                    await self._score([item])
+                return
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+
+        self.stats.batches += 1
+        start = 0
+        for frame, future in batch:
+            end = start + len(frame)
+            confidence = scored["confidence"]
+            if not future.done():
+                future.set_result({
+                    "predictions": scored["predictions"][start:end].tolist(),
+                    "confidence": confidence[start:end].tolist() if confidence is not None else None,
+                })
+            start = end
+
+    # -----------------------------
+    # HTTP
+    # -----------------------------
+    async def _handle_connection(self, reader, writer) -> None:
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except _RequestError as e:
+                    # The body was not read: answer and drop the connection
+                    self.stats.errors += 1
+                    _write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                method, path, headers, body = request
+                status, payload = await self._route(method, path, headers, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method, path, headers, body):
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok", "model_name": self.metadata.get("model_name")}
+
+        if method == "GET" and path == "/metrics":
+            return 200, self.stats.snapshot()
+
+        if method != "POST" or path != "/predict":
+            return 404, {"error": f"No route for {method} {path}"}
+
+        started = time.perf_counter()
+        try:
+            frame = _decode_frame(body, headers.get("content-type", ""))
+            check_schema(self.metadata, frame)
+        except (ValueError, KeyError, TypeError) as e:
+            self.stats.errors += 1
+            return 400, {"error": str(e)}
+
+        try:
+            result = await self.predict(frame)
+        except Exception as e:
+            self.stats.errors += 1
+            return 500, {"error": str(e)}
+
+        self.stats.record(time.perf_counter() - started, len(frame))
+        return 200, result
+
+
+# =========================================================
+# HTTP helpers
+# =========================================================
+
+class _RequestError(Exception):
+    """
+    Request that cannot be read; answered with `status`.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+async def _read_request(reader):
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        return None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise _RequestError(400, "Invalid Content-Length header") from None
+    if length < 0:
+        raise _RequestError(400, "Invalid Content-Length header")
+    if length > MAX_BODY_BYTES:
+        raise _RequestError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], headers, body
+
+
+def _write_response(writer, status: int, payload: dict, keep_alive: bool) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+
+
+def _decode_frame(body: bytes, content_type: str) -> pd.DataFrame:
+    if content_type.startswith(ARROW_CONTENT_TYPE):
+        import pyarrow as pa
+
+        return pa.ipc.open_stream(body).read_pandas()
+
+    payload = json.loads(body or b"{}")
+    records = payload.get("records") if isinstance(payload, dict) else payload
+    if not isinstance(records, list) or not records:
+        raise ValueError("Expected a non-empty list of records")
+
+    return pd.DataFrame.from_records(records)
+
+
+# =========================================================
+# Load generator
+# =========================================================
+
+async def run_load_test(
+    host: str,
+    port: int,
+    records: list,
+    n_requests: int = 1_000,
+    concurrency: int = 16,
+) -> dict:
+    """
+    Fire n_requests POST /predict calls over `concurrency` keep-alive
+    connections and report client-side latency and throughput.
+    """
+    body = json.dumps({"records": records}).encode()
+    request = (
+        f"POST /predict HTTP/1.1\r\nHost: {host}\r\n"
+        f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode("latin-1") + body
+
+    latencies = []
+    errors = 0
+    remaining = n_requests
+
+    async def worker():
+        nonlocal remaining, errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                writer.write(request)
+                await writer.drain()
+
+                status_line = await reader.readline()
+                length = 0
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    if name.strip().lower() == "content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+
+                latencies.append(time.perf_counter() - started)
+                if b" 200 " not in status_line:
+                    errors += 1
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+
+    latencies_ms = np.array(latencies) * 1000.0
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "duration_sec": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 2) if duration > 0 else 0.0,
+        "latency_p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "latency_p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a persisted DANY pipeline over HTTP")
+    parser.add_argument("artifact_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-rows", type=int, default=4_096)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    service = ScoringService(args.artifact_dir, args.max_batch_rows, args.max_wait_ms)
+    asyncio.run(service.serve_forever(args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+# sketches.py
+"""
+Mergeable streaming statistics for DANY.
+
+Every sketch supports `update` (fold in a new block of data) and `merge`
+(combine two partial states), so chunks of a large file or results from
+worker processes can be combined without revisiting the rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# =========================================================
+# Moments (count, mean, M2, M3, min, max)
+# =========================================================
+
+class MomentSketch:
+    """
+    Vectorized one-pass moment accumulator for a set of numeric columns.
+
+    Each block is reduced with a two-pass (numerically stable) computation
+    and blocks are combined with the pairwise update formulas of
+    Chan et al. / Pébay, so the result does not depend on chunking.
+    """
+
+    def __init__(self, columns=()):
+        self.columns: list = []
+        self._index: dict = {}
+        self.count = np.zeros(0)
+        self.mean = np.zeros(0)
+        self.m2 = np.zeros(0)
+        self.m3 = np.zeros(0)
+        self.min = np.zeros(0)
+        self.max = np.zeros(0)
+        self._add_columns(columns)
+
+    def _add_columns(self, columns) -> None:
+        new = [c for c in columns if c not in self._index]
+        if not new:
+            return
+
+        for col in new:
+            self._index[col] = len(self.columns)
+            self.columns.append(col)
+
+        k = len(new)
+        self.count = np.concatenate([self.count, np.zeros(k)])
+        self.mean = np.concatenate([self.mean, np.zeros(k)])
+        self.m2 = np.concatenate([self.m2, np.zeros(k)])
+        self.m3 = np.concatenate([self.m3, np.zeros(k)])
+        self.min = np.concatenate([self.min, np.full(k, np.inf)])
+        self.max = np.concatenate([self.max, np.full(k, -np.inf)])
+
+    def update(self, values: np.ndarray, columns) -> "MomentSketch":
+        """
+        Fold a 2-D float block (rows x columns, NaN = missing) into the sketch.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim != 2 or values.shape[0] == 0:
+            return self
+
+        missing = np.isnan(values)
+        has_missing = bool(missing.any())
+        n = (values.shape[0] - missing.sum(axis=0)).astype(np.float64)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = (np.nansum(values, axis=0) if has_missing else values.sum(axis=0)) / n
+            dev = values - mean
+
+        if has_missing:
+            dev[missing] = 0.0
+
+        dev2 = dev * dev
+        block = MomentSketch()
+        block._add_columns(columns)
+        block.count = n
+        block.mean = np.where(n > 0, mean, 0.0)
+        block.m2 = dev2.sum(axis=0)
+        block.m3 = np.einsum("ij,ij->j", dev2, dev)
+        block.min = np.fmin.reduce(values, axis=0, initial=np.inf)
+        block.max = np.fmax.reduce(values, axis=0, initial=-np.inf)
+
+        return self.merge(block)
+
+    def merge(self, other: "MomentSketch") -> "MomentSketch":
+        self._add_columns(other.columns)
+        idx = np.array([self._index[c] for c in other.columns], dtype=np.intp)
+        if idx.size == 0:
+            return self
+
+        na, nb = self.count[idx], other.count
+        n = na + nb
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other.mean - self.mean[idx]
+            mean = np.where(n > 0, self.mean[idx] + delta * nb / n, 0.0)
+            m2 = self.m2[idx] + other.m2 + np.where(
+                n > 0, delta ** 2 * na * nb / n, 0.0
+            )
+            m3 = (
+                self.m3[idx]
+                + other.m3
+                + np.where(
+                    n > 0,
+                    delta ** 3 * na * nb * (na - nb) / n ** 2
+                    + 3.0 * delta * (na * other.m2 - nb * self.m2[idx]) / n,
+                    0.0,
+                )
+            )
+
+        self.count[idx] = n
+        self.mean[idx] = mean
+        self.m2[idx] = m2
+        self.m3[idx] = m3
+        self.min[idx] = np.minimum(self.min[idx], other.min)
+        self.max[idx] = np.maximum(self.max[idx], other.max)
+
+        return self
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+        return np.sqrt(var)
+
+    def skewness(self) -> np.ndarray:
+        """
+        Biased sample skewness (same definition as scipy.stats.skew).
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(
+                self.m2 > 0,
+                np.sqrt(self.count) * self.m3 / self.m2 ** 1.5,
+                np.nan,
+            )
+
+
+# =========================================================
+# Distinct counts (HyperLogLog)
+# =========================================================
+
+def hash_values(values) -> np.ndarray:
+    """
+    64-bit hashes for a 1-D array of values (numbers or strings).
+    """
+    values = np.asarray(values)
+    if values.dtype == object:
+        try:
+            return pd.util.hash_array(values, categorize=False)
+        except TypeError:
+            return pd.util.hash_array(values.astype(str).astype(object), categorize=False)
+    return pd.util.hash_array(values)
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct counter (Flajolet et al.) with small-range
+    linear counting. Standard error is about 1.04 / sqrt(2 ** precision).
+    """
+
+    def __init__(self, precision: int = 14):
+        if not 11 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 11 and 18")
+
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, values) -> "HyperLogLog":
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> "HyperLogLog":
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return self
+
+        p = self.precision
+        tail_bits = 64 - p
+
+        index = (hashes >> np.uint64(tail_bits)).astype(np.intp)
+        tail = hashes & np.uint64((1 << tail_bits) - 1)
+
+        # Position of the leftmost 1-bit in the tail. The tail has at most
+        # 53 bits, so it converts to float64 exactly and frexp is exact.
+        _, exponent = np.frexp(tail.astype(np.float64))
+        rank = np.where(tail > 0, tail_bits - exponent + 1, tail_bits + 1)
+
+        np.maximum.at(self.registers, index, rank.astype(np.uint8))
+        return self
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        m = self.registers.size
+        alpha = 0.7213 / (1.0 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros > 0:
+            return float(m * np.log(m / zeros))
+
+        return float(raw)
+
+
+# =========================================================
+# Heavy hitters (mergeable Misra-Gries)
+# =========================================================
+
+class FrequentItemsSketch:
+    """
+    Mergeable Misra-Gries summary for the most frequent values.
+
+    Keeps at most ceil(1 / error_bound) counters. Every stored count
+    underestimates the true frequency by at most `offset`, which is
+    guaranteed to stay below error_bound * total. Missing values are
+    counted exactly and kept outside the counters.
+    """
+
+    def __init__(self, error_bound: float = 0.001):
+        if not 0 < error_bound < 1:
+            raise ValueError("error_bound must be between 0 and 1")
+
+        self.error_bound = error_bound
+        self.capacity = int(np.ceil(1.0 / error_bound))
+        self.counts = pd.Series(dtype=np.int64)
+        self.offset = 0
+        self.total = 0
+        self.null_count = 0
+
+    def update(self, values) -> "FrequentItemsSketch":
+        series = pd.Series(values, copy=False)
+        nulls = int(series.isna().sum())
+        counts = series.value_counts(dropna=True, sort=False)
+        return self.update_counts(counts, nulls=nulls)
+
+    def update_counts(self, counts: pd.Series, nulls: int = 0) -> "FrequentItemsSketch":
+        """
+        Fold pre-aggregated value -> count pairs (e.g. category bincounts).
+        """
+        self.total += int(counts.sum()) + nulls
+        self.null_count += nulls
+        self._absorb(counts[counts > 0].astype(np.int64), 0)
+        return self
+
+    def merge(self, other: "FrequentItemsSketch") -> "FrequentItemsSketch":
+        self.total += other.total
+        self.null_count += other.null_count
+        self._absorb(other.counts, other.offset)
+        return self
+
+    def _absorb(self, counts: pd.Series, offset: int) -> None:
+        if self.counts.empty:
+            combined = counts.copy()
+        else:
+            combined = self.counts.add(counts, fill_value=0).astype(np.int64)
+        self.offset += offset
+
+        if len(combined) > self.capacity:
+            largest = combined.nlargest(self.capacity + 1)
+            cut = int(largest.iloc[-1])
+            combined = largest.iloc[:-1] - cut
+            combined = combined[combined > 0]
+            self.offset += cut
+
+        self.counts = combined
+
+    @property
+    def is_exact(self) -> bool:
+        return self.offset == 0
+
+    def top(self, k: int = 10) -> pd.Series:
+        """
+        Estimated top-k values with lower-bound counts.
+        """
+        return self.counts.nlargest(k)
+
+    def top_count(self) -> int:
+        """
+        Frequency of the most common value, missing values included.
+        """
+        top_value = int(self.counts.max()) if not self.counts.empty else 0
+        return max(top_value, self.null_count)
@@ -0,0 +1,145 @@
+# streaming.py
+"""
+Out-of-core helpers for DANY.
+Reads large inputs chunk by chunk and keeps only bounded state in memory.
+"""
+
+import os
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def iter_chunks(source, chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yield dataframe chunks from a CSV/Parquet path, a dataframe or an
+    iterable of dataframes.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+
+        if path.lower().endswith((".parquet", ".pq")):
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(path)
+            for batch in parquet_file.iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+            return
+
+        with pd.read_csv(path, chunksize=chunksize) as reader:
+            for chunk in reader:
+                yield chunk
+        return
+
+    for chunk in source:
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError(
+                f"Streaming input must yield DataFrames, got {type(chunk).__name__}"
+            )
+        yield chunk
+
+
+class ReservoirSampler:
+    """
+    Uniform (or target-stratified) row sample over a stream of chunks.
+
+    Every row gets a random key and the rows with the smallest keys are
+    kept (bottom-k sampling), so memory stays at `size` rows per stratum
+    no matter how many chunks are seen.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        stratify_col: str | None = None,
+        min_per_class: int = 50,
+        random_state: int | None = None,
+    ):
+        self.size = size
+        self.stratify_col = stratify_col
+        self.min_per_class = min_per_class
+        self.rows_seen = 0
+
+        self._rng = np.random.default_rng(random_state)
+        self._reservoirs: dict = {}
+        self._class_counts: dict = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if chunk.empty:
+            return
+
+        self.rows_seen += len(chunk)
+        keys = pd.Series(self._rng.random(len(chunk)), index=chunk.index)
+
+        if self.stratify_col is None:
+            self._push(None, chunk, keys)
+            return
+
+        groups = chunk.groupby(self.stratify_col, dropna=False, sort=False).indices
+        for label, positions in groups.items():
+            self._class_counts[label] = self._class_counts.get(label, 0) + len(positions)
+            self._push(label, chunk.iloc[positions], keys.iloc[positions])
+
+    def _push(self, stratum, rows: pd.DataFrame, keys: pd.Series) -> None:
+        rows = rows.assign(__sample_key__=keys.to_numpy())
+
+        current = self._reservoirs.get(stratum)
+        if current is not None:
+            rows = pd.concat([current, rows], ignore_index=True)
+
+        if len(rows) > self.size:
+            rows = rows.nsmallest(self.size, "__sample_key__")
+
+        self._reservoirs[stratum] = rows
+
+    def sample(self) -> pd.DataFrame:
+        """
+        Return the current sample.
+        Stratified samples are allocated proportionally to the class counts
+        seen so far, with at least `min_per_class` rows per class (so rare
+        classes can push the total slightly above `size`).
+        """
+        if not self._reservoirs:
+            return pd.DataFrame()
+
+        if self.stratify_col is None:
+            parts = [self._reservoirs[None]]
+        else:
+            total = sum(self._class_counts.values())
+            parts = []
+            for label, reservoir in self._reservoirs.items():
+                share = int(round(self.size * self._class_counts[label] / total))
+                quota = max(share, self.min_per_class)
+                parts.append(reservoir.nsmallest(quota, "__sample_key__"))
+
+        sample = pd.concat(parts, ignore_index=True)
+        sample = sample.sort_values("__sample_key__", kind="stable")
+        return sample.drop(columns="__sample_key__").reset_index(drop=True)
+
+
+def merge_cleaning_reports(reports: Iterable) -> list:
+    """
+    Combine per-chunk cleaning reports into a single list.
+    List reports are concatenated (dict entries get their chunk index);
+    any other report type is kept as one entry per chunk.
+    """
+    merged = []
+
+    for chunk_idx, report in enumerate(reports):
+        if isinstance(report, list):
+            for entry in report:
+                if isinstance(entry, dict):
+                    entry = {**entry, "chunk": chunk_idx}
+                merged.append(entry)
+        elif report:
+            merged.append({"chunk": chunk_idx, "report": report})
+
+    return merged
@@ -0,0 +1,39 @@
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+
+PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+# pandas options are process-wide: concurrent stages share one switch,
+# turned off again when the last of them leaves copy_on_write()
+_cow_lock = threading.Lock()
+_cow_users = 0
+_cow_previous = None
+
+
+@contextmanager
+def copy_on_write():
+    """
+    Context enabling pandas copy-on-write, so column selections, drops
+    and slices share buffers until written. Always on from pandas 3.
+    Safe to enter from several threads at once.
+    """
+    global _cow_users, _cow_previous
+
+    if PANDAS_MAJOR >= 3:
+        yield
+        return
+
+    with _cow_lock:
+        if _cow_users == 0:
+            _cow_previous = pd.get_option("mode.copy_on_write")
+            pd.set_option("mode.copy_on_write", True)
+        _cow_users += 1
+    try:
+        yield
+    finally:
+        with _cow_lock:
+            _cow_users -= 1
+            if _cow_users == 0:
+                pd.set_option("mode.copy_on_write", _cow_previous)
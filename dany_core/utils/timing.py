@@ -1,22 +1,402 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
 import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROFILE_TOP_N = 25
+
 
 class StageTimer:
-    def __init__(self):
-        self._store = {}
+    """
+    Instrumentation for pipeline stages.
+
+    Every start/stop pair (or `span` block) is a span with wall and CPU
+    time, rows processed and throughput, the process RSS high-water mark
+    and, with track_memory, the tracemalloc peak/net bytes. Spans nest per
+    thread (modeling -> fit:<model>), and top-level spans may run in
+    parallel threads; summary() then reports both the summed stage time
+    and the elapsed time. Spans named in `profile_spans` run
+    under cProfile or pyinstrument. Results export to JSON and to the
+    Chrome trace format (chrome://tracing, Perfetto).
+
+    Listeners (add_listener) receive an event dict when a started span
+    begins and ends; an exception raised by a listener propagates to the
+    code that called start/stop.
+    """
+
+    def __init__(
+        self,
+        track_memory: bool = False,
+        profile_spans=(),
+        profiler: str = "cprofile",
+    ):
+        self.track_memory = track_memory
+        self.profile_spans = set(profile_spans)
+        self.profiler = profiler
+
+        if profiler not in ("cprofile", "pyinstrument"):
+            raise ValueError(f"Unknown profiler: {profiler}")
+        if self.profile_spans and profiler == "pyinstrument":
+            import pyinstrument  # noqa: F401  (fail early if missing)
+
+        self._spans = []
+        self._listeners = []
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._origin_epoch = time.time()
+        self._origin_perf = time.perf_counter()
+
+        # Peak memory per stage comes from tracemalloc (numpy and pandas
+        # buffers are traced). Only stop tracing if this timer started it.
+        self._owns_tracing = False
+        if track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+
+    # -----------------------------
+    # Span lifecycle
+    # -----------------------------
+    def add_listener(self, callback):
+        """
+        Call `callback(event)` on every span start and stop. `event` has
+        "event" ("start" / "stop"), "stage", "depth" (0 = top level),
+        "rows" and, on stop, "wall_time_sec".
+        """
+        self._listeners.append(callback)
+
+    def start(self, name: str, rows: int | None = None):
+        stack = self._stack()
+        # Emitted before the span opens, so a listener can veto the stage
+        self._emit({"event": "start", "stage": name, "depth": len(stack), "rows": rows})
+
+        with self._lock:
+            span = {
+                "id": len(self._spans),
+                "name": name,
+                "parent": stack[-1]["id"] if stack else None,
+                "thread": threading.get_ident(),
+                "start": time.perf_counter(),
+                "end": None,
+                "cpu_start": time.process_time(),
+                "cpu_time": None,
+                "rows": rows,
+            }
+
+            if self.track_memory:
+                self._fold_peak()
+                span["_mem_baseline"] = tracemalloc.get_traced_memory()[0]
+                span["_mem_peak"] = span["_mem_baseline"]
+
+            self._spans.append(span)
+
+        if name in self.profile_spans:
+            span["_profiler"] = self._start_profiler()
 
-    def start(self, name: str):
-        self._store[name] = {"start": time.perf_counter(), "duration": None}
+        stack.append(span)
+
+    def stop(self, name: str, rows: int | None = None):
+        stack = self._stack()
+        span = next((s for s in reversed(stack) if s["name"] == name), None)
+        if span is None:
+            raise KeyError(f"Stage '{name}' was not started")
+
+        stack.remove(span)
 
-    def stop(self, name: str):
         end = time.perf_counter()
-        self._store[name]["duration"] = end - self._store[name]["start"]
+        cpu_end = time.process_time()
+
+        if span.get("_profiler") is not None:
+            span["profile"] = self._stop_profiler(span.pop("_profiler"))
+
+        with self._lock:
+            span["end"] = end
+            span["cpu_time"] = cpu_end - span["cpu_start"]
+            if rows is not None:
+                span["rows"] = rows
+
+            span["max_rss_bytes"] = _max_rss_bytes()
+
+            if self.track_memory and "_mem_baseline" in span:
+                self._fold_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                baseline = span.pop("_mem_baseline")
+                span["peak_bytes"] = span.pop("_mem_peak") - baseline
+                span["delta_bytes"] = current - baseline
+
+        self._emit({
+            "event": "stop",
+            "stage": name,
+            "depth": len(stack),
+            "rows": span["rows"],
+            "wall_time_sec": round(end - span["start"], 6),
+        })
+
+    @contextmanager
+    def span(self, name: str, rows: int | None = None):
+        self.start(name, rows=rows)
+        try:
+            yield self
+        finally:
+            self.stop(name)
+
+    def record(
+        self,
+        name: str,
+        wall_time_sec: float,
+        cpu_time_sec: float | None = None,
+        rows: int | None = None,
+        parent: str | None = None,
+        started_at: float | None = None,
+    ):
+        """
+        Add a span measured elsewhere (e.g. a model fit in a worker
+        process). `started_at` is a time.time() epoch; `parent` is the
+        name of the enclosing span.
+        """
+        with self._lock:
+            parent_span = next(
+                (s for s in reversed(self._spans) if s["name"] == parent), None
+            ) if parent else None
+
+            if started_at is not None:
+                start = self._origin_perf + (started_at - self._origin_epoch)
+            elif parent_span is not None:
+                start = parent_span["start"]
+            else:
+                start = time.perf_counter() - wall_time_sec
+
+            self._spans.append({
+                "id": len(self._spans),
+                "name": name,
+                "parent": parent_span["id"] if parent_span else None,
+                "thread": parent_span["thread"] if parent_span else threading.get_ident(),
+                "start": start,
+                "end": start + wall_time_sec,
+                "cpu_start": None,
+                "cpu_time": cpu_time_sec,
+                "rows": rows,
+            })
+
+    def close(self):
+        if self._owns_tracing:
+            tracemalloc.stop()
+            self._owns_tracing = False
+
+    # -----------------------------
+    # Reporting
+    # -----------------------------
+    def spans(self) -> list[dict]:
+        """
+        All spans, in start order. Spans still running are reported up
+        to now and flagged incomplete.
+        """
+        now = time.perf_counter()
+        out = []
+
+        with self._lock:
+            for s in self._spans:
+                end = s["end"] if s["end"] is not None else now
+                wall = end - s["start"]
+                cpu = s["cpu_time"]
+                if cpu is None and s["cpu_start"] is not None:
+                    cpu = time.process_time() - s["cpu_start"]
+
+                record = {
+                    "id": s["id"],
+                    "name": s["name"],
+                    "parent": s["parent"],
+                    "thread": s["thread"],
+                    "start_offset_sec": round(s["start"] - self._origin_perf, 6),
+                    "wall_time_sec": round(wall, 6),
+                    "cpu_time_sec": round(cpu, 6) if cpu is not None else None,
+                    "rows": s["rows"],
+                    "rows_per_sec": (
+                        round(s["rows"] / wall, 2) if s["rows"] and wall > 0 else None
+                    ),
+                    "complete": s["end"] is not None,
+                }
+                for key in ("max_rss_bytes", "peak_bytes", "delta_bytes", "profile"):
+                    if key in s:
+                        record[key] = s[key]
+                out.append(record)
+
+        return out
 
     def summary(self):
-        total = sum(v["duration"] for v in self._store.values())
-        return {
-            "total_time_sec": round(total, 4),
-            "stages": {
-                k: round(v["duration"], 4)
-                for k, v in self._store.items()
-            }
+        spans = self.spans()
+        top_level = [s for s in spans if s["parent"] is None]
+
+        stages = {}
+        details = {}
+        memory = {}
+
+        # Stages started several times (e.g. once per chunk) accumulate.
+        for s in top_level:
+            name = s["name"]
+            stages[name] = stages.get(name, 0.0) + s["wall_time_sec"]
+
+            d = details.setdefault(name, {"wall_time_sec": 0.0, "cpu_time_sec": 0.0, "rows": None})
+            d["wall_time_sec"] += s["wall_time_sec"]
+            d["cpu_time_sec"] += s["cpu_time_sec"] or 0.0
+            if s["rows"] is not None:
+                d["rows"] = (d["rows"] or 0) + s["rows"]
+            if "max_rss_bytes" in s:
+                d["max_rss_bytes"] = s["max_rss_bytes"]
+
+            if "peak_bytes" in s:
+                m = memory.setdefault(name, {"peak_bytes": 0, "delta_bytes": 0})
+                m["peak_bytes"] = max(m["peak_bytes"], s["peak_bytes"])
+                m["delta_bytes"] += s["delta_bytes"]
+
+        for d in details.values():
+            d["wall_time_sec"] = round(d["wall_time_sec"], 4)
+            d["cpu_time_sec"] = round(d["cpu_time_sec"], 4)
+            d["rows_per_sec"] = (
+                round(d["rows"] / d["wall_time_sec"], 2)
+                if d["rows"] and d["wall_time_sec"] > 0 else None
+            )
+
+        summary = {
+            "total_time_sec": round(sum(stages.values()), 4),
+            # Stages running concurrently overlap: elapsed counts them once
+            "elapsed_sec": round(_covered_time(top_level), 4),
+            "stages": {k: round(v, 4) for k, v in stages.items()},
+            "details": details,
         }
+
+        incomplete = sorted({s["name"] for s in spans if not s["complete"]})
+        if incomplete:
+            summary["incomplete"] = incomplete
+
+        if self.track_memory:
+            summary["memory"] = memory
+
+        return summary
+
+    def to_json(self, path: str | None = None) -> str:
+        payload = json.dumps({"summary": self.summary(), "spans": self.spans()}, indent=2, default=str)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(payload)
+        return payload
+
+    def to_chrome_trace(self, path: str | None = None) -> dict:
+        """
+        Trace Event Format ("X" complete events, microseconds).
+        """
+        pid = os.getpid()
+        events = []
+
+        for s in self.spans():
+            args = {
+                k: s[k]
+                for k in ("cpu_time_sec", "rows", "rows_per_sec", "peak_bytes", "delta_bytes", "max_rss_bytes")
+                if s.get(k) is not None
+            }
+            if not s["complete"]:
+                args["incomplete"] = True
+
+            events.append({
+                "name": s["name"],
+                "cat": "dany",
+                "ph": "X",
+                "ts": round((self._origin_epoch + s["start_offset_sec"]) * 1e6),
+                "dur": round(s["wall_time_sec"] * 1e6),
+                "pid": pid,
+                "tid": s["thread"],
+                "args": args,
+            })
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+        return trace
+
+    # -----------------------------
+    # Internals
+    # -----------------------------
+    def _emit(self, event: dict):
+        for callback in list(self._listeners):
+            callback(event)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _fold_peak(self):
+        # tracemalloc keeps a single global peak, so before each reset the
+        # current peak is folded into every span still open.
+        peak = tracemalloc.get_traced_memory()[1]
+        for s in self._spans:
+            if "_mem_peak" in s:
+                s["_mem_peak"] = max(s["_mem_peak"], peak)
+        tracemalloc.reset_peak()
+
+    def _start_profiler(self):
+        if self.profiler == "pyinstrument":
+            from pyinstrument import Profiler
+
+            profiler = Profiler()
+            profiler.start()
+            return profiler
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # another profiler is already active
+            return None
+        return profiler
+
+    def _stop_profiler(self, profiler) -> str:
+        if self.profiler == "pyinstrument":
+            profiler.stop()
+            return profiler.output_text()
+
+        profiler.disable()
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        return out.getvalue()
+
+
+def _covered_time(spans: list) -> float:
+    # Length of the union of the spans' [start, end) intervals
+    intervals = sorted(
+        (s["start_offset_sec"], s["start_offset_sec"] + s["wall_time_sec"]) for s in spans
+    )
+    covered = 0.0
+    current_start = current_end = None
+
+    for start, end in intervals:
+        if current_end is None or start > current_end:
+            if current_end is not None:
+                covered += current_end - current_start
+            current_start, current_end = start, end
+        else:
+            current_end = max(current_end, end)
+
+    if current_end is not None:
+        covered += current_end - current_start
+    return covered
+
+
+def _max_rss_bytes() -> int | None:
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return int(max_rss if sys.platform == "darwin" else max_rss * 1024)
@@ -1,6 +1,7 @@
 import pandas as pd
 
 from dany_core.cleaning import clean_data
+from dany_core.ingestion import read_table
 from dany_core.report import basic_data_report
 from dany_core.insights import generate_cleaning_insights
 from dany_core.modeling import train_and_evaluate
@@ -26,7 +27,7 @@ def run_dany(
     # =========================================================
     # Load raw data
     # =========================================================
-    df = pd.read_csv(input_csv)
+    df = read_table(input_csv)
 
     # =========================================================
     # Data quality report
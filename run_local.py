@@ -1,13 +1,13 @@
-import pandas as pd
-
-from dany_core.runner import run_dany
+from dany_core.ingestion import read_table
+from dany_core.runner import iter_dany_pipeline
+from dany_core.targets.target_spec import TargetSpec
 
 
 def main():
     # ------------------
     # Load data
     # ------------------
-    df = pd.read_csv(
+    df = read_table(
         r"C:\Users\sravanthi\OneDrive\Desktop\dany\datasets\messy_data.csv"
     )
 
@@ -16,60 +16,75 @@ def main():
     # Optional: verify columns (safe to remove later)
     print("Loaded columns:", list(df.columns))
 
-    # ------------------
-    # Run DANY pipeline
-    # ------------------
-    result = run_dany(df, target_col)
+    target_spec = TargetSpec(
+        name=target_col,
+        task_type="classification",
+        description=f"Target column: {target_col}",
+        allowed_null_ratio=0.05,
+    )
 
     # ------------------
-    # Print insights
+    # Run DANY pipeline, printing each stage as it finishes
     # ------------------
-    print("\n=== INSIGHTS ===")
-    if not result.get("insights"):
-        print("No insights generated (insufficient evidence).")
-    else:
-        for ins in result["insights"]:
-            print("-", ins)
+    for event in iter_dany_pipeline(df, target_spec):
+        stage = event["stage"]
+        seconds = (event["timing"] or {}).get("wall_time_sec")
+        took = f" ({seconds:.2f}s)" if seconds is not None else ""
 
-    # ------------------
-    # Print modeling results
-    # ------------------
-    modeling = result.get("modeling", {})
-    print("\n=== MODELING RESULTS ===")
-    print("Task type:", modeling.get("task_type"))
+        if stage == "target_validation":
+            print(f"\n=== TARGET VALIDATION{took} ===")
+            print(event["result"])
+            if not event["result"].get("valid", False):
+                print("Target validation failed; stopping.")
+                break
 
-    print("\nAll models:\n")
-    for m in modeling.get("all_models_results", []):
-        print(f"Model: {m.get('model_name')}")
-        print("Metrics:", m.get("metrics"))
-        print("Warnings:", m.get("warnings"))
-        print("Is best:", m.get("is_best"))
-        print()
+        elif stage == "cleaning":
+            print(f"\n=== CLEANING{took} ===")
+            print(event["result"] or "No cleaning actions were performed.")
 
-    print("Best model summary:")
-    print(modeling.get("best_model_summary"))
+        elif stage == "profiles":
+            profiles = event["result"]
+            print(f"\n=== PROFILES{took} ===")
+            print("Numerical columns:", list(profiles["numerical"]))
+            print("Categorical columns:", list(profiles["categorical"]))
+            print("Target:", profiles["target"])
 
-    # ------------------
-    # Print trust warnings (Day 5)
-    # ------------------
-    print("\n=== TRUST WARNINGS ===")
-    trust_warnings = result.get("trust_warnings", [])
-    if not trust_warnings:
-        print("No trust warnings.")
-    else:
-        for w in trust_warnings:
-            print("-", w)
+        elif stage == "model":
+            m = event["result"]
+            print(f"\nModel: {m.get('model_name')}{took}")
+            print("Metrics:", m.get("metrics"))
+            print("Warnings:", m.get("warnings"))
 
-    # ------------------
-    # Print confidence warnings (Day 5)
-    # ------------------
-    print("\n=== CONFIDENCE WARNINGS ===")
-    confidence_warnings = result.get("confidence_warnings", [])
-    if not confidence_warnings:
-        print("No confidence warnings.")
-    else:
-        for w in confidence_warnings:
-            print("-", w)
+        elif stage == "modeling":
+            modeling = event["result"]
+            print(f"\n=== MODELING RESULTS{took} ===")
+            print("Task type:", modeling.get("task_type"))
+            print("Best model summary:")
+            print(modeling.get("best_model_summary"))
+
+            # ------------------
+            # Print trust warnings (Day 5)
+            # ------------------
+            print("\n=== TRUST WARNINGS ===")
+            trust_risks = event["trust_risks"]
+            if not trust_risks:
+                print("No trust warnings.")
+            else:
+                for w in trust_risks:
+                    print("-", w["message"])
+
+            if any(w["severity"] == "high" for w in trust_risks):
+                print("Critical trust risks; skipping the report.")
+                break
+
+        elif stage == "report_generation":
+            print(f"\nReport written to {event['result']}{took}")
+
+        elif stage == "pipeline":
+            result = event["result"]
+            print("\nStatus:", result["status"])
+            if result.get("error"):
+                print("Error:", result["error"])
 
 
 if __name__ == "__main__":
@@ -8,12 +8,121 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 import streamlit as st
-import pandas as pd
 import os
 
-from dany_core.runner import run_dany_pipeline
+from dany_core.cache import StageCache
+from dany_core.ingestion import read_table
+from dany_core.jobs import FINISHED_STATES, JobQueue
 from dany_core.targets.target_spec import TargetSpec
-from dany_core.reports.html_report import generate_html_report
+
+# Stage results are reused across reruns on the same upload
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".dany_cache")
+
+# Concurrent pipeline runs across all sessions, and how often a session polls
+JOB_WORKERS = 2
+POLL_INTERVAL_SEC = 1.0
+
+
+@st.cache_resource
+def get_job_queue():
+    # One queue per server process: identical submissions from different
+    # sessions share a job.
+    return JobQueue(max_workers=JOB_WORKERS, cache=StageCache(CACHE_DIR))
+
+
+def show_partial(partial):
+    # Stage results of a run still in progress
+    if "target_validation" in partial:
+        st.subheader("Target Validation")
+        st.json(partial["target_validation"])
+
+    if "cleaning" in partial:
+        st.subheader("Cleaning Report")
+        st.json(partial["cleaning"])
+
+    if "profiles" in partial:
+        st.subheader("EDA Profiles")
+        st.json(partial["profiles"], expanded=False)
+
+    if partial.get("models"):
+        st.subheader("Models scored so far")
+        for m in partial["models"]:
+            st.write(f"**{m['model_name']}**", m.get("metrics"))
+
+
+def show_results(results):
+    st.subheader("Target Validation")
+    st.json(results.get("target_validation", {}))
+
+    st.subheader("Cleaning Report")
+    cleaning = results.get("cleaning", [])
+    if cleaning:
+        st.json(cleaning)
+    else:
+        st.write("No cleaning actions were performed.")
+
+    st.subheader("EDA Profiles")
+    profiles = results.get("profiles", {})
+    if profiles:
+        st.json(profiles)
+    else:
+        st.write("No EDA profiles available.")
+
+    st.subheader("Modeling Results")
+    modeling = results.get("modeling", {})
+    if modeling:
+        st.json(modeling)
+    else:
+        st.write("Modeling skipped or no results available.")
+
+    # ----------------------
+    # Download HTML report (generated by the runner)
+    # ----------------------
+    report_path = results.get("report_path")
+
+    if report_path and os.path.exists(report_path):
+        st.success("Report generated successfully!")
+
+        with open(report_path, "rb") as f:
+            report_bytes = f.read()
+
+        st.download_button(
+            label="Download DANY Report",
+            data=report_bytes,
+            file_name="dany_report.html",
+            mime="text/html"
+        )
+    else:
+        st.warning("Report not generated or missing.")
+
+
+def load_upload(uploaded_file):
+    # Parsed once per upload; reruns (widget changes, status polls)
+    # reuse the frame kept in the session
+    if st.session_state.get("upload_id") != uploaded_file.file_id:
+        st.session_state["upload_df"] = read_table(uploaded_file)
+        st.session_state["upload_id"] = uploaded_file.file_id
+    return st.session_state["upload_df"]
+
+
+@st.fragment(run_every=POLL_INTERVAL_SEC)
+def show_progress(job_id):
+    # Only this panel re-renders on each poll
+    status = queue.status(job_id)
+    if status["state"] in FINISHED_STATES:
+        # One full rerun renders the final results
+        st.rerun()
+
+    st.info(f"Running Dany pipeline... ({status['stage'] or 'queued'})")
+    st.progress(status["progress"])
+
+    if st.button("Cancel"):
+        queue.cancel(job_id)
+
+    show_partial(queue.partial(job_id))
+
+
+queue = get_job_queue()
 
 # ----------------------
 # Streamlit UI
@@ -21,12 +130,14 @@ from dany_core.reports.html_report import generate_html_report
 st.title("DANY — Data Analysis & Modeling")
 
 # 1️⃣ CSV Upload
-uploaded_file = st.file_uploader("Upload your CSV file", type=["csv"])
+uploaded_file = st.file_uploader(
+    "Upload your CSV file", type=["csv", "parquet", "feather"]
+)
 df = None
 
 if uploaded_file:
     try:
-        df = pd.read_csv(uploaded_file)
+        df = load_upload(uploaded_file)
         st.success(f"CSV loaded! {df.shape[0]} rows, {df.shape[1]} columns detected.")
     except Exception as e:
         st.error(f"Failed to read CSV: {e}")
@@ -47,72 +158,45 @@ if run_pipeline:
     elif not target_col or not task_type:
         st.error("Please select target column and task type.")
     else:
-        st.info("Running Dany pipeline... please wait")
-        try:
-            # ----------------------
-            # Prepare target spec
-            # ----------------------
-            target_spec = TargetSpec(
-                name=target_col,
-                task_type=task_type,
-                description=f"Target column: {target_col}",
-                allowed_null_ratio=0.05
-            )
-
-            # ----------------------
-            # Run pipeline
-            # ----------------------
-            results = run_dany_pipeline(dataframe=df, target_spec=target_spec)
+        # ----------------------
+        # Prepare target spec
+        # ----------------------
+        target_spec = TargetSpec(
+            name=target_col,
+            task_type=task_type,
+            description=f"Target column: {target_col}",
+            allowed_null_ratio=0.05
+        )
+
+        # ----------------------
+        # Submit pipeline job (returns immediately)
+        # ----------------------
+        st.session_state["job_id"] = queue.submit(df, target_spec)
+
+# 4️⃣ Poll the job of this session
+job_id = st.session_state.get("job_id")
+
+if job_id:
+    try:
+        status = queue.status(job_id)
+    except KeyError:
+        # The server restarted and the queue is gone
+        st.session_state.pop("job_id")
+        status = None
 
-            st.success("Pipeline finished!")
+    if status and status["state"] not in FINISHED_STATES:
+        show_progress(job_id)
+
+    elif status and status["state"] == "cancelled":
+        st.warning("Pipeline run cancelled.")
 
-            # ----------------------
-            # Display results
-            # ----------------------
-            st.subheader("Target Validation")
-            st.json(results.get("target_validation", {}))
-
-            st.subheader("Cleaning Report")
-            cleaning = results.get("cleaning", [])
-            if cleaning:
-                st.json(cleaning)
-            else:
-                st.write("No cleaning actions were performed.")
-
-            st.subheader("EDA Profiles")
-            profiles = results.get("profiles", {})
-            if profiles:
-                st.json(profiles)
-            else:
-                st.write("No EDA profiles available.")
-
-            st.subheader("Modeling Results")
-            modeling = results.get("modeling", {})
-            if modeling:
-                st.json(modeling)
-            else:
-                st.write("Modeling skipped or no results available.")
-
-            # ----------------------
-            # Generate & Download HTML report
-            # ----------------------
-            report_path = generate_html_report(results)
-            results["report_path"] = report_path
-
-            if report_path and os.path.exists(report_path):
-                st.success("Report generated successfully!")
-
-                with open(report_path, "rb") as f:
-                    report_bytes = f.read()
-
-                st.download_button(
-                    label="Download DANY Report",
-                    data=report_bytes,
-                    file_name="dany_report.html",
-                    mime="text/html"
-                )
-            else:
-                st.warning("Report not generated or missing.")
-
-        except Exception as e:
-            st.error(f"Pipeline failed: {e}")
+    elif status:
+        results = queue.result(job_id, timeout=0)
+
+        if status["state"] == "completed":
+            st.success("Pipeline finished!")
+            show_results(results)
+        else:
+            st.error(f"Pipeline failed: {status['error']}")
+            if results:
+                show_results(results)
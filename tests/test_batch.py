@@ -0,0 +1,133 @@
+import sys
+import types
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+import pytest
+
+from dany_core import batch
+from dany_core.batch import BatchJob, run_batch
+
+
+class _Spec:
+    def __init__(self, name):
+        self.name = name
+
+
+@pytest.fixture
+def fake_runner(monkeypatch):
+    runner = types.ModuleType("dany_core.runner")
+    runner.calls = []
+
+    def run_dany_pipeline(df, target_spec, cache=None):
+        runner.calls.append((id(df), target_spec.name, cache))
+        return {"status": "completed", "target": target_spec.name}
+
+    runner.run_dany_pipeline = run_dany_pipeline
+    monkeypatch.setitem(sys.modules, "dany_core.runner", runner)
+    return runner
+
+
+def test_jobs_are_grouped_by_dataset(fake_runner, tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [0, 1, 0]})
+    path = tmp_path / "table.csv"
+    df.to_csv(path, index=False)
+
+    results = run_batch(
+        [(df, _Spec("a")), BatchJob(str(path), _Spec("a")), (df, _Spec("b"))],
+        n_workers=1,
+    )
+
+    assert list(results) == ["frame0:a", "table.csv:a", "frame0:b"]
+    assert results["frame0:b"]["target"] == "b"
+    assert results["frame0:a"]["batch"] == {
+        "dataset": "frame0",
+        "jobs_on_dataset": 2,
+        "memory_estimate_bytes": batch._memory_estimate(df),
+    }
+    assert results["table.csv:a"]["batch"]["jobs_on_dataset"] == 1
+
+    # One cache per group, shared by its targets
+    caches = {name: cache for df_id, name, cache in fake_runner.calls if df_id == id(df)}
+    assert caches["a"] is caches["b"]
+    assert caches["a"].stages == batch.SHARED_STAGES
+
+
+def test_unloadable_dataset_fails_only_its_jobs(fake_runner, tmp_path):
+    df = pd.DataFrame({"a": [1, 2]})
+    missing = str(tmp_path / "missing.csv")
+
+    results = run_batch([(missing, _Spec("a")), (df, _Spec("a"))], n_workers=1)
+
+    assert results["missing.csv:a"]["status"] == "error"
+    assert "Failed to load dataset" in results["missing.csv:a"]["error"]
+    assert results["frame1:a"]["status"] == "completed"
+
+
+class _RecordingExecutor:
+    """
+    Runs groups inline; `rounds` lists the groups admitted between waits.
+    """
+
+    def __init__(self, fail=()):
+        self.fail = fail
+        self.rounds = [[]]
+
+    def submit(self, func, dataset, targets, cache_dir):
+        label = targets[0][0]
+        self.rounds[-1].append(label)
+        future = Future()
+        if label in self.fail:
+            future.set_exception(BrokenProcessPool("worker died"))
+        else:
+            future.set_result({job_id: {"status": "completed"} for job_id, _ in targets})
+        return future
+
+
+def _groups(estimates):
+    groups = []
+    for label, estimate in estimates.items():
+        groups.append({
+            "dataset": label,
+            "label": label,
+            "targets": [(label, _Spec("t"))],
+            "memory_estimate": estimate,
+        })
+    return groups
+
+
+def test_schedule_admits_groups_within_the_memory_budget(monkeypatch):
+    executor = _RecordingExecutor()
+
+    def recording_wait(futures, return_when):
+        executor.rounds.append([])
+        # Finish one group per wait, like the first completion in a pool
+        return {next(iter(futures))}, set()
+
+    monkeypatch.setattr(batch, "wait", recording_wait)
+    groups = _groups({"a": 60, "b": 60, "big": 500, "c": 30})
+
+    results = batch._schedule(executor, groups, workers=4, budget=100, cache_dir=None)
+
+    # b waits for room, c fits next to a; the oversized group runs alone
+    assert [r for r in executor.rounds if r] == [["a", "c"], ["b"], ["big"]]
+    assert set(results) == {"a", "b", "big", "c"}
+
+
+def test_schedule_keeps_other_groups_when_one_fails(monkeypatch):
+    executor = _RecordingExecutor(fail=("b",))
+    monkeypatch.setattr(batch, "wait", lambda futures, return_when: (set(futures), set()))
+
+    results = batch._schedule(executor, _groups({"a": 1, "b": 1}), workers=2, budget=None, cache_dir=None)
+
+    assert results["a"]["status"] == "completed"
+    assert results["b"]["status"] == "error"
+    assert "worker died" in results["b"]["error"]
+
+
+def test_worker_init_splits_cores(fake_runner):
+    batch._init_worker(3)
+
+    assert fake_runner.MODELING_N_JOBS == 3
+    assert fake_runner.EDA_N_JOBS == 3
@@ -0,0 +1,55 @@
+import sys
+import types
+
+from benchmarks.datasets import TARGET_COL, DatasetSpec, make_dataset
+from benchmarks.run_benchmarks import Scenario, compare_results, run_scenario
+
+
+def test_make_dataset_is_reproducible_and_parameterized():
+    spec = DatasetSpec(rows=4_000, numeric_cols=3, categorical_cols=2, cardinality=7,
+                       missing_rate=0.1, positive_rate=0.05, seed=3)
+    df = make_dataset(spec)
+
+    assert df.equals(make_dataset(spec))
+    assert df.shape == (4_000, 6)
+    assert df["cat_0"].nunique() <= 7
+    assert df[TARGET_COL].notna().all()
+    assert abs(df[TARGET_COL].mean() - 0.05) < 0.01
+    assert 0.08 < df.drop(columns=TARGET_COL).isna().mean().mean() < 0.12
+
+
+def test_compare_flags_only_significant_regressions():
+    baseline = {"scenarios": {"s": {
+        "total_time_sec": 2.0, "stages": {"eda": 1.0, "cleaning": 0.01},
+        "peak_bytes": {"eda": 100_000_000},
+    }}}
+    current = {"scenarios": {"s": {
+        "total_time_sec": 2.1, "stages": {"eda": 1.5, "cleaning": 0.03},
+        "peak_bytes": {"eda": 200_000_000},
+    }}}
+
+    flagged = {r["metric"] for r in compare_results(baseline, current) if r["regression"]}
+    # cleaning tripled but stays under the noise floor
+    assert flagged == {"stages.eda", "peak_bytes.eda"}
+
+
+def test_scenario_with_a_failed_run_fails(monkeypatch):
+    statuses = iter(["completed", "error"])
+    runner = types.ModuleType("dany_core.runner")
+    runner.run_dany_pipeline = lambda df, spec, **kwargs: {
+        "status": next(statuses), "error": "boom", "timing": {"total_time_sec": 1.0},
+    }
+    target_spec = types.ModuleType("dany_core.targets.target_spec")
+    target_spec.TargetSpec = lambda **kwargs: None
+    monkeypatch.setitem(sys.modules, "dany_core.runner", runner)
+    monkeypatch.setitem(sys.modules, "dany_core.targets.target_spec", target_spec)
+
+    result = run_scenario(Scenario("s", DatasetSpec(rows=100)), repeats=2, track_memory=False)
+
+    assert result["status"] == "failed"
+    assert "total_time_sec" not in result
+    assert "1/2 runs did not complete: error (boom)" in result["error"]
+
+    rows = compare_results({"scenarios": {"s": {"status": "completed", "total_time_sec": 1.0}}},
+                           {"scenarios": {"s": result}})
+    assert [(r["metric"], r["regression"]) for r in rows] == [("status", True)]
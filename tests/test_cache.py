@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dany_core.cache import MemoryStageCache, StageCache, code_version, frame_fingerprint
+
+
+def test_get_put_round_trip(tmp_path):
+    cache = StageCache(str(tmp_path))
+    key = StageCache.make_key("cleaning", "abc")
+
+    assert cache.get(key) == (False, None)
+
+    value = {"frame": pd.DataFrame({"a": [1, 2]}), "report": ["dropna"]}
+    cache.put(key, value)
+    hit, cached = cache.get(key)
+    assert hit
+    pd.testing.assert_frame_equal(cached["frame"], value["frame"])
+
+    calls = []
+    value, hit = cache.get_or_compute(key, lambda: calls.append(1))
+    assert hit and calls == []
+    assert value["report"] == ["dropna"]
+    assert cache.get_or_compute(StageCache.make_key("eda", "abc"), lambda: 42) == (42, False)
+
+
+def test_eviction_drops_least_recently_used(tmp_path):
+    payload = b"x" * 1_000
+    cache = StageCache(str(tmp_path), max_bytes=2_500)
+    keys = [StageCache.make_key("stage", str(i)) for i in range(3)]
+
+    cache.put(keys[0], payload)
+    cache.put(keys[1], payload)
+    # keys[0] is older on disk, but reading it makes it the recent one
+    for age, key in ((200, keys[0]), (100, keys[1])):
+        path = cache._path(key)
+        os.utime(path, (os.stat(path).st_atime - age, os.stat(path).st_mtime - age))
+    cache.get(keys[0])
+
+    cache.put(keys[2], payload)
+
+    assert cache.get(keys[0])[0]
+    assert not cache.get(keys[1])[0]
+    assert cache.get(keys[2])[0]
+
+
+def test_subcache_is_isolated(tmp_path):
+    cache = StageCache(str(tmp_path), max_bytes=10_000)
+    sub = cache.subcache("folds", max_bytes=1_500)
+    key = StageCache.make_key("cv_preprocess", "abc")
+
+    sub.put(key, b"x" * 1_000)
+    assert not cache.get(key)[0]
+
+    # Entries of the parent do not count against the subcache, nor the
+    # other way round
+    cache.put(StageCache.make_key("cleaning", "abc"), b"y" * 5_000)
+    assert sub.get(key)[0]
+    sub.put(StageCache.make_key("cv_preprocess", "def"), b"z" * 1_000)
+    assert not sub.get(key)[0]
+    assert cache.get(StageCache.make_key("cleaning", "abc"))[0]
+
+    memory = MemoryStageCache(stages=("cleaning",))
+    assert memory.subcache("folds", 0) is memory.subcache("folds", 0)
+    assert memory.subcache("folds", 0) is not memory
+
+
+@pytest.mark.parametrize("change", [
+    lambda df: df.assign(a=[1, 2, 4]),
+    lambda df: df.astype({"a": "int32"}),
+    lambda df: df[["b", "a"]],
+    lambda df: df.rename(columns={"a": "c"}),
+    lambda df: df.set_axis([10, 11, 12]),
+    lambda df: df.iloc[:2],
+])
+def test_fingerprint_follows_the_content(change):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    assert frame_fingerprint(df) == frame_fingerprint(df.copy())
+    assert frame_fingerprint(change(df)) != frame_fingerprint(df)
+
+
+def test_key_follows_stage_params_and_code_version():
+    base = StageCache.make_key("modeling", "abc", {"target": "y"}, code_version(frame_fingerprint))
+
+    assert base.startswith("modeling-")
+    assert base == StageCache.make_key("modeling", "abc", {"target": "y"}, code_version(frame_fingerprint))
+    assert base != StageCache.make_key("modeling", "abc", {"target": "z"}, code_version(frame_fingerprint))
+    assert base != StageCache.make_key("modeling", "abd", {"target": "y"}, code_version(frame_fingerprint))
+    # Objects from another module give another version
+    assert code_version(frame_fingerprint) != code_version(np.mean)
+    assert base != StageCache.make_key("modeling", "abc", {"target": "y"}, code_version(np.mean))
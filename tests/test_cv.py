@@ -0,0 +1,46 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from dany_core.cache import StageCache
+from dany_core.modeling import train_and_evaluate
+
+
+def _frame(n=600):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=n)
+    return pd.DataFrame({
+        "x": x,
+        "noise": rng.normal(size=n),
+        "level": rng.choice(["a", "b", "c"], n),
+        "target": (x + rng.normal(scale=0.5, size=n) > 0).astype(int),
+    })
+
+
+def test_cv_reports_fold_mean_and_std(tmp_path):
+    cache = StageCache(str(tmp_path))
+    df = _frame()
+
+    first = train_and_evaluate(df, "target", evaluation="cv", cv_folds=4, cv_repeats=2, cache=cache)
+
+    for r in first["all_models_results"]:
+        cv = r["cv"]
+        assert cv["folds_scored"] == 8
+        assert set(cv["mean"]) == set(cv["std"]) == {"accuracy", "precision", "recall", "f1"}
+        assert r["metrics"] == cv["mean"]
+        assert cv["preprocessing_cache_hits"] == 0
+
+    best = first["best_pipeline"]
+    assert best is not None
+    assert len(best.predict(df.drop(columns=["target"]))) == len(df)
+
+    # Same data and folds: every fold's preprocessing comes from the cache
+    second = train_and_evaluate(df, "target", evaluation="cv", cv_folds=4, cv_repeats=2, cache=cache)
+    assert second["all_models_results"][0]["cv"]["preprocessing_cache_hits"] == 8
+    assert second["best_model_summary"] == first["best_model_summary"]
+
+    # Fold matrices are kept apart from stage outputs, under their own budget
+    assert not any(name.endswith(".pkl") for name in os.listdir(tmp_path))
+    folds = os.listdir(tmp_path / "cv_folds")
+    assert folds and all(name.startswith("cv_preprocess-") for name in folds)
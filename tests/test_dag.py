@@ -0,0 +1,79 @@
+import threading
+import time
+
+import pytest
+
+from dany_core.dag import Stage, StageGraph
+from dany_core.utils.timing import StageTimer
+
+
+def _sleep(seconds, value):
+    def func(**_):
+        time.sleep(seconds)
+        return value
+    return func
+
+
+def test_independent_stages_overlap():
+    graph = StageGraph([
+        Stage("load", lambda raw: raw * 2, ("raw",), ("data",)),
+        Stage("profile", _sleep(0.3, "profiles"), ("data",), ("profiles",)),
+        Stage("model", _sleep(0.3, "model"), ("data",), ("model",)),
+        Stage("report", lambda profiles, model: (profiles, model), ("profiles", "model"), ("report",)),
+    ])
+    timer = StageTimer()
+
+    values = graph.run({"raw": 21}, timer=timer)
+    summary = timer.summary()
+
+    assert values["data"] == 42
+    assert values["report"] == ("profiles", "model")
+    assert summary["total_time_sec"] >= 0.6
+    assert summary["elapsed_sec"] < 0.55
+
+    path = graph.critical_path(summary["stages"])
+    assert path["stages"][0] == "load" and path["stages"][-1] == "report"
+
+
+def test_graph_validation_and_errors():
+    with pytest.raises(ValueError, match="cycle"):
+        StageGraph([
+            Stage("a", lambda y: y, ("y",), ("x",)),
+            Stage("b", lambda x: x, ("x",), ("y",)),
+        ])
+
+    def fail():
+        raise RuntimeError("boom")
+
+    graph = StageGraph([
+        Stage("fail", fail),
+        Stage("after", lambda: 1, outputs=("never",), after=("fail",)),
+    ])
+    values = {}
+    with pytest.raises(RuntimeError, match="boom"):
+        graph.run(values)
+    assert "never" not in values
+
+
+def test_early_exit_cancels_and_waits_for_running_stages():
+    running = threading.Event()
+    stopped = []
+
+    def slow(cancel):
+        running.set()
+        while not cancel.wait(0.01):
+            pass
+        time.sleep(0.1)
+        stopped.append(True)
+
+    graph = StageGraph([
+        Stage("fast", lambda: running.wait(5), outputs=("x",)),
+        Stage("slow", slow, cancellable=True),
+    ])
+
+    for item in graph.iter_run({}):
+        if item["stage"] == "fast":
+            break
+
+    # The slow stage saw the cancel and finished before iter_run returned
+    assert stopped == [True]
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dany_core.dtypes import memory_report
+from dany_core.eda import profile_categorical_columns, profile_numerical_columns, profile_target
+from dany_core.ingestion import optimize_dtypes
+from dany_core.modeling import _build_preprocessor
+
+
+def _compact_frame(n=400):
+    # A cleaned frame: missing values only in the string columns and the target
+    rng = np.random.default_rng(0)
+    target = pd.Series(rng.choice(["yes", "no"], n), dtype="category")
+    target[::25] = np.nan
+    df = pd.DataFrame({
+        "small": rng.integers(-5, 5, n).astype("int8"),
+        "ratio": rng.random(n).astype("float32"),
+        "level": pd.Categorical(rng.choice(["a", "b", "c"], n)),
+        "name": pd.Series(rng.choice(["x", "y", None], n), dtype="string"),
+        "target": target,
+    })
+    return df
+
+
+@pytest.mark.parametrize("kind", ["onehot", "ordinal", "hashed"])
+def test_compact_frame_preprocesses(kind):
+    df = optimize_dtypes(_compact_frame())
+    X, y = df.drop(columns="target"), df["target"]
+
+    matrix = _build_preprocessor(X, kind).fit_transform(X, y)
+
+    assert matrix.shape[0] == len(X)
+    if kind == "ordinal":
+        # Numerics first; missing categories stay NaN for HistGradientBoosting
+        np.testing.assert_array_equal(np.isnan(matrix[:, 3]), X["name"].isna())
+        matrix = matrix[:, :3]
+    values = matrix.data if hasattr(matrix, "tocsr") else matrix
+    assert np.isfinite(values).all()
+
+
+def test_compact_frame_profiles_like_the_wide_one():
+    compact = optimize_dtypes(_compact_frame())
+    wide = compact.astype({
+        "small": "int64", "ratio": "float64", "level": object, "name": object, "target": object,
+    })
+
+    numerical = profile_numerical_columns(compact, "target")
+    assert set(numerical) == {"small", "ratio"}
+    for col, profile in profile_numerical_columns(wide, "target").items():
+        assert numerical[col]["mean"] == pytest.approx(profile["mean"])
+
+    categorical = profile_categorical_columns(compact)
+    assert set(categorical) == {"level", "name", "target"}
+
+    target = profile_target(compact, "target")
+    assert target == profile_target(wide, "target")
+
+
+def test_memory_report_lists_the_compacted_columns():
+    df = _compact_frame().astype({"small": "int64", "level": object})
+
+    report = memory_report(df, optimize_dtypes(df))
+
+    assert report["after_bytes"] < report["before_bytes"]
+    assert report["dtypes_changed"]["small"] == "int64 -> int8"
+    assert report["dtypes_changed"]["level"] == "object -> category"
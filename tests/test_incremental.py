@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from dany_core.eda import profile_numerical_columns
+from dany_core.incremental import IncrementalProfile, run_incremental
+from dany_core.report import basic_data_report
+
+
+def _partition(n, seed, shift=0.0, levels=("a", "b")):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "x": rng.normal(shift, 1.0, n),
+        "level": rng.choice(list(levels), n),
+        "target": (rng.random(n) < 0.3).astype(int),
+    })
+
+
+def test_incremental_state_matches_full_history(tmp_path):
+    path = str(tmp_path / "state.joblib")
+    parts = [_partition(2_000, 0), _partition(2_000, 1), _partition(2_000, 1)]  # last is a re-delivery
+
+    for i, part in enumerate(parts):
+        result = run_incremental(path, part, "target", partition_id=f"day{i}")
+
+    full = pd.concat(parts, ignore_index=True)
+    report = result["report"]
+    expected = basic_data_report(full)
+
+    assert report["data_report"]["rows"] == expected["rows"]
+    assert report["data_report"]["duplicate_rows"] == expected["duplicate_rows"] == 2_000
+    assert result["delta"]["duplicate_rows_added"] == 2_000
+
+    x = report["profiles"]["numerical"]["x"]
+    assert x["mean"] == pytest.approx(profile_numerical_columns(full, "target")["x"]["mean"])
+    assert report["profiles"]["target"]["class_distribution"][1] == pytest.approx(full["target"].mean())
+
+
+def test_delta_reports_drift_and_new_categories():
+    state = IncrementalProfile(target_col="target")
+    assert state.update(_partition(5_000, 0), partition_id="d0")["initial"]
+
+    delta = state.update(_partition(5_000, 1, shift=1.0, levels=("a", "b", "c")), partition_id="d1")
+
+    assert delta["numerical"]["x"]["drift"]
+    assert delta["categorical"]["level"]["new_categories"] == ["c"]
+    assert not delta["target"]["drift"]
+
+    with pytest.raises(ValueError):
+        state.update(_partition(10, 2), partition_id="d1")
+
+
+def test_failed_update_leaves_state_unchanged():
+    state = IncrementalProfile(target_col="target")
+    state.update(_partition(500, 0), partition_id="day0")
+
+    def failing_clean(df):
+        raise ValueError("bad partition")
+
+    with pytest.raises(ValueError):
+        state.update(_partition(500, 1), partition_id="day1", clean=failing_clean)
+
+    assert state.report()["data_report"]["rows"] == 500
+    assert [p["id"] for p in state.partitions] == ["day0"]
+
+
+def test_saved_state_rejects_another_target(tmp_path):
+    path = str(tmp_path / "state.joblib")
+    run_incremental(path, _partition(200, 0), "target", partition_id="day0")
+
+    with pytest.raises(ValueError, match="tracks target 'target'"):
+        run_incremental(path, _partition(200, 1), "x", partition_id="day1")
+
+    # Omitting the target reuses the saved one
+    result = run_incremental(path, _partition(200, 1), partition_id="day1")
+    assert result["report"]["data_report"]["rows"] == 400
@@ -0,0 +1,107 @@
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dany_core import ingestion
+from dany_core.ingestion import optimize_dtypes, read_table
+
+
+def _frame():
+    return pd.DataFrame({
+        "id": np.arange(6),
+        "value": [0.5, 1.25, np.nan, 3.0, 4.5, 5.0],
+        "level": ["a", "b", "a", "b", "a", "b"],
+        "target": [0, 1, 0, 1, 0, 1],
+    })
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet", "feather"])
+def test_read_table_formats_and_projection(tmp_path, suffix):
+    df = _frame()
+    path = str(tmp_path / f"table.{suffix}")
+    getattr(df, "to_csv" if suffix == "csv" else f"to_{suffix}")(
+        path, **({"index": False} if suffix == "csv" else {})
+    )
+
+    loaded = read_table(path)
+    pd.testing.assert_frame_equal(loaded, df, check_dtype=False)
+
+    assert list(read_table(path, columns=["id", "target"]).columns) == ["id", "target"]
+    projected = read_table(path, target="target", features=["value"])
+    assert sorted(projected.columns) == ["target", "value"]
+
+
+def test_read_table_file_like():
+    df = _frame()
+    csv = io.BytesIO(df.to_csv(index=False).encode())
+    parquet = io.BytesIO(df.to_parquet())
+    parquet.name = "upload.parquet"
+
+    pd.testing.assert_frame_equal(read_table(csv), df, check_dtype=False)
+    pd.testing.assert_frame_equal(read_table(parquet), df)
+
+
+def test_csv_feather_cache_hits_and_invalidates(tmp_path, monkeypatch):
+    path = tmp_path / "table.csv"
+    cache_dir = str(tmp_path / "cache")
+    _frame().to_csv(path, index=False)
+
+    first = read_table(str(path), cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    # A hit skips the CSV parser
+    def no_parse(source, columns):
+        raise AssertionError("CSV parsed despite a cached copy")
+
+    with monkeypatch.context() as m:
+        m.setattr(ingestion, "_read_csv", no_parse)
+        pd.testing.assert_frame_equal(read_table(str(path), cache_dir=cache_dir), first)
+
+    # Rewriting the file changes its size / mtime and so the cache entry
+    changed = _frame().assign(target=1)
+    changed.to_csv(path, index=False)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert read_table(str(path), cache_dir=cache_dir)["target"].tolist() == [1] * 6
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_optimize_dtypes_is_lossless():
+    df = pd.DataFrame({
+        "exact": [0.5, 1.25, np.nan, 3.0],
+        "precise": [0.1, 0.2, 0.3, np.nan],
+        "ints": pd.array([1, None, 300, 4], dtype="Int64"),
+        "wide_ints": [0, 70_000, 3, 4],
+    })
+
+    out = optimize_dtypes(df)
+
+    assert out["exact"].dtype == np.float32
+    # 0.1 has no exact float32 value, so the column stays float64
+    assert out["precise"].dtype == np.float64
+    assert out["ints"].dtype == "Int16"
+    assert out["ints"].isna().tolist() == [False, True, False, False]
+    assert out["wide_ints"].dtype == np.int32
+    pd.testing.assert_frame_equal(out.astype(df.dtypes.to_dict()), df)
+
+
+def test_optimize_dtypes_category_threshold():
+    df = pd.DataFrame({
+        "repetitive": ["a", "b"] * 5,
+        "unique": [f"id{i}" for i in range(10)],
+    })
+
+    out = optimize_dtypes(df)
+    assert isinstance(out["repetitive"].dtype, pd.CategoricalDtype)
+    assert not isinstance(out["unique"].dtype, pd.CategoricalDtype)
+
+    # 10 distinct of 10 rows is within a ratio of 1.0
+    assert isinstance(optimize_dtypes(df, category_max_ratio=1.0)["unique"].dtype, pd.CategoricalDtype)
+    # read_table only compacts on request
+    csv = df.to_csv(index=False).encode()
+    assert not isinstance(read_table(io.BytesIO(csv))["repetitive"].dtype, pd.CategoricalDtype)
+    assert isinstance(read_table(io.BytesIO(csv), optimize=True)["repetitive"].dtype, pd.CategoricalDtype)
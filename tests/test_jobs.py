@@ -0,0 +1,56 @@
+import sys
+import time
+import types
+
+import pandas as pd
+import pytest
+
+from dany_core.jobs import Job, JobQueue, PipelineCancelled
+from dany_core.utils.timing import StageTimer
+
+
+def test_stage_events_drive_job_progress_and_cancellation():
+    job = Job("job-1", "key", stages=("target_validation", "data_report", "cleaning", "eda"))
+    timer = StageTimer()
+    timer.add_listener(job.on_event)
+
+    with timer.span("cleaning", rows=10):
+        with timer.span("fit:model"):
+            pass
+
+    # Nested spans are not stages
+    assert [e["event"] for e in job.events] == ["start", "stop"]
+    assert job.completed_stages == ["cleaning"]
+    assert 0 < job.to_status()["progress"] < 1
+
+    job.cancel_event.set()
+    with pytest.raises(PipelineCancelled):
+        timer.start("eda")
+
+    # The vetoed stage never opened
+    assert all(s["name"] != "eda" for s in timer.spans())
+
+
+def test_finished_jobs_are_evicted(monkeypatch):
+    runner = types.ModuleType("dany_core.runner")
+    runner.pipeline_stages = lambda: ("cleaning",)
+    runner.iter_dany_pipeline = lambda df, spec, **kwargs: iter(
+        [{"stage": "pipeline", "result": {"status": "completed", "rows": len(df)}}]
+    )
+    monkeypatch.setitem(sys.modules, "dany_core.runner", runner)
+
+    queue = JobQueue(max_workers=1, max_finished=2)
+    ids = []
+    for n in range(4):
+        ids.append(queue.submit(pd.DataFrame({"x": range(n + 1)}), "target"))
+        assert queue.result(ids[-1], timeout=5)["rows"] == n + 1
+
+    # Only the two most recent finished jobs are kept
+    assert [job["job_id"] for job in queue.jobs()] == ids[2:]
+    with pytest.raises(KeyError):
+        queue.status(ids[0])
+
+    queue.finished_ttl_sec = 0
+    time.sleep(0.01)
+    assert queue.jobs() == []
+    queue.shutdown()
@@ -0,0 +1,141 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.base import BaseEstimator
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.neighbors import NearestCentroid
+from sklearn.preprocessing import FunctionTransformer
+
+from dany_core.jobs import PipelineCancelled
+from dany_core.model_zoo import MODEL_ZOO, ModelSpec, register_model
+from dany_core.modeling import (
+    _allocate_cores,
+    _resolve_core_budget,
+    _successive_halving,
+    train_and_evaluate,
+)
+
+
+def test_candidates_are_reported_as_they_finish():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"x": rng.normal(size=400), "level": rng.choice(["a", "b"], 400)})
+    df["target"] = (df["x"] > 0).astype(int)
+
+    seen = []
+    results = train_and_evaluate(df, "target", n_jobs=2, on_result=seen.append)
+
+    names = [r["model_name"] for r in results["all_models_results"]]
+    assert sorted(r["model_name"] for r in seen) == sorted(names)
+    assert all(r["metrics"] for r in seen)
+
+
+def test_zoo_respects_the_time_budget_and_registered_models():
+    rng = np.random.default_rng(2)
+    df = pd.DataFrame({"x": rng.normal(size=300), "level": rng.choice(["a", "b", "c"], 300)})
+    df["target"] = (df["x"] > 0).astype(int)
+
+    register_model(ModelSpec(
+        name="nearest_centroid",
+        factory=lambda task_type, layout: NearestCentroid(),
+        cost_per_cell={"classification": 1e-9},
+    ))
+    try:
+        results = train_and_evaluate(df, "target", time_budget_sec=0.03)
+    finally:
+        del MODEL_ZOO["nearest_centroid"]
+
+    trained = {r["model_name"] for r in results["all_models_results"]}
+    skipped = {s["model_name"] for s in results["skipped_models"]}
+    assert "nearest_centroid" in trained
+    assert "random_forest" in skipped and "random_forest" not in trained
+    assert all(r["estimated_fit_sec"] > 0 for r in results["all_models_results"])
+
+
+class _FailingModel(BaseEstimator):
+    def fit(self, X, y):
+        raise ValueError("cannot fit")
+
+
+def test_halving_survives_every_candidate_failing():
+    rng = np.random.default_rng(3)
+    X = rng.normal(size=(3_000, 2))
+    y = pd.Series((X[:, 0] > 0).astype(int))
+    names = ["a", "b", "c"]
+
+    results = _successive_halving(
+        {name: _FailingModel() for name in names},
+        dict.fromkeys(names, X[:2_400]), y.iloc[:2_400],
+        dict.fromkeys(names, X[2_400:]), y.iloc[2_400:],
+        "classification", n_workers=2,
+    )
+
+    assert [r["model_name"] for r in results] == names
+    assert all(not r["metrics"] and r["warnings"] for r in results)
+
+
+def test_cancel_stops_training():
+    rng = np.random.default_rng(4)
+    df = pd.DataFrame({"x": rng.normal(size=200)})
+    df["target"] = (df["x"] > 0).astype(int)
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(PipelineCancelled):
+        train_and_evaluate(df, "target", cancel=cancel)
+
+
+def test_parallel_models_get_the_spare_cores():
+    models = {
+        "logistic_regression": LogisticRegression(),
+        "random_forest": RandomForestClassifier(),
+        "hist_gradient_boosting": HistGradientBoostingClassifier(),
+    }
+
+    n_workers, model_jobs = _allocate_cores(models, 8)
+
+    assert n_workers == 3
+    # 5 spare cores, split between the two parallel models
+    assert model_jobs == {"random_forest": 4, "hist_gradient_boosting": 3}
+
+    # Fewer cores than candidates: no spare cores, one thread per fit
+    assert _allocate_cores(models, 2) == (2, {"random_forest": 1, "hist_gradient_boosting": 1})
+    assert _allocate_cores({"logistic_regression": LogisticRegression()}, 8) == (1, {})
+
+
+@pytest.mark.parametrize("n_jobs, expected", [(None, 1), (0, 1), (3, 3), (64, 8), (-1, 8), (-3, 6), (-20, 1)])
+def test_core_budget_follows_the_sklearn_convention(monkeypatch, n_jobs, expected):
+    monkeypatch.setattr("dany_core.modeling.os.cpu_count", lambda: 8)
+
+    assert _resolve_core_budget(n_jobs) == expected
+
+
+def test_failing_preprocessing_only_fails_its_candidates(monkeypatch):
+    from dany_core import modeling
+
+    build = modeling._build_preprocessor
+
+    def build_or_fail(X, kind="onehot"):
+        if kind == "ordinal":
+            return ColumnTransformer([("fail", FunctionTransformer(_reject), list(X.columns))])
+        return build(X, kind)
+
+    monkeypatch.setattr(modeling, "_build_preprocessor", build_or_fail)
+    rng = np.random.default_rng(5)
+    df = pd.DataFrame({"x": rng.normal(size=200), "level": rng.choice(["a", "b"], 200)})
+    df["target"] = (df["x"] > 0).astype(int)
+
+    results = train_and_evaluate(df, "target")
+
+    by_name = {r["model_name"]: r for r in results["all_models_results"]}
+    assert by_name["hist_gradient_boosting"]["warnings"] == ["bad column"]
+    assert not by_name["hist_gradient_boosting"]["metrics"]
+    assert by_name["logistic_regression"]["metrics"]
+    assert results["best_pipeline"] is not None
+
+
+def _reject(X):
+    raise ValueError("bad column")
@@ -0,0 +1,43 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dany_core import parallel_eda
+from dany_core.eda import profile_categorical_columns, profile_numerical_columns, profile_target
+
+
+def _frame(n=3_000):
+    rng = np.random.default_rng(0)
+    data = {f"num_{i}": rng.normal(size=n) for i in range(7)}
+    data["small_int"] = rng.integers(0, 50, n).astype("int16")
+    data["coded"] = pd.Categorical(rng.choice(list("abcde"), n))
+    data["text"] = rng.choice(["x", "y", None], n).astype(object)
+    data["target"] = rng.integers(0, 2, n)
+    df = pd.DataFrame(data)
+    df.loc[::5, "num_2"] = np.nan
+    return df
+
+
+@pytest.mark.parametrize("backend", ["process", "thread"])
+def test_sharded_profiles_match_serial(backend):
+    df = _frame()
+    expected = {
+        "numerical": profile_numerical_columns(df, "target"),
+        "categorical": profile_categorical_columns(df),
+        "target": profile_target(df, "target"),
+    }
+
+    sharded = parallel_eda._profile_sharded(df, "target", 2, backend, 0.001)
+
+    # json keeps NaN == NaN and key order
+    assert json.dumps(sharded) == json.dumps(expected)
+
+
+def test_profile_columns_small_frame_runs_serially():
+    df = _frame(500)
+    profiles = parallel_eda.profile_columns(df, target_col="target", n_jobs=4)
+
+    assert profiles["numerical"] == profile_numerical_columns(df, "target")
+    assert profiles["target"] == profile_target(df, "target")
@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from dany_core.quality import DataQualityScanner, HashSet, scan_quality
+from dany_core.streaming import iter_chunks
+
+
+def _frame(n=20_000):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "s": rng.choice(["a", "b", "c", None], n).astype(object),
+        "f": np.round(rng.normal(size=n), 1),
+        "i": rng.integers(0, 3, n),
+    })
+    df.loc[::7, "f"] = np.nan
+    return df
+
+
+def test_scan_matches_pandas_duplicates_and_missing():
+    df = _frame()
+    report = scan_quality(df)
+
+    assert report["duplicate_rows"] == int(df.duplicated().sum())
+    assert report["missing_values"] == {col: int(df[col].isna().sum()) for col in df.columns}
+
+
+def test_chunks_with_different_dtypes_agree():
+    df = _frame()
+    scanner = DataQualityScanner()
+    for k, chunk in enumerate(iter_chunks(df, chunksize=6_000)):
+        # e.g. compacted or re-inferred dtypes per chunk
+        if k % 2:
+            chunk = chunk.astype({"s": "category", "i": "int8"})
+        else:
+            chunk = chunk.astype({"s": "string", "i": "float64"})
+        scanner.update(chunk)
+
+    assert scanner.to_report()["duplicate_rows"] == int(df.duplicated().sum())
+
+
+def test_hash_set_marks_first_occurrences():
+    hashes = HashSet()
+    first = hashes.add(np.array([5, 3, 5, 9], dtype=np.uint64))
+    assert first.tolist() == [True, True, False, True]
+
+    again = hashes.add(np.array([9, 1, 1], dtype=np.uint64))
+    assert again.tolist() == [False, True, False]
+    assert len(hashes) == 4
+
+
+def test_near_duplicates_exclude_exact_copies():
+    rng = np.random.default_rng(1)
+    base = pd.DataFrame({f"c{i}": rng.integers(0, 10**6, 3_000) for i in range(10)})
+    edited = base.iloc[:300].copy()
+    edited["c0"] = -1
+    df = pd.concat([base, edited, base.iloc[:50]], ignore_index=True)
+
+    report = scan_quality(df, near_duplicates=True)
+
+    assert report["duplicate_rows"] == 50
+    assert 200 <= report["near_duplicate_rows"] <= 300
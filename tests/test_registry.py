@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+
+from dany_core.modeling import train_and_evaluate
+from dany_core.registry import ModelRegistry
+
+
+def test_registered_model_predicts_without_retraining(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "age": rng.normal(40, 10, 400),
+        "city": rng.choice(["NY", "LA"], 400),
+        "target": rng.integers(0, 2, 400),
+    })
+    results = train_and_evaluate(df, "target")
+
+    registry = ModelRegistry(str(tmp_path))
+    registry.register("demo", results, training_df=df, target_col="target")
+    registry.register("demo", results, training_df=df, target_col="target")
+
+    assert registry.versions("demo") == [1, 2]
+
+    _, metadata = registry.load("demo")
+    assert metadata["schema"]["columns"] == ["age", "city"]
+    assert metadata["model_name"] == results["best_model_summary"]["model_name"]
+
+    scored = registry.load_and_predict("demo", df.drop(columns=["target"]))
+    expected = results["best_pipeline"].predict(df)
+    assert (scored["predictions"] == expected).all()
+    assert scored["confidence"].shape == (len(df),)
+
+    in_memory = registry.load_and_predict("demo", df.drop(columns=["target"]), version=1, mmap_mode=None)
+    assert (in_memory["predictions"] == expected).all()
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from dany_core.eda import profile_numerical_columns, profile_target
+from dany_core.sampling import adaptive_profiles, stratified_order
+
+
+def _frame(n=60_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "normal": rng.normal(5.0, 2.0, n),
+        "lognormal": rng.lognormal(0.0, 1.0, n),
+        "level": rng.choice(["a", "b", "c"], n, p=[0.8, 0.15, 0.05]),
+        "target": (rng.random(n) < 0.02).astype(int),
+    })
+
+
+def test_stratified_order_prefixes_are_proportional():
+    target = _frame()["target"].to_numpy()
+    order = stratified_order(len(target), target, random_state=0)
+
+    assert np.array_equal(np.sort(order), np.arange(len(target)))
+    for size in (500, 5_000, 30_000):
+        assert abs(target[order[:size]].sum() - target.mean() * size) <= 1
+
+
+def test_adaptive_profiles_stop_early_with_covering_intervals():
+    df = _frame()
+    result = adaptive_profiles(df, "target", random_state=0)
+    full = profile_numerical_columns(df, "target")
+
+    sampling = result["sampling"]
+    assert sampling["converged"]
+    assert sampling["rows"] < len(df)
+
+    for col in ("normal", "lognormal"):
+        lo, hi = result["numerical"][col]["ci"]["mean"]
+        assert lo <= full[col]["mean"] <= hi
+        assert result["numerical"][col]["count"] == len(df)
+
+    assert "target" not in result["numerical"]
+    assert result["target"] == profile_target(df, "target")
+    assert "ci" in result["categorical"]["level"]
+
+
+def test_full_sample_has_zero_width_intervals():
+    df = _frame(3_000)
+    result = adaptive_profiles(df, "target", initial_rows=len(df), rel_tol=0.0, random_state=0)
+
+    lo, hi = result["numerical"]["normal"]["ci"]["std"]
+    assert result["sampling"]["rows"] == len(df)
+    assert lo == hi
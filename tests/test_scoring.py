@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LinearRegression, LogisticRegression
+
+from dany_core.scoring import predict_batch, predict_batches, write_predictions
+
+
+def _frame(n=250):
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(n, 2))
+    return pd.DataFrame({
+        "id": np.arange(n),
+        "x0": x[:, 0],
+        "x1": x[:, 1],
+    }), (x[:, 0] + x[:, 1] > 0).astype(int)
+
+
+def test_chunked_scoring_matches_one_batch():
+    X, y = _frame()
+    model = LogisticRegression().fit(X, y)
+
+    whole = predict_batch(model, X, "classification")
+    chunks = list(predict_batches(model, X, "classification", batch_size=60, include_probabilities=True))
+
+    assert len(chunks) == 5
+    for key in ("predictions", "confidence", "probabilities"):
+        np.testing.assert_allclose(np.concatenate([c[key] for c in chunks]), whole[key])
+
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet"])
+def test_write_predictions_streams_every_batch(tmp_path, suffix):
+    X, y = _frame()
+    model = LogisticRegression().fit(X, y)
+    path = str(tmp_path / f"scored.{suffix}")
+
+    rows = write_predictions(model, X, "classification", path, batch_size=60, keep_columns=["id"])
+
+    written = pd.read_csv(path) if suffix == "csv" else pd.read_parquet(path)
+    expected = predict_batch(model, X, "classification")
+    assert rows == len(written) == len(X)
+    assert list(written.columns) == ["id", "prediction", "confidence"]
+    np.testing.assert_array_equal(written["id"], X["id"])
+    np.testing.assert_array_equal(written["prediction"], expected["predictions"])
+    np.testing.assert_allclose(written["confidence"], expected["confidence"])
+
+
+def test_write_predictions_replaces_an_existing_csv(tmp_path):
+    X, y = _frame(40)
+    model = LinearRegression().fit(X, y)
+    path = str(tmp_path / "scored.csv")
+
+    write_predictions(model, X, "regression", path)
+    write_predictions(model, X, "regression", path)
+
+    written = pd.read_csv(path)
+    assert list(written.columns) == ["prediction"]
+    np.testing.assert_allclose(written["prediction"], model.predict(X))
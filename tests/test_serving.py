@@ -0,0 +1,101 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+
+from dany_core.modeling import train_and_evaluate
+from dany_core.registry import save_model_artifact
+from dany_core.serving import ScoringService, run_load_test
+
+
+def _artifact(tmp_path):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "age": rng.normal(40, 10, 300),
+        "city": rng.choice(["NY", "LA"], 300),
+        "target": rng.integers(0, 2, 300),
+    })
+    results = train_and_evaluate(df, "target")
+    return save_model_artifact(results, str(tmp_path / "model"), training_df=df, target_col="target")
+
+
+async def _post(port, payload):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode()
+    writer.write(
+        b"POST /predict HTTP/1.1\r\nConnection: close\r\n"
+        + f"Content-Length: {len(body)}\r\n\r\n".encode()
+        + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b" ")[1], json.loads(body)
+
+
+def test_service_scores_requests_and_reports_latency(tmp_path):
+    artifact = _artifact(tmp_path)
+    records = [{"age": 30.0, "city": "NY"}, {"age": 55.0, "city": "LA"}]
+
+    async def scenario():
+        service = ScoringService(artifact)
+        port = await service.start(port=0)
+        try:
+            status, single = await _post(port, {"records": records})
+            bad_status, _ = await _post(port, {"records": [{"age": 1.0}]})
+            load = await run_load_test("127.0.0.1", port, records, n_requests=200, concurrency=8)
+            return status, single, bad_status, load, service.stats.snapshot()
+        finally:
+            await service.stop()
+
+    status, single, bad_status, load, metrics = asyncio.run(scenario())
+
+    assert status == b"200"
+    assert len(single["predictions"]) == 2
+    assert all(0.5 <= c <= 1.0 for c in single["confidence"])
+    assert bad_status == b"400"
+
+    assert load["requests"] == 200 and load["errors"] == 0
+    assert metrics["requests"] == 201
+    assert metrics["batches"] <= metrics["requests"]
+    assert metrics["latency_p99_ms"] >= metrics["latency_p50_ms"] > 0
+
+
+def test_bad_request_fails_alone_and_unreadable_requests_get_a_status(tmp_path):
+    artifact = _artifact(tmp_path)
+    good = pd.DataFrame({"age": [30.0], "city": ["NY"]})
+    bad = pd.DataFrame({"age": ["not a number"], "city": ["LA"]})
+
+    async def raw(port, head):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(head)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return response.split(b" ")[1]
+
+    async def scenario():
+        # A long wait window puts all three requests in one batch
+        service = ScoringService(artifact, max_wait_ms=200)
+        port = await service.start(port=0)
+        try:
+            outcomes = await asyncio.gather(
+                service.predict(good), service.predict(bad), service.predict(good),
+                return_exceptions=True,
+            )
+            after = await service.predict(good)
+            too_large = await raw(port, b"POST /predict HTTP/1.1\r\nContent-Length: 999999999999\r\n\r\n")
+            malformed = await raw(port, b"POST /predict HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+            return outcomes, after, too_large, malformed
+        finally:
+            await service.stop()
+
+    outcomes, after, too_large, malformed = asyncio.run(scenario())
+
+    assert isinstance(outcomes[1], Exception)
+    assert len(outcomes[0]["predictions"]) == len(outcomes[2]["predictions"]) == 1
+    assert len(after["predictions"]) == 1
+    assert too_large == b"413"
+    assert malformed == b"400"
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+from scipy.stats import skew
+
+from dany_core.eda import (
+    NumericalProfileState,
+    profile_categorical_columns,
+    profile_numerical_columns,
+)
+from dany_core.sketches import FrequentItemsSketch, HyperLogLog, MomentSketch
+
+
+def test_moment_sketch_merge_matches_full_pass():
+    rng = np.random.default_rng(0)
+    values = rng.exponential(size=(3_000, 4))
+    values[::9, 1] = np.nan
+
+    merged = MomentSketch()
+    for block in np.array_split(values, 5):
+        merged.merge(MomentSketch().update(block, ["a", "b", "c", "d"]))
+
+    col = values[:, 1][~np.isnan(values[:, 1])]
+    assert merged.count[1] == col.size
+    assert np.isclose(merged.mean[1], col.mean())
+    assert np.isclose(merged.std()[1], col.std(ddof=1))
+    assert np.isclose(merged.skewness()[1], skew(col))
+    assert merged.min[1] == col.min() and merged.max[1] == col.max()
+
+
+def test_hyperloglog_estimate_and_merge():
+    left = HyperLogLog().update(np.arange(0, 60_000))
+    right = HyperLogLog().update(np.arange(40_000, 100_000))
+
+    assert abs(left.merge(right).estimate() - 100_000) / 100_000 < 0.03
+    assert round(HyperLogLog().update(np.array([1.0, 2.0, 2.0, 3.0])).estimate()) == 3
+
+
+def test_numerical_profiles_match_pandas():
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        "x": rng.normal(size=500),
+        "flag": rng.integers(0, 4, 500),
+        "const": 0.1,
+        "target": rng.integers(0, 2, 500),
+    })
+
+    profiles = profile_numerical_columns(df, target_col="target")
+
+    assert "target" not in profiles
+    assert profiles["flag"]["n_unique"] == 4
+    assert profiles["const"]["std"] == 0.0
+    assert np.isclose(profiles["x"]["std"], df["x"].std())
+
+    state = NumericalProfileState()
+    for part in np.array_split(np.arange(len(df)), 3):
+        state.merge(NumericalProfileState().update(df.iloc[part], exclude=("target",)))
+    assert np.isclose(state.to_profiles()["x"]["skewness"], profiles["x"]["skewness"])
+
+
+def test_frequent_items_error_bound_holds_after_merge():
+    rng = np.random.default_rng(2)
+    values = np.concatenate([np.full(5_000, "hot"), rng.integers(0, 50_000, 20_000).astype(str)])
+    rng.shuffle(values)
+
+    merged = FrequentItemsSketch(error_bound=0.01)
+    for part in np.array_split(values, 4):
+        merged.merge(FrequentItemsSketch(error_bound=0.01).update(part))
+
+    assert len(merged.counts) <= merged.capacity
+    assert merged.offset <= 0.01 * merged.total
+    assert merged.top().index[0] == "hot"
+    assert 5_000 - merged.offset <= merged.counts["hot"] <= 5_000
+
+
+def test_categorical_profiles_match_value_counts():
+    df = pd.DataFrame({
+        "city": ["NY", "LA", None, "NY", "NY"],
+        "grade": pd.Categorical(["a", "b", "a", None, "a"]),
+    })
+
+    profiles = profile_categorical_columns(df)
+
+    assert profiles["city"] == {"n_unique": 3, "top_ratio": 0.6}
+    assert profiles["grade"] == {"n_unique": 3, "top_ratio": 0.6}
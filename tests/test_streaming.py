@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+
+from dany_core.report import DataReportAccumulator, basic_data_report
+from dany_core.streaming import ReservoirSampler, iter_chunks
+
+
+def _frame(n=5_000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "a": rng.integers(0, 5, n),
+        "b": rng.choice(["x", "y", None], n),
+        "target": (rng.random(n) < 0.03).astype(int),
+    })
+
+
+def test_data_report_accumulator_matches_basic_report():
+    df = _frame()
+    acc = DataReportAccumulator()
+    for chunk in iter_chunks(df, chunksize=700):
+        acc.update(chunk)
+
+    streamed = acc.to_report()
+    expected = basic_data_report(df)
+
+    # Memory of sliced chunks is not exactly additive; compare the rest.
+    assert streamed.pop("memory_bytes") > 0
+    expected.pop("memory_bytes")
+    assert streamed == expected
+
+
+def test_stratified_reservoir_keeps_rare_class():
+    df = _frame()
+    sampler = ReservoirSampler(200, stratify_col="target", min_per_class=30, random_state=1)
+    for chunk in iter_chunks(df, chunksize=1_000):
+        sampler.update(chunk)
+
+    sample = sampler.sample()
+    assert sampler.rows_seen == len(df)
+    assert sample["target"].value_counts()[1] >= 30
+    assert list(sample.columns) == list(df.columns)
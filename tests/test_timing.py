@@ -0,0 +1,53 @@
+import json
+
+import numpy as np
+
+from dany_core.utils.timing import StageTimer
+
+
+def test_nested_spans_rows_and_memory():
+    timer = StageTimer(track_memory=True)
+    try:
+        with timer.span("modeling", rows=1_000):
+            with timer.span("fit:model", rows=800):
+                buf = np.ones(1_000_000)
+            del buf
+        timer.start("modeling")
+        timer.stop("modeling", rows=500)
+
+        summary = timer.summary()
+    finally:
+        timer.close()
+
+    # Only top-level spans count towards stages, repeated starts accumulate
+    assert list(summary["stages"]) == ["modeling"]
+    assert summary["details"]["modeling"]["rows"] == 1_500
+    assert summary["memory"]["modeling"]["peak_bytes"] >= 8_000_000
+
+    spans = timer.spans()
+    child = next(s for s in spans if s["name"] == "fit:model")
+    assert child["parent"] == spans[0]["id"]
+    assert child["rows_per_sec"] > 0
+    assert child["peak_bytes"] >= 8_000_000
+
+
+def test_summary_with_unstopped_stage_and_exports(tmp_path):
+    timer = StageTimer(profile_spans=("eda",))
+    timer.start("cleaning")
+    timer.stop("cleaning")
+    with timer.span("eda"):
+        sum(range(10_000))
+    timer.start("modeling")  # e.g. an exception before stop()
+    timer.record("fit:model", 0.01, parent="modeling")
+
+    summary = timer.summary()
+    assert summary["incomplete"] == ["modeling"]
+    assert "modeling" in summary["stages"]
+    assert "cumulative" in timer.spans()[1]["profile"]
+
+    trace = timer.to_chrome_trace(tmp_path / "trace.json")
+    assert {e["name"] for e in trace["traceEvents"]} == {"cleaning", "eda", "modeling", "fit:model"}
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
+
+    payload = json.loads(timer.to_json(tmp_path / "timing.json"))
+    assert len(payload["spans"]) == 4